@@ -28,7 +28,16 @@ def test_fastapi(s: Session):
 @session(python=["3.12", "3.13", "3.14"], uv_groups=["test"], uv_extras=["numpy"])
 def test_numpy(s: Session):
     coverage_file = f".coverage.{s.python}.numpy"
-    s.run("coverage", "run", "--data-file", coverage_file, "-m", "pytest", "tests/test_numpy.py")
+    s.run(
+        "coverage",
+        "run",
+        "--data-file",
+        coverage_file,
+        "-m",
+        "pytest",
+        "tests/test_numpy.py",
+        "tests/test_columnar.py",
+    )
 
 
 @session(python=["3.12", "3.13", "3.14"], uv_groups=["test"], uv_extras=["ordered-set"])
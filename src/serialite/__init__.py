@@ -1,6 +1,9 @@
+from ._async import from_data_async, to_data_async
 from ._base import Serializable, Serializer, SerializerToRef
+from ._cache import CacheInfo, LruCache
+from ._canonical import canonical, canonical_dumps, content_hash
 from ._dataclass import field
-from ._decorators import abstract_serializable, serializable
+from ._decorators import abstract_serializable, cache_from_data, cache_to_data, serializable
 from ._dispatcher import serializer
 from ._errors import ErrorElement, Errors, ValidationError, ValidationExceptionGroup, raise_errors
 from ._field_errors import (
@@ -10,6 +13,7 @@ from ._field_errors import (
     RequiredTypeFieldError,
     UnknownClassError,
     UnknownFieldError,
+    UnprojectedFieldError,
 )
 from ._fields_serializer import (
     AccessPermissions,
@@ -20,12 +24,30 @@ from ._fields_serializer import (
     empty_default,
     no_default,
 )
+from ._graph import from_data_graph, to_data_graph
+from ._graph_errors import CyclicReferenceError, DuplicateIdError, UnknownReferenceError
 from ._implementations import *
+from ._intern import InternTable, from_data_interned
+from ._iterative import iterative_from_data, iterative_to_data
+from ._lazy import LazyDict, LazyList, LazyObject, lazy_from_data
+from ._limit_errors import (
+    ElementBudgetError,
+    MaximumDepthError,
+    MaximumKeysError,
+    MaximumLengthError,
+    MaximumStringLengthError,
+)
 from ._mixins import AbstractSerializableMixin, SerializableMixin
 from ._monkey_patches import (
     monkey_patch_pydantic_instancecheck,
     monkey_patch_pydantic_subclasscheck,
 )
+from ._native import native_types
+from ._ndjson import InvalidJsonError, read_ndjson, write_ndjson
+from ._parallel import from_data_many, parallel_from_data
+from ._patch import InvalidPatchOperationError, PatchPathError, apply_patch, diff_to_data
+from ._profile import NodeStatistics, Profile, profile
+from ._projection import Projection, project
 from ._result import Failure, Result, Success
 from ._type_errors import (
     ExpectedBooleanError,
@@ -37,5 +59,10 @@ from ._type_errors import (
     ExpectedStringError,
 )
 
+try:
+    from ._fastapi import etag_response
+except ImportError:
+    pass
+
 monkey_patch_pydantic_subclasscheck()
 monkey_patch_pydantic_instancecheck()
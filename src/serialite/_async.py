@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+__all__ = ["from_data_async", "to_data_async"]
+
+import asyncio
+import dataclasses
+from collections.abc import Callable
+from concurrent.futures import Executor
+from contextvars import copy_context
+from typing import Any
+
+from ._base import Serializer
+from ._result import Result
+
+
+def exceeds_size(value: Any, threshold: int) -> bool:
+    """Whether `value` contains more than `threshold` elements.
+
+    Elements of lists, tuples, sets, dictionaries, and fields of dataclasses
+    are counted. The walk stops as soon as the threshold is exceeded, so the
+    cost is bounded by `threshold` regardless of the size of `value`.
+    """
+    count = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            children = item.values()
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            children = item
+        elif dataclasses.is_dataclass(item) and not isinstance(item, type):
+            children = [getattr(item, field.name) for field in dataclasses.fields(item)]
+        else:
+            continue
+
+        count += len(children)
+        if count > threshold:
+            return True
+        stack.extend(children)
+
+    return False
+
+
+async def run_maybe_offloaded[T](
+    function: Callable[[Any], T],
+    argument: Any,
+    *,
+    offload: bool | None,
+    threshold: int,
+    executor: Executor | None,
+) -> T:
+    if offload is None:
+        offload = exceeds_size(argument, threshold)
+
+    if not offload:
+        return function(argument)
+
+    # Run in a copy of the current context so that context variables set by
+    # the caller are visible to the serializers
+    loop = asyncio.get_running_loop()
+    context = copy_context()
+    return await loop.run_in_executor(executor, context.run, function, argument)
+
+
+async def from_data_async[Output](
+    serializer: Serializer[Output],
+    data: Any,
+    *,
+    offload: bool | None = None,
+    threshold: int = 10_000,
+    executor: Executor | None = None,
+) -> Result[Output]:
+    """Deserialize without blocking the event loop on large payloads.
+
+    If `offload` is `None`, `data` is deserialized in the event loop when it
+    contains at most `threshold` elements and in `executor` otherwise. If
+    `offload` is `True` or `False`, the data is always or never offloaded,
+    respectively. If `executor` is not provided, the default executor of the
+    running loop is used.
+
+    Offloading to a thread does not make deserialization faster, but the
+    event loop keeps running other tasks while the deserialization is in
+    progress, which bounds the latency of concurrent requests.
+    """
+    return await run_maybe_offloaded(
+        serializer.from_data, data, offload=offload, threshold=threshold, executor=executor
+    )
+
+
+async def to_data_async[Output](
+    serializer: Serializer[Output],
+    value: Output,
+    *,
+    offload: bool | None = None,
+    threshold: int = 10_000,
+    executor: Executor | None = None,
+) -> Any:
+    """Serialize without blocking the event loop on large values.
+
+    This is the counterpart of `from_data_async`. The size of `value` is
+    measured by counting the elements of its containers and the fields of its
+    dataclasses.
+    """
+    return await run_maybe_offloaded(
+        serializer.to_data, value, offload=offload, threshold=threshold, executor=executor
+    )
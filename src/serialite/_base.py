@@ -25,6 +25,11 @@ class Serializer[Output]:
         """Serialize an object to data."""
         raise NotImplementedError()
 
+    # Flag indicating that from_data and to_data return their input unchanged
+    # whenever they succeed. Containers of such serializers only need to
+    # validate their elements rather than rebuild the container.
+    is_identity: bool = False
+
     # Flag indicating whether this serializer represents an OpenAPI component
     # (a model that should appear in the components/schemas section)
     is_openapi_component: bool = False
@@ -196,4 +201,10 @@ class Serializable(Serializer[Self]):
         round_trip: bool = False,
         warnings: bool = True,
     ):
-        return self.to_data()
+        if include is None and exclude is None:
+            return self.to_data()
+
+        from ._projection import project
+
+        with project(include, exclude):
+            return self.to_data()
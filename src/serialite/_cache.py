@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+__all__ = ["CacheInfo", "LruCache"]
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import fields
+from functools import cache
+from threading import Lock
+from typing import Any, NamedTuple
+
+from ._projection import current_projection
+from ._result import Result, Success
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an `LruCache`.
+
+    Attributes:
+        hits: Lookups answered by the cache.
+        misses: Lookups not answered by the cache.
+        evictions: Entries removed to make room for new ones.
+        maxsize: The maximum number of entries, or `None` if unbounded.
+        currsize: The current number of entries.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+# A sentinel for missing entries, as None may be cached
+missing = object()
+
+
+class LruCache[Key: Hashable, Value]:
+    """A thread-safe mapping that evicts the least recently used entry.
+
+    Unlike `functools.lru_cache`, this caches values that are computed
+    elsewhere, so that the caller decides what the key is and when a value is
+    worth caching.
+    """
+
+    def __init__(self, maxsize: int | None = 1024):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be nonnegative or None, not {maxsize}")
+
+        self.maxsize = maxsize
+        self.entries: OrderedDict[Key, Value] = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Key, default: Any = missing) -> Value | Any:
+        """Return the value of `key` and mark it as most recently used.
+
+        If `key` is not in the cache, `default` is returned, which is a
+        private sentinel if not provided. Either way, the lookup is counted
+        in the statistics.
+        """
+        with self.lock:
+            try:
+                value = self.entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Key, value: Value) -> None:
+        """Store `value` under `key`, evicting the oldest entry if full."""
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+                    self.evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        """Report statistics of the cache."""
+        with self.lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self.entries)
+            )
+
+    def cache_clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def copy_data(data: Any) -> Any:
+    """Copy the dicts and lists of serialized data.
+
+    Serialized data is built only from dicts, lists, and immutable scalars,
+    so copying the containers is enough to protect a cached value from
+    mutation of the copy. This is much cheaper than `copy.deepcopy`.
+    """
+    if isinstance(data, dict):
+        return {key: copy_data(value) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [copy_data(value) for value in data]
+    else:
+        return data
+
+
+scalar_types = frozenset({int, bool, type(None)})
+
+
+def data_cache_key(data: Any) -> Hashable:
+    """A hashable key that is equal only for identical data.
+
+    Python considers `1`, `1.0`, and `True` equal, but serializers do not, so
+    the type of every scalar is part of the key. Floats are keyed by their
+    hex representation, which unlike their value distinguishes `-0.0` from
+    `0.0`. Strings, the most common data of leaf serializers, are their own
+    key. Raises `TypeError` for data that is not made of dicts, lists, and
+    JSON scalars.
+    """
+    data_type = type(data)
+    if data_type is str:
+        return data
+    elif data_type in scalar_types:
+        return (data_type, data)
+    elif data_type is float:
+        return (float, data.hex())
+    elif data_type is list:
+        return (list, *map(data_cache_key, data))
+    elif data_type is dict:
+        return (
+            dict,
+            *((data_cache_key(key), data_cache_key(value)) for key, value in data.items()),
+        )
+    else:
+        raise TypeError(f"Cannot make a cache key of {data!r}")
+
+
+@cache
+def frozen_field_names(cls: type) -> tuple[str, ...] | None:
+    """The names of the fields of a frozen dataclass, or `None` otherwise."""
+    params = getattr(cls, "__dataclass_params__", None)
+    if params is None or not params.frozen:
+        return None
+    return tuple(field.name for field in fields(cls))
+
+
+def value_cache_key(value: Any) -> Hashable:
+    """A hashable key that is equal only for identical values.
+
+    The counterpart of `data_cache_key` for instances of frozen dataclasses,
+    whose equality conflates `1`, `1.0`, and `True` in their fields just like
+    the equality of data does. The key is made of the type of the instance
+    and the keys of its fields, recursing into frozen dataclasses, tuples,
+    and frozensets, with scalars keyed as in `data_cache_key`. Any other
+    value is keyed by its type and itself, so hashing the key raises
+    `TypeError` if the value is unhashable.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return value
+    elif value_type in scalar_types:
+        return (value_type, value)
+    elif value_type is float:
+        return (float, value.hex())
+    elif value_type is tuple:
+        return (tuple, *map(value_cache_key, value))
+    elif value_type is frozenset:
+        return (frozenset, frozenset(map(value_cache_key, value)))
+
+    names = frozen_field_names(value_type)
+    if names is None:
+        return (value_type, value)
+    else:
+        return (value_type, *(value_cache_key(getattr(value, name)) for name in names))
+
+
+def cached_from_data[Output](
+    cache: LruCache[Hashable, Result[Output]],
+    from_data: Callable[[Any], Result[Output]],
+    data: Any,
+) -> Result[Output]:
+    """Call `from_data` through a cache keyed by `data`.
+
+    Only successes are cached. Calls under a projection and data that cannot
+    be made into a key bypass the cache.
+    """
+    if current_projection.get() is not None:
+        return from_data(data)
+
+    try:
+        key = data_cache_key(data)
+    except TypeError:
+        return from_data(data)
+
+    result = cache.get(key)
+    if result is missing:
+        result = from_data(data)
+        if isinstance(result, Success):
+            cache.put(key, result)
+
+    return result
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+__all__ = ["canonical", "canonical_dumps", "content_hash"]
+
+import hashlib
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from ._base import Serializer
+
+# Whether serializers whose data order is arbitrary, like SetSerializer, sort
+# their data. False is the fast path.
+current_canonical: ContextVar[bool] = ContextVar("canonical", default=False)
+
+# Keys sorted, no whitespace, and no NaN or infinity, which are not JSON
+canonical_encoder = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+)
+
+
+@contextmanager
+def canonical() -> Iterator[None]:
+    """Make `to_data` deterministic.
+
+    Within this context, `SetSerializer` sorts its elements by the canonical
+    JSON of their data, so that equal sets give equal data regardless of
+    their iteration order. Caches of `to_data` are bypassed within this
+    context, as the data may be different.
+    """
+    token = current_canonical.set(True)
+    try:
+        yield
+    finally:
+        current_canonical.reset(token)
+
+
+def canonical_key(data: Any) -> str:
+    """Order data by its canonical JSON, which is a total order."""
+    return canonical_encoder.encode(normalize(data))
+
+
+def normalize(data: Any) -> Any:
+    """Copy data, replacing negative zero with zero."""
+    if type(data) is float:
+        # Adding zero turns -0.0 into 0.0 and leaves every other float as is
+        return data + 0.0
+    elif isinstance(data, dict):
+        return {key: normalize(value) for key, value in data.items()}
+    elif isinstance(data, list | tuple):
+        return [normalize(value) for value in data]
+    else:
+        return data
+
+
+def canonical_dumps[Output](serializer: Serializer[Output], value: Output) -> str:
+    """Serialize to canonical JSON.
+
+    Equal values give identical strings. The data is made within
+    `canonical`, and the JSON has sorted keys, no whitespace, and the
+    shortest representation of each float that round-trips, with negative
+    zero written as zero. A `ValueError` is raised for NaN and infinity.
+    """
+    with canonical():
+        data = serializer.to_data(value)
+    return canonical_encoder.encode(normalize(data))
+
+
+def content_hash[Output](
+    serializer: Serializer[Output], value: Output, *, algorithm: str = "sha256"
+) -> str:
+    """Hash the canonical JSON of a value.
+
+    This is the hex digest of `canonical_dumps` with the `hashlib` algorithm
+    named `algorithm`, so that equal values have equal hashes, suitable for
+    ETags and content-addressed storage.
+    """
+    # Encoding in one shot uses the C encoder, which is several times faster
+    # than feeding the digest from iterencode
+    return hashlib.new(algorithm, canonical_dumps(serializer, value).encode()).hexdigest()
@@ -1,14 +1,20 @@
-__all__ = ["abstract_serializable", "serializable"]
+__all__ = ["abstract_serializable", "cache_from_data", "cache_to_data", "serializable"]
 
 import dataclasses
 from dataclasses import MISSING
-from functools import wraps
+from functools import partial, wraps
 from typing import cast, get_type_hints
 
 from ._base import Serializable, Serializer
+from ._cache import LruCache, cached_from_data, copy_data, missing, value_cache_key
+from ._canonical import current_canonical
 from ._descriptors import classproperty
+from ._errors import reduce_dataclass_exception
 from ._fields_serializer import FieldsSerializer, SingleField, no_default
+from ._graph import current_graph_reader, current_graph_writer
 from ._mixins import AbstractSerializableMixin, SerializableMixin
+from ._native import current_native_types
+from ._projection import current_projection
 
 # Allow commented out code in this file because it is important documentation
 # ruff: noqa: ERA001
@@ -101,6 +107,11 @@ def infer_fields_serializer(cls):
             serializer_fields[field.name] = SingleField(field_serializer, default=field_default)
 
         cls.__fields_serializer__ = FieldsSerializer(**serializer_fields)
+
+        if issubclass(cls, BaseException) and "__reduce__" not in cls.__dict__:
+            # Serializable errors travel between processes, so make them
+            # picklable regardless of how they were constructed
+            cls.__reduce__ = reduce_dataclass_exception
     else:
         raise TypeError("The serializable decorator can only be applied to dataclasses.")
 
@@ -134,6 +145,9 @@ def serializable[T](cls: type[T]) -> type[T]:
         if "from_data" not in cls.__dict__:
             cls.from_data = SerializableMixin.__dict__["from_data"]
 
+        if "lazy_from_data" not in cls.__dict__:
+            cls.lazy_from_data = SerializableMixin.__dict__["lazy_from_data"]
+
         if "to_data" not in cls.__dict__:
             cls.to_data = SerializableMixin.__dict__["to_data"]
 
@@ -180,6 +194,101 @@ def serializable[T](cls: type[T]) -> type[T]:
     return cls
 
 
+@flexible_decorator
+def cache_to_data[T](cls: type[T], maxsize: int | None = 1024, *, copy: bool = True) -> type[T]:
+    """Decorator that memoizes `to_data` of a frozen serializable dataclass.
+
+    The serialized data of each instance is cached in an `LruCache` of
+    `maxsize` entries, available as `cls.__to_data_cache__` for its
+    statistics. Instances are looked up by the values of their fields, so
+    equal instances share an entry unless their fields differ in type, like
+    `1` and `True`, or in the sign of zero.
+    Instances with unhashable fields are serialized without the cache.
+
+    If `copy` is `True`, the dicts and lists of the cached data are copied
+    on each hit, which is still much cheaper than serializing. If it is
+    `False`, the cached data itself is returned, which must then never be
+    mutated.
+
+    This must be applied on top of `serializable`:
+
+    ```
+    @cache_to_data(maxsize=10_000)
+    @serializable
+    @dataclass(frozen=True)
+    class Product:
+        sku: str
+        price: float
+    ```
+    """
+    params = getattr(cls, "__dataclass_params__", None)
+    if params is None or not params.frozen:
+        raise TypeError("The cache_to_data decorator can only be applied to frozen dataclasses.")
+
+    uncached_to_data = cls.to_data
+    cache = LruCache(maxsize)
+
+    @wraps(uncached_to_data)
+    def to_data(self):
+        if (
+            current_projection.get() is not None
+            or current_native_types.get()
+            or current_graph_writer.get() is not None
+            or current_canonical.get()
+        ):
+            # A projection, native types, shared references, or canonical
+            # ordering change the data
+            return uncached_to_data(self)
+
+        key = value_cache_key(self)
+        try:
+            data = cache.get(key)
+        except TypeError:
+            # Unhashable field
+            return uncached_to_data(self)
+
+        if data is missing:
+            data = uncached_to_data(self)
+            cache.put(key, data)
+
+        return copy_data(data) if copy else data
+
+    cls.to_data = to_data
+    cls.__to_data_cache__ = cache
+    return cls
+
+
+@flexible_decorator
+def cache_from_data[T](cls: type[T], maxsize: int | None = 1024) -> type[T]:
+    """Decorator that memoizes `from_data` of a frozen serializable dataclass.
+
+    Successful results are cached in an `LruCache` of `maxsize` entries keyed
+    by the data, available as `cls.__from_data_cache__` for its statistics.
+    Repeated identical data returns the same instance. Subclasses that
+    inherit `from_data` are deserialized without the cache. See
+    `CachedSerializer` for caching other serializers.
+
+    This must be applied on top of `serializable`.
+    """
+    params = getattr(cls, "__dataclass_params__", None)
+    if params is None or not params.frozen:
+        raise TypeError("The cache_from_data decorator can only be applied to frozen dataclasses.")
+
+    uncached_from_data = cls.from_data.__func__
+    cache = LruCache(maxsize)
+
+    @wraps(uncached_from_data)
+    def from_data(klass, data):
+        if klass is not cls or current_graph_reader.get() is not None:
+            # Shared references must be tracked, which the cache would skip
+            return uncached_from_data(klass, data)
+        return cached_from_data(cache, partial(uncached_from_data, klass), data)
+
+    cls.from_data = classmethod(from_data)
+    cls.__from_data_cache__ = cache
+    return cls
+
+
 def _was_replaced_by_slots(cls) -> bool:
     """True if *cls* is the original class left behind by `@dataclass(slots=True)`.
 
@@ -1,15 +1,38 @@
 __all__ = ["serializer"]
 
 from abc import get_cache_token
+from array import array
 from datetime import date, datetime
 from pathlib import Path
 from types import GenericAlias, UnionType
-from typing import Any, Literal, NewType, TypeAliasType, Union, get_origin
+from typing import Any, Literal, NamedTuple, NewType, TypeAliasType, Union, get_origin
 from uuid import UUID
 
 from ._base import Serializable, Serializer
 
 
+class DispatchCacheInfo(NamedTuple):
+    """Statistics of the dispatch cache of a `subclassdispatch` function.
+
+    Attributes:
+        hits: Lookups answered by the cache.
+        misses: Lookups that ran the dispatch algorithm and filled the cache.
+        bypasses: Lookups of types that are never cached, such as `Union`,
+            `TypeAliasType`, and `NewType`.
+        invalidations: Times the cache was emptied because a new virtual
+            subclass was registered with an ABC.
+        maxsize: The maximum number of entries, or `None` if unbounded.
+        currsize: The current number of entries.
+    """
+
+    hits: int
+    misses: int
+    bypasses: int
+    invalidations: int
+    maxsize: int | None
+    currsize: int
+
+
 def subclassdispatch(func):
     """Single dispatch based on the subclass of the first argument.
 
@@ -42,8 +65,20 @@ def subclassdispatch(func):
     `Optional`, `Literal`, and `Any` types are hardcoded to dispatch to their
     respective serializers because the `issubclass` function does not work on
     them. This decorator cannot be used outside of this module.
+
+    Registration, cache misses, and the statistics are guarded by a lock so
+    that the generic function can be called and registered from multiple
+    threads, including on free-threaded builds of Python. A hit in an
+    unbounded cache reads the cache without taking the lock, so the hit count
+    is approximate when threads dispatch concurrently.
+
+    Like `functools.lru_cache`, the generic function has `cache_info` and
+    `cache_clear` methods. The cache is unbounded by default.
+    `set_cache_maxsize` bounds it, evicting the least recently used entry when
+    full, which is useful when many generic aliases are created dynamically.
     """
     from functools import _find_impl, update_wrapper
+    from threading import RLock
     from types import MappingProxyType
     from typing import _GenericAlias
     from weakref import WeakKeyDictionary
@@ -51,6 +86,9 @@ def subclassdispatch(func):
     registry = {}
     dispatch_cache = WeakKeyDictionary()
     cache_token = None
+    lock = RLock()
+    maxsize = None
+    hits = misses = bypasses = invalidations = 0
 
     def is_own_serializer(cls):
         """Whether `cls` serializes its own instances rather than a base's.
@@ -67,19 +105,40 @@ def subclassdispatch(func):
         Runs the dispatch algorithm to return the best available implementation
         for the given `cls` registered on `generic_func`
         """
-        nonlocal cache_token
+        nonlocal hits
+        if maxsize is None and (cache_token is None or cache_token == get_cache_token()):
+            # A hit only reads the cache, so it does not need the lock unless
+            # it must reorder the entries of a bounded cache
+            try:
+                impl = dispatch_cache[cls]
+            except (KeyError, TypeError, RuntimeError):
+                # A miss, a type that cannot be a key, or the cache being
+                # changed by another thread, all of which are handled below
+                pass
+            else:
+                hits += 1
+                return impl
+
+        with lock:
+            return locked_dispatch(cls)
+
+    def locked_dispatch(cls: type):
+        nonlocal cache_token, hits, misses, bypasses, invalidations
         if cache_token is not None:
             current_token = get_cache_token()
             if cache_token != current_token:
                 dispatch_cache.clear()
                 cache_token = current_token
+                invalidations += 1
 
         if isinstance(cls, TypeAliasType):
             # Hash is not defined on TypeAliasType, so it cannot be used in WeakKeyDictionary
+            bypasses += 1
             return type_alias_type_serializer
 
         if isinstance(cls, NewType):
             # NewType wraps another type, delegate to the supertype's serializer
+            bypasses += 1
             return newtype_serializer
 
         origin = get_origin(cls)
@@ -87,6 +146,7 @@ def subclassdispatch(func):
             # issubclass does not work on Union and Optional
             # WeakKeyDictionary does not work on UnionType
             # must bypass the dispatcher
+            bypasses += 1
             if len(cls.__args__) == 2 and cls.__args__[1] is type(None):
                 # Optional is just a Union with NoneType in the second argument
                 return optional_serializer
@@ -97,6 +157,7 @@ def subclassdispatch(func):
         try:
             impl = dispatch_cache[cls]
         except KeyError:
+            misses += 1
             try:
                 impl = registry[cls]
             except KeyError:
@@ -120,6 +181,15 @@ def subclassdispatch(func):
                 else:
                     impl = _find_impl(cls, registry)
             dispatch_cache[cls] = impl
+            if maxsize is not None and len(dispatch_cache) > maxsize:
+                # Evict the least recently used entry, which is the first key
+                del dispatch_cache[next(iter(dispatch_cache.keys()))]
+        else:
+            hits += 1
+            if maxsize is not None:
+                # Move the entry to the end to mark it as most recently used
+                del dispatch_cache[cls]
+                dispatch_cache[cls] = impl
         return impl
 
     def register(cls, func=None):
@@ -130,12 +200,38 @@ def subclassdispatch(func):
         nonlocal cache_token
         if func is None:
             return lambda f: register(cls, f)
-        registry[cls] = func
-        if cache_token is None and hasattr(cls, "__abstractmethods__"):
-            cache_token = get_cache_token()
-        dispatch_cache.clear()
+        with lock:
+            registry[cls] = func
+            if cache_token is None and hasattr(cls, "__abstractmethods__"):
+                cache_token = get_cache_token()
+            dispatch_cache.clear()
         return func
 
+    def cache_info() -> DispatchCacheInfo:
+        """Report statistics of the dispatch cache."""
+        with lock:
+            return DispatchCacheInfo(
+                hits, misses, bypasses, invalidations, maxsize, len(dispatch_cache)
+            )
+
+    def cache_clear() -> None:
+        """Clear the dispatch cache and its statistics."""
+        nonlocal hits, misses, bypasses, invalidations
+        with lock:
+            dispatch_cache.clear()
+            hits = misses = bypasses = invalidations = 0
+
+    def set_cache_maxsize(new_maxsize: int | None) -> None:
+        """Bound the dispatch cache to `new_maxsize` entries, or unbound it if `None`."""
+        nonlocal maxsize
+        if new_maxsize is not None and new_maxsize < 0:
+            raise ValueError(f"maxsize must be nonnegative or None, not {new_maxsize}")
+        with lock:
+            maxsize = new_maxsize
+            if maxsize is not None:
+                while len(dispatch_cache) > maxsize:
+                    del dispatch_cache[next(iter(dispatch_cache.keys()))]
+
     def wrapper(*args, **kw):
         # This differs from functools.singledispatch by using args[0] rather than args[0].__class__
         return dispatch(args[0])(*args, **kw)
@@ -144,7 +240,10 @@ def subclassdispatch(func):
     wrapper.register = register
     wrapper.dispatch = dispatch
     wrapper.registry = MappingProxyType(registry)
-    wrapper._clear_cache = dispatch_cache.clear
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper.set_cache_maxsize = set_cache_maxsize
+    wrapper._clear_cache = cache_clear
     update_wrapper(wrapper, func)
     return wrapper
 
@@ -216,11 +315,51 @@ def uuid_serializer(cls):
     return UuidSerializer()
 
 
+@serializer.register(bytes)
+def bytes_serializer(cls):
+    from ._implementations._bytes import BytesSerializer
+
+    return BytesSerializer()
+
+
+@serializer.register(bytearray)
+def bytearray_serializer(cls):
+    from ._implementations._bytes import BytesSerializer
+
+    return BytesSerializer(mutable=True)
+
+
+@serializer.register(memoryview)
+def memoryview_serializer(cls):
+    from ._implementations._bytes import BytesSerializer
+
+    return BytesSerializer(view=True)
+
+
 @serializer.register(list)
 def list_serializer(cls):
-    from ._implementations._list import ListSerializer
-
-    return ListSerializer(serializer(cls.__args__[0]))
+    from ._implementations._list import (
+        BooleanListSerializer,
+        FloatListSerializer,
+        IntegerListSerializer,
+        ListSerializer,
+        StringListSerializer,
+    )
+
+    # Lists of primitives get a serializer that checks the list in one pass,
+    # unless the serializer of the primitive was overridden by a registration
+    element_type = cls.__args__[0]
+    element_impl = serializer.dispatch(element_type)
+    if element_type is int and element_impl is integer_serializer:
+        return IntegerListSerializer()
+    elif element_type is float and element_impl is float_serializer:
+        return FloatListSerializer()
+    elif element_type is str and element_impl is string_serializer:
+        return StringListSerializer()
+    elif element_type is bool and element_impl is boolean_serializer:
+        return BooleanListSerializer()
+    else:
+        return ListSerializer(serializer(element_type))
 
 
 @serializer.register(set)
@@ -259,6 +398,20 @@ def dict_serializer(cls):
         return cls
 
 
+@serializer.register(array)
+def packed_array_serializer(cls):
+    from ._implementations._packed_array import PackedArraySerializer
+
+    # A bare array.array holds floats, like a bare np.ndarray
+    element_type = cls.__args__[0] if hasattr(cls, "__args__") else float
+    if element_type is float:
+        return PackedArraySerializer("d")
+    elif element_type is int:
+        return PackedArraySerializer("q")
+    else:
+        raise TypeError(f"Expected array.array of int or float, not {cls}")
+
+
 @serializer.register(Path)
 def path_serializer(cls):
     from ._implementations._path import PathSerializer
@@ -317,7 +470,20 @@ else:
     def array_serializer(cls):
         from ._implementations._array import ArraySerializer
 
-        return ArraySerializer(dtype=float)
+        # Respect the scalar type of a parametrized annotation like
+        # `np.ndarray[tuple[int], np.dtype[np.int32]]`; default to floats
+        dtype = float
+        args = getattr(cls, "__args__", ())
+        if len(args) == 2:
+            dtype_args = getattr(args[1], "__args__", ())
+            if (
+                len(dtype_args) == 1
+                and isinstance(dtype_args[0], type)
+                and issubclass(dtype_args[0], np.generic)
+            ):
+                dtype = dtype_args[0]
+
+        return ArraySerializer(dtype=dtype)
 
 
 try:
@@ -2,11 +2,25 @@ from __future__ import annotations
 
 __all__ = ["ErrorElement", "Errors", "ValidationError", "ValidationExceptionGroup", "raise_errors"]
 
+import dataclasses
 from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, NoReturn, Self, TypedDict
 
 
+def reduce_dataclass_exception(self: BaseException) -> tuple[Any, ...]:
+    """Pickle a dataclass exception by its fields.
+
+    `BaseException.__reduce__` rebuilds an exception by calling its class with
+    `self.args`, which only holds the positional arguments of the original
+    call. A dataclass exception constructed with keyword arguments cannot be
+    rebuilt that way, so it is rebuilt from its init fields instead.
+    """
+    fields = {f.name: getattr(self, f.name) for f in dataclasses.fields(self) if f.init}
+    return partial(type(self), **fields), ()
+
+
 @dataclass(frozen=True, slots=True)
 class ValidationError(Exception):
     """A simple exception wrapper.
@@ -23,6 +37,9 @@ class ValidationError(Exception):
     def __str__(self) -> str:
         return self.message
 
+    def __reduce__(self):
+        return reduce_dataclass_exception(self)
+
 
 # Not frozen: as an exception unwinds, contextlib (and similar) assign
 # __traceback__ at the Python level, which a frozen __setattr__ would reject.
@@ -48,6 +65,11 @@ class ValidationExceptionGroup(ExceptionGroup):
     def __init__(self, errors: Sequence[ErrorElement]) -> None:
         object.__setattr__(self, "errors", tuple(errors))
 
+    def __reduce__(self):
+        # ExceptionGroup pickles as (message, exceptions), which does not
+        # match the constructor above
+        return type(self), (self.errors,)
+
 
 class ErrorData(TypedDict):
     """The serialized form of an `ErrorElement`.
@@ -0,0 +1,107 @@
+__all__ = ["etag_response"]
+
+from collections.abc import Mapping
+from hashlib import sha256
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from ._base import Serializer
+from ._cache import LruCache, missing, value_cache_key
+from ._canonical import canonical_dumps
+from ._projection import current_projection
+
+# Conditional requests are only answered with 304 for safe methods
+conditional_methods = frozenset({"GET", "HEAD"})
+
+
+def etag_response[Output](
+    request: Request,
+    serializer: Serializer[Output] | Any,
+    value: Output,
+    *,
+    cache: LruCache[Any, tuple[bytes, str]] | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Respond with a value and a strong ETag, or with 304 Not Modified.
+
+    The body is the `canonical_dumps` of `value`, so equal values give the
+    same bytes and the same ETag, which is the hash of the body. If the
+    request is a GET or HEAD whose `If-None-Match` header matches the ETag,
+    an empty `304 Not Modified` response is returned instead, so that polling
+    clients do not download an unchanged body again. `headers` are added to
+    either response.
+
+    If `cache` is given, the body and ETag are cached in it keyed by
+    `value_cache_key(value)`, so that repeated responses with the same value are not
+    serialized again. Like `cache_to_data`, this must only be used with
+    immutable values. Unhashable values and responses under a projection are
+    not cached.
+
+    Return this from a FastAPI endpoint taking a `Request`:
+
+    ```
+    report_cache = LruCache(maxsize=100)
+
+    @app.get("/report", response_model=Report)
+    def get_report(request: Request):
+        return etag_response(request, Report, load_report(), cache=report_cache)
+    ```
+    """
+    if not isinstance(serializer, Serializer):
+        from . import serializer as lookup_serializer
+
+        serializer = lookup_serializer(serializer)
+
+    body, etag = encode(serializer, value, cache)
+    response_headers = {**(headers or {}), "ETag": etag}
+
+    if request.method in conditional_methods and matches(
+        request.headers.get("if-none-match"), etag
+    ):
+        return Response(status_code=304, headers=response_headers)
+
+    return Response(body, media_type="application/json", headers=response_headers)
+
+
+def encode(
+    serializer: Serializer[Any], value: Any, cache: LruCache[Any, tuple[bytes, str]] | None
+) -> tuple[bytes, str]:
+    if cache is None or current_projection.get() is not None:
+        return encode_uncached(serializer, value)
+
+    # Keyed by type as well, so that values equal only by conversion, like
+    # `True` and `1`, do not share a body
+    key = value_cache_key(value)
+    try:
+        entry = cache.get(key)
+    except TypeError:
+        # Unhashable value
+        return encode_uncached(serializer, value)
+
+    if entry is missing:
+        entry = encode_uncached(serializer, value)
+        cache.put(key, entry)
+    return entry
+
+
+def encode_uncached(serializer: Serializer[Any], value: Any) -> tuple[bytes, str]:
+    body = canonical_dumps(serializer, value).encode()
+    return body, f'"{sha256(body).hexdigest()}"'
+
+
+def matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an `If-None-Match` header matches `etag`.
+
+    This uses the weak comparison required for `If-None-Match`, so a
+    candidate prefixed with `W/` matches as well.
+    """
+    if if_none_match is None:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
@@ -5,6 +5,7 @@ __all__ = [
     "RequiredTypeFieldError",
     "UnknownClassError",
     "UnknownFieldError",
+    "UnprojectedFieldError",
 ]
 
 from dataclasses import dataclass
@@ -40,6 +41,17 @@ class RequiredFieldError(Exception):
         return f"Expected field {self.field_name!r}, but did not receive it"
 
 
+@serializable
+@dataclass(frozen=True, slots=True)
+class UnprojectedFieldError(Exception):
+    field_name: str
+
+    def __str__(self) -> str:
+        return (
+            f"Expected field {self.field_name!r} without a default to be projected, but it was not"
+        )
+
+
 @serializable
 @dataclass(frozen=True, slots=True)
 class RequiredOneOfFieldsError(Exception):
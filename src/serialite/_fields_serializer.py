@@ -16,6 +16,7 @@ from typing import Any
 
 from ._base import Serializer, SerializerToRef
 from ._errors import Errors
+from ._projection import current_projection
 from ._result import Failure, Result, Success
 
 # A sentinel object to indicate that a default is not available,
@@ -253,6 +254,7 @@ class FieldsSerializer(Mapping):
 
         values = {}
         errors = Errors()
+        projection = current_projection.get()
 
         # Check that all data fields are valid, that all values are valid,
         # and map data fields to object fields
@@ -273,6 +275,10 @@ class FieldsSerializer(Mapping):
 
             # This data field maps to an object field
             object_field_name = self.data_name_to_object_name[key]
+            if projection is not None and not projection.selects(object_field_name):
+                # This field is not projected; it is not deserialized
+                continue
+
             if object_field_name in values:
                 # If this object field is already filled, it must have been
                 # filled under a different data field name in the same
@@ -293,7 +299,16 @@ class FieldsSerializer(Mapping):
                 )
                 continue
 
-            match self.data_field_deserializers[key].from_data(value):
+            if projection is None:
+                result = self.data_field_deserializers[key].from_data(value)
+            else:
+                token = current_projection.set(projection.child(object_field_name))
+                try:
+                    result = self.data_field_deserializers[key].from_data(value)
+                finally:
+                    current_projection.reset(token)
+
+            match result:
                 case Failure(error):
                     errors.extend(error, location=[key])
 
@@ -306,7 +321,14 @@ class FieldsSerializer(Mapping):
         # Check that object fields have been created, defaulted, or ignored
         for object_field_name, serializer_field in self.object_field_serializers.items():
             if object_field_name not in values and serializer_field.writable:
-                if serializer_field.default is no_default:
+                if projection is not None and not projection.selects(object_field_name):
+                    # An unprojected field only takes its default, if any
+                    if (
+                        serializer_field.default is not no_default
+                        and serializer_field.default is not empty_default
+                    ):
+                        values[object_field_name] = serializer_field.default
+                elif serializer_field.default is no_default:
                     # This field is required
                     if isinstance(serializer_field, SingleField):
                         from ._field_errors import RequiredFieldError
@@ -344,13 +366,20 @@ class FieldsSerializer(Mapping):
         For each item in `self.object_field_serializers`, the item in `values`
         with the corresponding key is extracted, its serializer is run, and the
         serialized value is put into the return dictionary.
+
+        Within `serialite.project`, only the projected fields are serialized.
         """
         data = {}
+        projection = current_projection.get()
         for object_field_name, serializer_field in self.object_field_serializers.items():
             if not serializer_field.readable:
                 # This field is not serialized
                 continue
 
+            if projection is not None and not projection.selects(object_field_name):
+                # This field is not projected
+                continue
+
             if source == "dictionary":
                 value = values[object_field_name]
             elif source == "object":
@@ -378,7 +407,14 @@ class FieldsSerializer(Mapping):
             else:
                 raise TypeError(f"Expected FieldsSerializerField, not {type(serializer_field)}")
 
-            data[data_field_name] = serializer.to_data(value)
+            if projection is None:
+                data[data_field_name] = serializer.to_data(value)
+            else:
+                token = current_projection.set(projection.child(object_field_name))
+                try:
+                    data[data_field_name] = serializer.to_data(value)
+                finally:
+                    current_projection.reset(token)
 
         return data
 
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+__all__ = ["from_data_graph", "to_data_graph"]
+
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any
+
+from ._base import Serializer
+from ._errors import Errors
+from ._projection import current_projection
+from ._result import Failure, Result, Success
+
+# The state of the graph being serialized or deserialized. None means that
+# every object is written or read in full, which is the fast path.
+current_graph_writer: ContextVar[GraphWriter | None] = ContextVar("graph_writer", default=None)
+current_graph_reader: ContextVar[GraphReader | None] = ContextVar("graph_reader", default=None)
+
+
+class GraphWriter:
+    """The objects written so far by `to_data_graph`."""
+
+    def __init__(self):
+        # Keyed by the identity of the object and of the projection it was
+        # written with, as a different projection gives different data
+        self.ids: dict[tuple[int, int], int] = {}
+        self.in_progress: set[tuple[int, int]] = set()
+        self.written: dict[int, dict[str, Any]] = {}
+        self.referenced: set[int] = set()
+
+    def write(self, value: Any, to_data: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        key = (id(value), id(current_projection.get()))
+        existing = self.ids.get(key)
+        if existing is not None:
+            if key in self.in_progress:
+                raise ValueError(
+                    f"Cycle detected at an instance of {type(value).__name__}; only acyclic graphs"
+                    " can be serialized"
+                )
+            self.referenced.add(existing)
+            return {"$ref": existing}
+
+        identifier = len(self.ids)
+        self.ids[key] = identifier
+        self.in_progress.add(key)
+        try:
+            data = {"$id": identifier} | to_data()
+        finally:
+            self.in_progress.discard(key)
+
+        self.written[identifier] = data
+        return data
+
+    def tag(self, type_name: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Add the subclass name to the data of an abstract class."""
+        if "$ref" in data:
+            return data
+
+        tagged = {"_type": type_name} | data
+        identifier = data.get("$id")
+        if identifier is not None and self.written.get(identifier) is data:
+            self.written[identifier] = tagged
+        return tagged
+
+    def finish(self) -> None:
+        """Remove the ids of objects that were written only once."""
+        for identifier, data in self.written.items():
+            if identifier not in self.referenced:
+                del data["$id"]
+
+
+class GraphReader:
+    """The objects read so far by `from_data_graph`."""
+
+    def __init__(self, definitions: dict[Any, dict[str, Any]]):
+        self.definitions = definitions
+        # The result of the first read of each id, which later references
+        # share as long as it is an instance of the class they expect
+        self.results: dict[Any, Result[Any]] = {}
+        # The results of reading an id again as a class that the first
+        # result is not an instance of
+        self.rereads: dict[tuple[Any, Any], Result[Any]] = {}
+        self.in_progress: set[Any] = set()
+
+    def is_node(self, data: Any) -> bool:
+        return isinstance(data, dict) and ("$ref" in data or "$id" in data)
+
+    def read(self, cls: Any, data: dict[str, Any], *, abstract: bool) -> Result[Any]:
+        """Deserialize a node with an `"$id"` or `"$ref"` with `cls`.
+
+        An object may be written where an abstract class is expected and
+        referenced where its concrete class is, so the `"_type"` field is
+        only kept if `cls` is `abstract`.
+        """
+        from ._field_errors import UnknownFieldError
+        from ._graph_errors import CyclicReferenceError, UnknownReferenceError
+
+        if "$ref" in data:
+            # A reference is only ever written alone, so other keys would be
+            # silently dropped
+            errors = Errors()
+            for key in data:
+                if key != "$ref":
+                    errors.add(UnknownFieldError(key), location=[key])
+            if not errors.is_empty():
+                return Failure(errors)
+
+            identifier = data["$ref"]
+            try:
+                definition = self.definitions.get(identifier)
+            except TypeError:
+                # Unhashable reference
+                definition = None
+            if definition is None:
+                return Failure(Errors.one(UnknownReferenceError(identifier), location=["$ref"]))
+        else:
+            identifier = data["$id"]
+            definition = data
+
+        if identifier in self.in_progress:
+            return Failure(Errors.one(CyclicReferenceError(identifier)))
+
+        result = self.results.get(identifier)
+        if result is None:
+            result = self.deserialize(cls, identifier, definition, abstract=abstract)
+            self.results[identifier] = result
+        else:
+            match result:
+                case Success(value) if not isinstance(value, cls):
+                    # Referenced where a different class is expected, so the
+                    # definition is validated as that class instead
+                    key = (identifier, cls)
+                    result = self.rereads.get(key)
+                    if result is None:
+                        result = self.deserialize(cls, identifier, definition, abstract=abstract)
+                        self.rereads[key] = result
+
+        return result
+
+    def deserialize(
+        self, cls: Any, identifier: Any, definition: dict[str, Any], *, abstract: bool
+    ) -> Result[Any]:
+        self.in_progress.add(identifier)
+        try:
+            excluded = ("$id",) if abstract else ("$id", "_type")
+            return cls.from_data(
+                {key: value for key, value in definition.items() if key not in excluded}
+            )
+        finally:
+            self.in_progress.discard(identifier)
+
+
+def find_definitions(data: Any) -> Result[dict[Any, dict[str, Any]]]:
+    """Find the dicts in `data` that have an `"$id"`.
+
+    An id defined more than once fails with a `DuplicateIdError` at each
+    definition after the first.
+    """
+    from ._graph_errors import DuplicateIdError
+
+    definitions = {}
+    errors = Errors()
+    # Visited in the order of the data, so that the first definition is kept
+    stack: list[tuple[Any, list[Any]]] = [(data, [])]
+    while stack:
+        item, location = stack.pop()
+        if isinstance(item, dict):
+            identifier = item.get("$id")
+            if identifier is not None:
+                try:
+                    if identifier in definitions:
+                        errors.add(DuplicateIdError(identifier), location=[*location, "$id"])
+                    else:
+                        definitions[identifier] = item
+                except TypeError:
+                    # Unhashable id, which is only ever reported if referenced
+                    pass
+            stack.extend((value, [*location, key]) for key, value in reversed(item.items()))
+        elif isinstance(item, list):
+            stack.extend((value, [*location, i]) for i, value in reversed(list(enumerate(item))))
+
+    if errors.is_empty():
+        return Success(definitions)
+    else:
+        return Failure(errors)
+
+
+def to_data_graph[Output](serializer: Serializer[Output], value: Output) -> Any:
+    """Serialize so that objects appearing more than once are written once.
+
+    The first occurrence of an instance of a class using `SerializableMixin`
+    that appears more than once in `value` gets an `"$id"` field with a
+    number, and each later occurrence of the same instance is written as
+    `{"$ref": number}`. Instances are compared by identity, not equality.
+    This makes the data of values that reuse large objects many times much
+    smaller. Instances appearing once are written as usual.
+
+    A `ValueError` is raised if an instance contains itself, as the fields
+    of an instance must be deserialized before it is constructed.
+    """
+    writer = GraphWriter()
+    token = current_graph_writer.set(writer)
+    try:
+        data = serializer.to_data(value)
+    finally:
+        current_graph_writer.reset(token)
+
+    writer.finish()
+    return data
+
+
+def from_data_graph[Output](serializer: Serializer[Output], data: Any) -> Result[Output]:
+    """Deserialize data written by `to_data_graph`, restoring shared objects.
+
+    Each object with an `"$id"` is deserialized once, and every
+    `{"$ref": number}` to it deserializes to that same instance, wherever it
+    appears in the data. A reference where the class of that instance is not
+    expected is deserialized again as the expected class, so that it is
+    validated. A reference to a missing id fails with an
+    `UnknownReferenceError`, a reference with other keys with an
+    `UnknownFieldError` at each of them, a cycle of references with a
+    `CyclicReferenceError`, and an id defined more than once with a
+    `DuplicateIdError`.
+    """
+    match find_definitions(data):
+        case Failure(errors):
+            return Failure(errors)
+        case Success(definitions):
+            pass
+
+    token = current_graph_reader.set(GraphReader(definitions))
+    try:
+        return serializer.from_data(data)
+    finally:
+        current_graph_reader.reset(token)
@@ -0,0 +1,33 @@
+__all__ = ["CyclicReferenceError", "DuplicateIdError", "UnknownReferenceError"]
+
+from dataclasses import dataclass
+from typing import Any
+
+from ._decorators import serializable
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class UnknownReferenceError(Exception):
+    reference: Any
+
+    def __str__(self) -> str:
+        return f"Expected reference to an object with an '$id', but got {self.reference!r}"
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class CyclicReferenceError(Exception):
+    reference: Any
+
+    def __str__(self) -> str:
+        return f"Expected references without cycles, but got a cycle through {self.reference!r}"
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class DuplicateIdError(Exception):
+    identifier: Any
+
+    def __str__(self) -> str:
+        return f"Expected each '$id' to be defined once, but got {self.identifier!r} again"
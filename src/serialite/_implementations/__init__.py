@@ -1,4 +1,7 @@
+from ._binary import BinarySerializer, MalformedBinaryError, SchemaFingerprintError
 from ._boolean import BooleanSerializer
+from ._bytes import BytesSerializer, InvalidBase64Error
+from ._cached import CachedSerializer
 from ._date import DateSerializer, InvalidDateError
 from ._date_time import DateTimeSerializer, InvalidDateTimeError
 from ._dictionary import (
@@ -14,9 +17,18 @@ from ._integer import (
     PositiveIntegerSerializer,
 )
 from ._json import JsonSerializer
-from ._list import ListSerializer
+from ._limited import LimitedSerializer, Limits
+from ._list import (
+    BooleanListSerializer,
+    FloatListSerializer,
+    IntegerListSerializer,
+    ListSerializer,
+    StringListSerializer,
+)
 from ._literal import LiteralSerializer, UnknownValueError
+from ._msgpack import MsgpackSerializer, msgpack_dumps, msgpack_loads
 from ._none import NoneSerializer
+from ._packed_array import FloatOutOfRangeError, PackedArraySerializer
 from ._path import PathSerializer
 from ._reserved import ReservedSerializer, ReservedValueError
 from ._set import (
@@ -32,7 +44,13 @@ from ._union import OptionalSerializer, TryUnionSerializer
 from ._uuid import InvalidUuidError, UuidSerializer
 
 try:
-    from ._array import ArraySerializer
+    from ._array import (
+        ArrayByteSizeError,
+        ArraySerializer,
+        DecompressionError,
+        InvalidDtypeError,
+    )
+    from ._columnar import ColumnarSerializer, ColumnDtypeError, ColumnLengthError
 except ImportError:
     pass
 
@@ -0,0 +1,776 @@
+from __future__ import annotations
+
+__all__ = ["BinarySerializer", "MalformedBinaryError", "SchemaFingerprintError"]
+
+import struct
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Any
+from uuid import UUID
+
+from .._base import Serializer, SerializerToRef
+from .._decorators import serializable
+from .._errors import Errors
+from .._fields_serializer import FieldsSerializer
+from .._mixins import AbstractSerializableMixin, SerializableMixin, has_from_data_of
+from .._openapi import is_openapi_component
+from .._result import Failure, Result
+from ._boolean import BooleanSerializer
+from ._bytes import BytesSerializer
+from ._cached import CachedSerializer
+from ._date import DateSerializer
+from ._date_time import DateTimeSerializer
+from ._dictionary import OrderedDictSerializer, RawDictSerializer
+from ._float import FloatSerializer
+from ._integer import IntegerSerializer, NonnegativeIntegerSerializer, PositiveIntegerSerializer
+from ._list import ListSerializer
+from ._literal import LiteralSerializer
+from ._none import NoneSerializer
+from ._path import PathSerializer
+from ._reserved import ReservedSerializer
+from ._set import SetSerializer
+from ._string import StringSerializer
+from ._tuple import TupleSerializer
+from ._union import OptionalSerializer, TryUnionSerializer
+from ._uuid import UuidSerializer
+
+try:
+    from ._ordered_set import OrderedSetSerializer
+except ImportError:
+    OrderedSetSerializer = None
+
+MAGIC = b"SLB\x01"
+FINGERPRINT_SIZE = 8
+HEADER_SIZE = len(MAGIC) + FINGERPRINT_SIZE
+
+# Enough for any 64-bit count, length, or index
+MAX_VARINT_SIZE = 10
+
+# Containers nested deeper than this are rejected before decoding recurses
+# far enough to exhaust the Python stack
+DEFAULT_MAX_DEPTH = 100
+
+double = struct.Struct("<d")
+
+
+class DecodeError(Exception):
+    def __init__(self, position: int, reason: str):
+        super().__init__(position, reason)
+        self.position = position
+        self.reason = reason
+
+
+class Reader:
+    __slots__ = ("data", "depth", "max_depth", "position")
+
+    def __init__(self, data: bytes, position: int = 0, *, max_depth: int = DEFAULT_MAX_DEPTH):
+        self.data = data
+        self.position = position
+        self.depth = 0
+        self.max_depth = max_depth
+
+    def enter(self) -> None:
+        """Start decoding a container, failing if it is nested too deep.
+
+        Every `enter` is paired with a `leave` once the container is decoded.
+        A `DecodeError` abandons the whole reader, so there is no need to
+        leave the containers it escapes from.
+        """
+        if self.depth >= self.max_depth:
+            raise DecodeError(self.position, "nesting too deep")
+        self.depth += 1
+
+    def leave(self) -> None:
+        self.depth -= 1
+
+    def read(self, size: int) -> bytes:
+        end = self.position + size
+        if end > len(self.data):
+            raise DecodeError(self.position, f"expected {size} more bytes")
+        chunk = self.data[self.position : end]
+        self.position = end
+        return chunk
+
+    def byte(self) -> int:
+        if self.position >= len(self.data):
+            raise DecodeError(self.position, "expected 1 more byte")
+        value = self.data[self.position]
+        self.position += 1
+        return value
+
+    def varint(self) -> int:
+        position = self.position
+        value = 0
+        for shift in range(0, 7 * MAX_VARINT_SIZE, 7):
+            byte = self.byte()
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+        raise DecodeError(position, f"varint longer than {MAX_VARINT_SIZE} bytes")
+
+    def big_varint(self) -> int:
+        """Read a varint of any length, for integers in the data.
+
+        Shifting each group into the value would take quadratic time in the
+        length, so long varints are converted through a binary string instead.
+        """
+        end = self.position
+        while end < len(self.data) and self.data[end] >= 0x80:
+            end += 1
+        if end - self.position < MAX_VARINT_SIZE:
+            return self.varint()
+        elif end == len(self.data):
+            raise DecodeError(self.position, "unterminated varint")
+
+        groups = self.data[self.position : end + 1]
+        self.position = end + 1
+        return int("".join(f"{byte & 0x7F:07b}" for byte in reversed(groups)), 2)
+
+    def count(self) -> int:
+        """Read the number of elements of a container.
+
+        Every element is at least one byte, so a count larger than the bytes
+        left is malformed, which is checked before anything is allocated.
+        """
+        position = self.position
+        value = self.varint()
+        remaining = len(self.data) - self.position
+        if value > remaining:
+            raise DecodeError(position, f"count {value} exceeds the {remaining} bytes left")
+        return value
+
+    def index(self, count: int) -> int:
+        position = self.position
+        value = self.varint()
+        if value >= count:
+            raise DecodeError(position, f"index {value} is out of range for {count} choices")
+        return value
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def write_signed(out: bytearray, value: int) -> None:
+    # Zigzag encoding keeps small negative integers small
+    write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+def read_signed(reader: Reader) -> int:
+    value = reader.big_varint()
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+class Codec:
+    """Encodes one kind of data to bytes and decodes it back.
+
+    Codecs work on data, the output of `to_data` and the input of
+    `from_data`, so the serializers still do all conversion and validation.
+    `children` and `parameters` describe the schema for the fingerprint.
+    Every codec writes at least one byte, so that `Reader.count` can bound
+    the number of elements of a container.
+    """
+
+    name = ""
+
+    def __init__(self, *children: Codec, parameters: tuple = ()):
+        self.children = list(children)
+        self.parameters = parameters
+
+    def encode(self, data: Any, out: bytearray) -> None:
+        raise NotImplementedError()
+
+    def decode(self, reader: Reader) -> Any:
+        raise NotImplementedError()
+
+    def describe(self, seen: dict[int, int]) -> str:
+        # Recursive schemas refer back to the codec by its order of appearance
+        if id(self) in seen:
+            return f"@{seen[id(self)]}"
+        seen[id(self)] = len(seen)
+        children = ",".join(child.describe(seen) for child in self.children)
+        return f"{self.name}{self.parameters!r}({children})"
+
+
+def mismatch(codec: Codec, data: Any) -> ValueError:
+    return ValueError(f"Cannot encode {data!r} as {codec.name}")
+
+
+class NoneCodec(Codec):
+    name = "none"
+
+    def encode(self, data, out):
+        if data is not None:
+            raise mismatch(self, data)
+        out.append(0)
+
+    def decode(self, reader):
+        position = reader.position
+        byte = reader.byte()
+        if byte != 0:
+            raise DecodeError(position, f"invalid none {byte}")
+
+
+class BooleanCodec(Codec):
+    name = "boolean"
+
+    def encode(self, data, out):
+        if not isinstance(data, bool):
+            raise mismatch(self, data)
+        out.append(data)
+
+    def decode(self, reader):
+        position = reader.position
+        byte = reader.byte()
+        if byte > 1:
+            raise DecodeError(position, f"invalid boolean {byte}")
+        return byte == 1
+
+
+class IntegerCodec(Codec):
+    name = "integer"
+
+    def encode(self, data, out):
+        if not isinstance(data, int):
+            raise mismatch(self, data)
+        write_signed(out, int(data))
+
+    def decode(self, reader):
+        return read_signed(reader)
+
+
+class FloatCodec(Codec):
+    name = "float"
+
+    def encode(self, data, out):
+        if not isinstance(data, int | float):
+            raise mismatch(self, data)
+        out += double.pack(data)
+
+    def decode(self, reader):
+        return double.unpack(reader.read(double.size))[0]
+
+
+class StringCodec(Codec):
+    name = "string"
+
+    def encode(self, data, out):
+        if not isinstance(data, str):
+            raise mismatch(self, data)
+        encoded = data.encode()
+        write_varint(out, len(encoded))
+        out += encoded
+
+    def decode(self, reader):
+        position = reader.position
+        try:
+            return str(reader.read(reader.varint()), "utf-8")
+        except UnicodeDecodeError:
+            raise DecodeError(position, "invalid UTF-8") from None
+
+
+class BytesCodec(Codec):
+    """Encodes the base64 data of `BytesSerializer` as the bytes themselves."""
+
+    name = "bytes"
+
+    def __init__(self, serializer: BytesSerializer):
+        super().__init__(parameters=(serializer.urlsafe,))
+        self.serializer = serializer
+
+    def encode(self, data, out):
+        if isinstance(data, bytes | bytearray | memoryview):
+            # Within native types
+            value = data
+        elif isinstance(data, str):
+            try:
+                value = self.serializer.decode(data)
+            except ValueError:
+                raise mismatch(self, data) from None
+        else:
+            raise mismatch(self, data)
+        write_varint(out, len(value))
+        out += value
+
+    def decode(self, reader):
+        return self.serializer.encode(reader.read(reader.varint()))
+
+
+class UuidCodec(Codec):
+    name = "uuid"
+
+    def encode(self, data, out):
+        try:
+            out += UUID(data).bytes
+        except (TypeError, ValueError, AttributeError):
+            raise mismatch(self, data) from None
+
+    def decode(self, reader):
+        return str(UUID(bytes=bytes(reader.read(16))))
+
+
+class LiteralCodec(Codec):
+    name = "literal"
+
+    def encode(self, data, out):
+        # The type must match as well, because 1 == 1.0 == True
+        for i, possibility in enumerate(self.parameters):
+            if type(possibility) is type(data) and possibility == data:
+                write_varint(out, i)
+                return
+        raise mismatch(self, data)
+
+    def decode(self, reader):
+        return self.parameters[reader.index(len(self.parameters))]
+
+
+class ListCodec(Codec):
+    name = "list"
+
+    def encode(self, data, out):
+        if not isinstance(data, list):
+            raise mismatch(self, data)
+        (element,) = self.children
+        write_varint(out, len(data))
+        for item in data:
+            element.encode(item, out)
+
+    def decode(self, reader):
+        (element,) = self.children
+        reader.enter()
+        items = [element.decode(reader) for _ in range(reader.count())]
+        reader.leave()
+        return items
+
+
+class TupleCodec(Codec):
+    name = "tuple"
+
+    def encode(self, data, out):
+        if not isinstance(data, list) or len(data) != len(self.children):
+            raise mismatch(self, data)
+        if not self.children:
+            # An empty tuple is still one byte
+            out.append(0)
+        for element, item in zip(self.children, data, strict=True):
+            element.encode(item, out)
+
+    def decode(self, reader):
+        if not self.children:
+            position = reader.position
+            byte = reader.byte()
+            if byte != 0:
+                raise DecodeError(position, f"invalid empty tuple {byte}")
+        reader.enter()
+        items = [element.decode(reader) for element in self.children]
+        reader.leave()
+        return items
+
+
+class DictCodec(Codec):
+    name = "dict"
+
+    def encode(self, data, out):
+        if not isinstance(data, dict):
+            raise mismatch(self, data)
+        key, value = self.children
+        write_varint(out, len(data))
+        for item_key, item_value in data.items():
+            key.encode(item_key, out)
+            value.encode(item_value, out)
+
+    def decode(self, reader):
+        key, value = self.children
+        reader.enter()
+        items = {}
+        for _ in range(reader.count()):
+            position = reader.position
+            item_key = key.decode(reader)
+            item_value = value.decode(reader)
+            try:
+                items[item_key] = item_value
+            except TypeError:
+                # A key whose structure is not known may be a list or dict
+                raise DecodeError(position, f"unhashable key {item_key!r}") from None
+        reader.leave()
+        return items
+
+
+class OptionalCodec(Codec):
+    name = "optional"
+
+    def encode(self, data, out):
+        if data is None:
+            out.append(0)
+        else:
+            out.append(1)
+            self.children[0].encode(data, out)
+
+    def decode(self, reader):
+        position = reader.position
+        match reader.byte():
+            case 0:
+                return None
+            case 1:
+                return self.children[0].decode(reader)
+            case byte:
+                raise DecodeError(position, f"invalid presence flag {byte}")
+
+
+class UnionCodec(Codec):
+    """Encodes the index of the member that deserializes the data.
+
+    This is the same member that `TryUnionSerializer.from_data` picks, so the
+    value deserialized from the bytes is the same as from the data.
+    """
+
+    name = "union"
+
+    def __init__(self, serializers: tuple[Serializer, ...]):
+        super().__init__()
+        self.serializers = serializers
+
+    def encode(self, data, out):
+        for i, (serializer, member) in enumerate(
+            zip(self.serializers, self.children, strict=True)
+        ):
+            if isinstance(serializer.from_data(data), Failure):
+                continue
+            write_varint(out, i)
+            member.encode(data, out)
+            return
+        raise mismatch(self, data)
+
+    def decode(self, reader):
+        return self.children[reader.index(len(self.children))].decode(reader)
+
+
+class FieldsCodec(Codec):
+    """Encodes the data fields in a fixed order after a presence bitmap.
+
+    Fields with hidden defaults and the alternatives of a `MultiField` are
+    often absent, so every data field has a bit saying whether it is present.
+    """
+
+    name = "fields"
+
+    def encode(self, data, out):
+        if not isinstance(data, dict) or not data.keys() <= self.indexes.keys():
+            raise mismatch(self, data)
+
+        bitmap = 0
+        for key in data:
+            bitmap |= 1 << self.indexes[key]
+        out += bitmap.to_bytes(self.bitmap_size, "little")
+
+        for name, field in zip(self.parameters, self.children, strict=True):
+            if name in data:
+                field.encode(data[name], out)
+
+    def decode(self, reader):
+        bitmap = int.from_bytes(reader.read(self.bitmap_size), "little")
+        reader.enter()
+        items = {
+            name: field.decode(reader)
+            for i, (name, field) in enumerate(zip(self.parameters, self.children, strict=True))
+            if bitmap & (1 << i)
+        }
+        reader.leave()
+        return items
+
+    def set_fields(self, fields: dict[str, Codec]) -> None:
+        self.parameters = tuple(fields.keys())
+        self.children = list(fields.values())
+        self.indexes = {name: i for i, name in enumerate(self.parameters)}
+        # A class without fields still has a byte
+        self.bitmap_size = max(1, (len(self.parameters) + 7) // 8)
+
+
+class SubclassCodec(Codec):
+    """Encodes the `_type` of `AbstractSerializableMixin` as an index."""
+
+    name = "subclass"
+
+    def encode(self, data, out):
+        if not isinstance(data, dict) or data.get("_type") not in self.indexes:
+            raise mismatch(self, data)
+        i = self.indexes[data["_type"]]
+        write_varint(out, i)
+        self.children[i].encode({key: value for key, value in data.items() if key != "_type"}, out)
+
+    def decode(self, reader):
+        i = reader.index(len(self.children))
+        return {"_type": self.parameters[i]} | self.children[i].decode(reader)
+
+    def set_subclasses(self, subclasses: dict[str, Codec]) -> None:
+        self.parameters = tuple(sorted(subclasses))
+        self.children = [subclasses[name] for name in self.parameters]
+        self.indexes = {name: i for i, name in enumerate(self.parameters)}
+
+
+class JsonCodec(Codec):
+    """Encodes any JSON data with a tag byte before each value.
+
+    This is used for serializers whose data has no known structure.
+    """
+
+    name = "json"
+
+    def encode(self, data, out):
+        if data is None:
+            out.append(0)
+        elif data is False:
+            out.append(1)
+        elif data is True:
+            out.append(2)
+        elif isinstance(data, int):
+            out.append(3)
+            write_signed(out, data)
+        elif isinstance(data, float):
+            out.append(4)
+            out += double.pack(data)
+        elif isinstance(data, str):
+            out.append(5)
+            string_codec.encode(data, out)
+        elif isinstance(data, list | tuple):
+            out.append(6)
+            write_varint(out, len(data))
+            for item in data:
+                self.encode(item, out)
+        elif isinstance(data, dict):
+            out.append(7)
+            write_varint(out, len(data))
+            for key, value in data.items():
+                string_codec.encode(key, out)
+                self.encode(value, out)
+        else:
+            raise mismatch(self, data)
+
+    def decode(self, reader):
+        position = reader.position
+        match reader.byte():
+            case 0:
+                return None
+            case 1:
+                return False
+            case 2:
+                return True
+            case 3:
+                return read_signed(reader)
+            case 4:
+                return double.unpack(reader.read(double.size))[0]
+            case 5:
+                return string_codec.decode(reader)
+            case 6:
+                reader.enter()
+                items = [self.decode(reader) for _ in range(reader.count())]
+                reader.leave()
+                return items
+            case 7:
+                reader.enter()
+                items = {
+                    string_codec.decode(reader): self.decode(reader) for _ in range(reader.count())
+                }
+                reader.leave()
+                return items
+            case tag:
+                raise DecodeError(position, f"invalid tag {tag}")
+
+
+string_codec = StringCodec()
+
+integer_serializers = (IntegerSerializer, NonnegativeIntegerSerializer, PositiveIntegerSerializer)
+string_serializers = (
+    StringSerializer,
+    DateSerializer,
+    DateTimeSerializer,
+    PathSerializer,
+)
+list_serializers = (
+    (ListSerializer, SetSerializer)
+    if OrderedSetSerializer is None
+    else (ListSerializer, SetSerializer, OrderedSetSerializer)
+)
+
+
+def compile_codec(serializer: Any, codecs: dict[int, Codec]) -> Codec:
+    """Build the codec of the data of `serializer`.
+
+    `codecs` holds the codecs of the classes and fields serializers compiled
+    so far, so that recursive types refer to the codec being built.
+    """
+    codec = codecs.get(id(serializer))
+    if codec is not None:
+        return codec
+
+    if isinstance(serializer, NoneSerializer):
+        return NoneCodec()
+    elif isinstance(serializer, BooleanSerializer):
+        return BooleanCodec()
+    elif isinstance(serializer, integer_serializers):
+        return IntegerCodec()
+    elif isinstance(serializer, FloatSerializer) and all(
+        isinstance(values[0], float)
+        for values in (serializer.nan_values, serializer.inf_values, serializer.neg_inf_values)
+    ):
+        return FloatCodec()
+    elif isinstance(serializer, string_serializers):
+        return StringCodec()
+    elif isinstance(serializer, BytesSerializer):
+        return BytesCodec(serializer)
+    elif isinstance(serializer, UuidSerializer):
+        return UuidCodec()
+    elif isinstance(serializer, LiteralSerializer):
+        return LiteralCodec(parameters=serializer.possibilities)
+    elif isinstance(serializer, list_serializers):
+        return ListCodec(compile_codec(serializer.element_serializer, codecs))
+    elif isinstance(serializer, TupleSerializer):
+        return TupleCodec(
+            *(compile_codec(element, codecs) for element in serializer.element_serializers)
+        )
+    elif isinstance(serializer, RawDictSerializer):
+        return DictCodec(
+            compile_codec(serializer.key_serializer, codecs),
+            compile_codec(serializer.value_serializer, codecs),
+        )
+    elif isinstance(serializer, OrderedDictSerializer):
+        return ListCodec(
+            TupleCodec(
+                compile_codec(serializer.key_serializer, codecs),
+                compile_codec(serializer.value_serializer, codecs),
+            )
+        )
+    elif isinstance(serializer, OptionalSerializer):
+        return OptionalCodec(compile_codec(serializer.element_serializer, codecs))
+    elif isinstance(serializer, TryUnionSerializer):
+        codec = UnionCodec(serializer.serializers)
+        codec.children = [compile_codec(member, codecs) for member in serializer.serializers]
+        return codec
+    elif isinstance(serializer, ReservedSerializer):
+        return compile_codec(serializer.internal_serializer, codecs)
+    elif isinstance(serializer, CachedSerializer):
+        return compile_codec(serializer.serializer, codecs)
+    elif isinstance(serializer, FieldsSerializer):
+        codec = codecs[id(serializer)] = FieldsCodec()
+        codec.set_fields(
+            {
+                name: compile_codec(field, codecs)
+                for name, field in serializer.data_field_deserializers.items()
+            }
+        )
+        return codec
+    elif has_from_data_of(serializer, SerializableMixin):
+        codec = codecs[id(serializer)] = compile_codec(serializer.__fields_serializer__, codecs)
+        return codec
+    elif has_from_data_of(serializer, AbstractSerializableMixin):
+        codec = codecs[id(serializer)] = SubclassCodec()
+        codec.set_subclasses(
+            {
+                name: compile_codec(subclass, codecs)
+                for name, subclass in serializer.__subclass_serializers__.items()
+            }
+        )
+        return codec
+    else:
+        return JsonCodec()
+
+
+class BinarySerializer[Output](Serializer[Output]):
+    """Serialize to compact bytes whose layout is derived from a serializer.
+
+    Every serializer knows the structure of its data, so field names, type
+    tags, and separators do not need to be written. Instead, integers are
+    written as variable-length integers, floats as 8 bytes, strings, binary
+    data, and containers with a length prefix, the fields of a class in a fixed order
+    after a bitmap of which are present, the subclass of an abstract class
+    and the member of a union as an index, and UUIDs as 16 bytes. Parts of
+    the data whose structure is not known to this serializer are written as
+    tagged JSON values. This is typically a fraction of the size of JSON and
+    only suitable for traffic between parties that share the serializer.
+
+    The bytes are the data of `serializer.to_data`, and `from_data` decodes
+    the data and passes it to `serializer.from_data`, so validation is the
+    same as for JSON. The header has a fingerprint of the layout, so that
+    bytes written with a different version of the schema are rejected with a
+    `SchemaFingerprintError` rather than misread.
+
+    The layout of abstract classes is computed when this serializer is
+    constructed, so subclasses must be defined before it is. Lists, tuples,
+    dicts, and classes nested more than `max_depth` deep are rejected as
+    malformed rather than exhausting the stack while decoding.
+    """
+
+    def __init__(
+        self, serializer: Serializer[Output] | Any, *, max_depth: int = DEFAULT_MAX_DEPTH
+    ):
+        from .. import serializer as lookup_serializer
+
+        if not isinstance(serializer, Serializer):
+            serializer = lookup_serializer(serializer)
+
+        self.serializer = serializer
+        self.max_depth = max_depth
+        self.codec = compile_codec(serializer, {})
+        self.fingerprint = sha256(self.codec.describe({}).encode()).digest()[:FINGERPRINT_SIZE]
+        self.header = MAGIC + self.fingerprint
+
+    def from_data(self, data: bytes) -> Result[Output]:
+        if not isinstance(data, bytes | bytearray | memoryview):
+            return Failure(Errors.one(MalformedBinaryError(0, "expected bytes")))
+
+        data = bytes(data)
+        if data[: len(MAGIC)] != MAGIC or len(data) < HEADER_SIZE:
+            return Failure(Errors.one(MalformedBinaryError(0, "missing header")))
+
+        fingerprint = data[len(MAGIC) : HEADER_SIZE]
+        if fingerprint != self.fingerprint:
+            return Failure(
+                Errors.one(SchemaFingerprintError(self.fingerprint.hex(), fingerprint.hex()))
+            )
+
+        reader = Reader(data, HEADER_SIZE, max_depth=self.max_depth)
+        try:
+            decoded = self.codec.decode(reader)
+        except DecodeError as error:
+            return Failure(Errors.one(MalformedBinaryError(error.position, error.reason)))
+
+        if reader.position != len(data):
+            return Failure(Errors.one(MalformedBinaryError(reader.position, "trailing bytes")))
+
+        return self.serializer.from_data(decoded)
+
+    def to_data(self, value: Output) -> bytes:
+        out = bytearray(self.header)
+        self.codec.encode(self.serializer.to_data(value), out)
+        return bytes(out)
+
+    def child_components(self):
+        if is_openapi_component(self.serializer):
+            return {"element": self.serializer}
+        return self.serializer.child_components()
+
+    def to_openapi_schema(self, serializer_to_ref: SerializerToRef, *, force: bool = False):
+        return {"type": "string", "format": "binary"}
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class MalformedBinaryError(Exception):
+    position: int
+    reason: str
+
+    def __str__(self) -> str:
+        return f"Expected valid binary data, but got {self.reason} at byte {self.position}"
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class SchemaFingerprintError(Exception):
+    expected: str
+    actual: str
+
+    def __str__(self) -> str:
+        return f"Expected schema fingerprint {self.expected}, but got {self.actual}"
@@ -7,6 +7,8 @@ from .._type_errors import ExpectedBooleanError
 
 
 class BooleanSerializer(Serializer[bool]):
+    is_identity = True
+
     def from_data(self, data) -> Result[bool]:
         if isinstance(data, bool):
             return Success(data)
@@ -0,0 +1,160 @@
+__all__ = ["BytesSerializer", "InvalidBase64Error"]
+
+import binascii
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from .._base import Serializer, SerializerToRef
+from .._decorators import serializable
+from .._errors import Errors
+from .._native import current_native_types
+from .._result import Failure, Result, Success
+from .._type_errors import ExpectedStringError
+
+to_urlsafe = str.maketrans("+/", "-_")
+# The standard characters are made invalid so that strict decoding rejects them
+from_urlsafe = str.maketrans({"-": "+", "_": "/", "+": "!", "/": "!"})
+
+# Streamed chunks are cut at multiples of these so that each one can be
+# encoded or decoded on its own
+BYTES_PER_GROUP = 3
+CHARACTERS_PER_GROUP = 4
+
+
+class BytesSerializer(Serializer[bytes | bytearray | memoryview]):
+    """Serialize binary data as a base64 string.
+
+    `to_data` accepts `bytes`, `bytearray`, and `memoryview` and encodes
+    their buffer directly with `binascii`, without copying it first. Strict
+    base64 is expected by `from_data`.
+
+    If `urlsafe` is `True`, the base64url alphabet is used instead, which
+    replaces `+` and `/` with `-` and `_`, and the padding is omitted on
+    `to_data` and optional on `from_data`, as is common for tokens and
+    signatures.
+
+    If `view` is `True`, `from_data` returns a `memoryview` of the decoded
+    bytes, so that slicing it does not copy. If `mutable` is `True`, it
+    returns a `bytearray` instead.
+
+    Within `serialite.native_types` for `bytes`, the binary data itself is
+    the data, for formats like MessagePack that can represent it directly.
+    """
+
+    def __init__(self, *, urlsafe: bool = False, view: bool = False, mutable: bool = False):
+        if view and mutable:
+            raise ValueError("A BytesSerializer cannot return both a view and a bytearray")
+
+        self.urlsafe = urlsafe
+        self.view = view
+        self.mutable = mutable
+
+    def from_data(self, data) -> Result[bytes | bytearray | memoryview]:
+        if isinstance(data, str):
+            try:
+                value = self.decode(data)
+            except ValueError:
+                return Failure(Errors.one(InvalidBase64Error(data)))
+        elif isinstance(data, bytes | bytearray | memoryview) and (
+            bytes in current_native_types.get()
+        ):
+            if self.view and isinstance(data, memoryview):
+                value = data
+            elif self.mutable:
+                # Copied, so that mutating the value does not change the data
+                return Success(bytearray(data))
+            else:
+                value = bytes(data)
+        else:
+            return Failure(Errors.one(ExpectedStringError(data)))
+
+        if self.view:
+            return Success(memoryview(value))
+        elif self.mutable:
+            return Success(bytearray(value))
+        else:
+            return Success(value)
+
+    def to_data(self, value: bytes | bytearray | memoryview):
+        if not isinstance(value, bytes | bytearray | memoryview):
+            raise TypeError(f"Not bytes: {value!r}")
+        if bytes in current_native_types.get():
+            return value
+        return self.encode(value)
+
+    def decode(self, data: str) -> bytes:
+        if self.urlsafe:
+            data = data.translate(from_urlsafe)
+            data += "=" * (-len(data) % CHARACTERS_PER_GROUP)
+        return binascii.a2b_base64(data, strict_mode=True)
+
+    def encode(self, value: bytes | bytearray | memoryview) -> str:
+        if isinstance(value, memoryview) and not value.c_contiguous:
+            value = value.tobytes()
+
+        data = binascii.b2a_base64(value, newline=False).decode("ascii")
+        if self.urlsafe:
+            data = data.translate(to_urlsafe).rstrip("=")
+        return data
+
+    def to_data_chunks(self, chunks: Iterable[bytes | bytearray | memoryview]) -> Iterator[str]:
+        """Encode a stream of binary chunks as a stream of base64 strings.
+
+        The strings concatenate to the same data as `to_data` on the
+        concatenated chunks, so a large blob can be encoded without holding
+        it all in memory.
+        """
+        remainder = b""
+        for chunk in chunks:
+            buffer = remainder + chunk if remainder else chunk
+            cut = len(buffer) - len(buffer) % BYTES_PER_GROUP
+            remainder = bytes(buffer[cut:])
+            if cut > 0:
+                yield self.encode(memoryview(buffer)[:cut])
+
+        if remainder:
+            yield self.encode(remainder)
+
+    def from_data_chunks(self, chunks: Iterable[str]) -> Iterator[bytes]:
+        """Decode a stream of base64 strings as a stream of binary chunks.
+
+        The strings may be split anywhere. Invalid base64 raises a
+        `ValidationExceptionGroup` with an `InvalidBase64Error` located at
+        the index of the chunk in which it was found.
+        """
+        remainder = ""
+        for i, chunk in enumerate(chunks):
+            if not isinstance(chunk, str):
+                Errors.one(ExpectedStringError(chunk), location=[i]).raise_on_errors()
+
+            buffer = remainder + chunk
+            cut = len(buffer) - len(buffer) % CHARACTERS_PER_GROUP
+            remainder = buffer[cut:]
+            if cut > 0:
+                try:
+                    value = self.decode(buffer[:cut])
+                except ValueError:
+                    Errors.one(InvalidBase64Error(chunk), location=[i]).raise_on_errors()
+                yield value
+
+        if remainder:
+            try:
+                value = self.decode(remainder)
+            except ValueError:
+                Errors.one(InvalidBase64Error(remainder)).raise_on_errors()
+            yield value
+
+    def to_openapi_schema(self, serializer_to_ref: SerializerToRef, *, force: bool = False):
+        if self.urlsafe:
+            return {"type": "string", "contentEncoding": "base64url"}
+        else:
+            return {"type": "string", "format": "byte"}
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class InvalidBase64Error(Exception):
+    actual: str
+
+    def __str__(self) -> str:
+        return f"Expected base64 string, but got {self.actual!r}"
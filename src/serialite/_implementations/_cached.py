@@ -0,0 +1,48 @@
+__all__ = ["CachedSerializer"]
+
+from .._base import Serializer, SerializerToRef
+from .._cache import CacheInfo, LruCache, cached_from_data
+from .._openapi import is_openapi_component
+from .._result import Result
+
+
+class CachedSerializer[Output](Serializer[Output]):
+    """Memoize `from_data` of another serializer.
+
+    The successful results of `serializer.from_data` are cached in an
+    `LruCache` of `maxsize` entries keyed by the data, so that repeated
+    identical data, such as the same timestamps, UUIDs, or filter specs, is
+    only deserialized once. The type of every scalar is part of the key, so
+    `1` and `1.0` are different data. Data containing anything other than
+    dicts, lists, and JSON scalars is deserialized without the cache.
+
+    The same value is returned for every hit, so this must only wrap
+    serializers that produce immutable values, like `DateTimeSerializer`,
+    `UuidSerializer`, `DateSerializer`, or frozen dataclasses.
+    """
+
+    def __init__(self, serializer: Serializer[Output], maxsize: int | None = 1024):
+        self.serializer = serializer
+        self.cache = LruCache(maxsize)
+
+    def from_data(self, data) -> Result[Output]:
+        return cached_from_data(self.cache, self.serializer.from_data, data)
+
+    def to_data(self, value: Output):
+        return self.serializer.to_data(value)
+
+    def cache_info(self) -> CacheInfo:
+        """Report statistics of the cache."""
+        return self.cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        self.cache.cache_clear()
+
+    def child_components(self):
+        if is_openapi_component(self.serializer):
+            return {"element": self.serializer}
+        return self.serializer.child_components()
+
+    def to_openapi_schema(self, serializer_to_ref: SerializerToRef, *, force: bool = False):
+        return self.serializer.to_openapi_schema(serializer_to_ref)
@@ -0,0 +1,378 @@
+__all__ = ["ColumnDtypeError", "ColumnLengthError", "ColumnarSerializer"]
+
+from dataclasses import dataclass
+from math import inf, nan
+from operator import itemgetter
+from typing import Any, Literal
+
+import numpy as np
+
+from .._base import Serializer, SerializerToRef
+from .._decorators import serializable
+from .._errors import ErrorElement, Errors
+from .._fields_serializer import FieldsSerializer, SingleField, empty_default, no_default
+from .._result import Failure, Result, Success
+from .._type_errors import ExpectedDictionaryError, ExpectedListError
+from ._boolean import BooleanSerializer
+from ._float import FloatSerializer
+from ._integer import IntegerSerializer, NonnegativeIntegerSerializer, PositiveIntegerSerializer
+from ._list import (
+    BooleanListSerializer,
+    FloatListSerializer,
+    IntegerListSerializer,
+    ListSerializer,
+    StringListSerializer,
+)
+from ._string import StringSerializer
+
+
+def column_dtype(serializer: Serializer) -> np.dtype:
+    if isinstance(serializer, BooleanSerializer):
+        return np.dtype(np.bool_)
+    elif isinstance(
+        serializer, (IntegerSerializer, NonnegativeIntegerSerializer, PositiveIntegerSerializer)
+    ):
+        return np.dtype(np.int64)
+    elif isinstance(serializer, FloatSerializer):
+        return np.dtype(np.float64)
+    else:
+        return np.dtype(object)
+
+
+def column_list_serializer(serializer: Serializer) -> ListSerializer:
+    # The values are copied into an array, so the lists need not be copied
+    if type(serializer) is IntegerSerializer:
+        return IntegerListSerializer(copy=False)
+    elif type(serializer) is BooleanSerializer:
+        return BooleanListSerializer(copy=False)
+    elif type(serializer) is StringSerializer and serializer.accept is None:
+        return StringListSerializer(copy=False)
+    elif type(serializer) is FloatSerializer and (
+        serializer.nan_values == (nan,)
+        and serializer.inf_values == (inf,)
+        and serializer.neg_inf_values == (-inf,)
+    ):
+        return FloatListSerializer()
+    else:
+        return ListSerializer(serializer, copy=False)
+
+
+def to_column(values: list[Any], dtype: np.dtype, *, strict: bool) -> Result[np.ndarray]:
+    """Store values in an array of `dtype`.
+
+    If `strict`, values that do not fit the dtype fail with a
+    `ColumnDtypeError` located at their index. Otherwise, the column falls
+    back to `object`.
+    """
+    if dtype != object:
+        try:
+            return Success(np.array(values, dtype=dtype))
+        except OverflowError:
+            # Integers too large for int64
+            if strict:
+                return Failure(column_dtype_errors(values, dtype))
+        except (TypeError, ValueError):
+            if strict:
+                return Failure(column_dtype_errors(values, dtype))
+            raise
+
+    # np.array would turn lists and tuples into extra dimensions
+    return Success(np.fromiter(values, dtype=object, count=len(values)))
+
+
+def column_dtype_errors(values: list[Any], dtype: np.dtype) -> Errors:
+    errors = Errors()
+    for i, value in enumerate(values):
+        try:
+            _ = np.array([value], dtype=dtype)
+        except (OverflowError, TypeError, ValueError):
+            errors.add(ColumnDtypeError(str(dtype), value), location=[i])
+    return errors
+
+
+@dataclass(frozen=True, slots=True)
+class Column:
+    field: SingleField
+    list_serializer: ListSerializer
+    dtype: np.dtype
+    # Whether the dtype was given explicitly, so that values must fit it
+    strict: bool
+
+
+class ColumnarSerializer(Serializer[dict[str, np.ndarray] | np.ndarray]):
+    def __init__(
+        self,
+        fields: FieldsSerializer | type,
+        *,
+        layout: Literal["columns", "structured"] = "columns",
+        orient: Literal["records", "columns"] = "records",
+        dtypes: dict[str, Any] | None = None,
+    ):
+        """Serialize a table of rows directly to and from NumPy columns.
+
+        `fields` is a `FieldsSerializer` or a class decorated with
+        `serializable`, whose `__fields_serializer__` is used. The data is
+        either a list of rows, each like the data of the class, or a dict
+        mapping each field name to a list of the values of that field.
+        Instead of constructing one object per row, each field is validated as
+        a whole column and stored in a NumPy array, which saves the time and
+        memory of the objects.
+
+        If `layout` is `"columns"`, the value is a dict of one-dimensional
+        arrays, one per field. If it is `"structured"`, the value is a
+        structured array with one named field per field. Booleans, integers,
+        and floats are stored as `bool`, `int64`, and `float64`. Every other
+        field, and integers too large for `int64`, are stored as `object`.
+        `dtypes` overrides the dtype of individual fields, in which case each
+        value that does not fit the dtype fails with a `ColumnDtypeError`
+        instead.
+
+        Error locations are the same as for the row or column in the data,
+        `[row, field]` for a list of rows and `[field, row]` for a dict of
+        columns.
+
+        When serializing, `orient` selects between a list of rows and a dict
+        of columns. Only fields with a single serializer are supported.
+        """
+        if not isinstance(fields, FieldsSerializer):
+            fields = fields.__fields_serializer__
+
+        if dtypes is None:
+            dtypes = {}
+
+        columns = {}
+        for name, field in fields.object_field_serializers.items():
+            if not isinstance(field, SingleField):
+                raise TypeError(
+                    f"ColumnarSerializer only supports SingleField, but field {name!r} is a"
+                    f" {type(field).__name__}"
+                )
+            if field.default is empty_default:
+                raise TypeError(f"Field {name!r} without a value cannot be stored in a column")
+
+            strict = name in dtypes
+            dtype = np.dtype(dtypes[name]) if strict else column_dtype(field.serializer)
+            columns[name] = Column(field, column_list_serializer(field.serializer), dtype, strict)
+
+        self.fields_serializer = fields
+        self.columns = columns
+        self.writable_columns = {
+            name: column for name, column in columns.items() if column.field.writable
+        }
+        self.readable_columns = {
+            name: column for name, column in columns.items() if column.field.readable
+        }
+        self.layout = layout
+        self.orient = orient
+
+    def from_data(self, data) -> Result[dict[str, np.ndarray] | np.ndarray]:
+        if isinstance(data, list):
+            result = self.rows_from_data(data)
+        elif isinstance(data, dict):
+            result = self.columns_from_data(data)
+        else:
+            return Failure(Errors.one(ExpectedListError(data)))
+
+        match result:
+            case Failure(error):
+                return Failure(error)
+            case Success((values, length)):
+                pass
+
+        errors = Errors()
+        arrays = {}
+        for name, column in self.writable_columns.items():
+            match to_column(values[name], column.dtype, strict=column.strict):
+                case Failure(error):
+                    for element in error.errors:
+                        (i,) = element.location
+                        location = (i, name) if isinstance(data, list) else (name, i)
+                        errors.errors.append(ErrorElement(element.error, location=location))
+                case Success(array):
+                    arrays[name] = array
+
+        if not errors.is_empty():
+            if isinstance(data, list):
+                # Report errors in the order of the rows
+                errors.errors.sort(key=lambda element: element.location[0])
+            return Failure(errors)
+
+        if self.layout == "structured":
+            table = np.empty(length, dtype=[(name, array.dtype) for name, array in arrays.items()])
+            for name, array in arrays.items():
+                table[name] = array
+            return Success(table)
+        else:
+            return Success(arrays)
+
+    def rows_from_data(self, data: list) -> Result[tuple[dict[str, list[Any]], int]]:
+        # Import locally to avoid circular import at module import time
+        from .._field_errors import RequiredFieldError, UnknownFieldError
+
+        errors = Errors()
+        names = self.writable_columns.keys()
+
+        # Check the shape of each row. In the common case, every row has
+        # exactly the expected fields and each column can be sliced directly.
+        complete = True
+        for i, row in enumerate(data):
+            if not isinstance(row, dict):
+                complete = False
+                errors.add(ExpectedDictionaryError(row), location=[i])
+            elif row.keys() != names:
+                complete = False
+                for key in row:
+                    if key not in names:
+                        errors.add(UnknownFieldError(key), location=[i, key])
+                for name, column in self.writable_columns.items():
+                    if name not in row and column.field.default is no_default:
+                        errors.add(RequiredFieldError(name), location=[i, name])
+
+        values = {}
+        for name, column in self.writable_columns.items():
+            if complete:
+                indexes = None
+                present = list(map(itemgetter(name), data))
+            else:
+                indexes = [
+                    i for i, row in enumerate(data) if isinstance(row, dict) and name in row
+                ]
+                present = [data[i][name] for i in indexes]
+
+            match column.list_serializer.from_data(present):
+                case Failure(error):
+                    for element in error.errors:
+                        j, *rest = element.location
+                        i = j if indexes is None else indexes[j]
+                        errors.errors.append(
+                            ErrorElement(element.error, location=(i, name, *rest))
+                        )
+                case Success(present):
+                    if indexes is None:
+                        values[name] = present
+                    else:
+                        filled = [column.field.default] * len(data)
+                        for i, value in zip(indexes, present, strict=True):
+                            filled[i] = value
+                        values[name] = filled
+
+        if not errors.is_empty():
+            # Report errors in the order of the rows
+            errors.errors.sort(key=lambda element: element.location[0])
+            return Failure(errors)
+        else:
+            return Success((values, len(data)))
+
+    def columns_from_data(self, data: dict) -> Result[tuple[dict[str, list[Any]], int]]:
+        # Import locally to avoid circular import at module import time
+        from .._field_errors import RequiredFieldError, UnknownFieldError
+
+        errors = Errors()
+
+        length = None
+        values = {}
+        for key, column_data in data.items():
+            if key not in self.writable_columns:
+                errors.add(UnknownFieldError(key), location=[key])
+                continue
+
+            if not isinstance(column_data, list):
+                errors.add(ExpectedListError(column_data), location=[key])
+                continue
+
+            if length is None:
+                length = len(column_data)
+            elif len(column_data) != length:
+                errors.add(ColumnLengthError(length, len(column_data)), location=[key])
+                continue
+
+            match self.writable_columns[key].list_serializer.from_data(column_data):
+                case Failure(error):
+                    errors.extend(error, location=[key])
+                case Success(column_values):
+                    values[key] = column_values
+
+        if length is None:
+            length = 0
+
+        for name, column in self.writable_columns.items():
+            if name not in data:
+                if column.field.default is no_default:
+                    errors.add(RequiredFieldError(name), location=[name])
+                else:
+                    values[name] = [column.field.default] * length
+
+        if not errors.is_empty():
+            return Failure(errors)
+        else:
+            return Success((values, length))
+
+    def to_data(self, value: dict[str, np.ndarray] | np.ndarray):
+        if isinstance(value, np.ndarray) and value.dtype.names is not None:
+            arrays = {name: value[name] for name in value.dtype.names}
+        elif isinstance(value, dict):
+            arrays = value
+        else:
+            raise TypeError(f"Not a dict of arrays or a structured array: {value!r}")
+
+        objects = {}
+        data_columns = {}
+        for name, column in self.readable_columns.items():
+            array = arrays[name]
+            objects[name] = array.tolist() if isinstance(array, np.ndarray) else list(array)
+            data_columns[name] = column.list_serializer.to_data(objects[name])
+
+        if self.orient == "columns":
+            return data_columns
+
+        names = list(data_columns.keys())
+        rows = [
+            dict(zip(names, row, strict=True)) for row in zip(*data_columns.values(), strict=True)
+        ]
+
+        # Omit default values as FieldsSerializer does
+        for name, column in self.readable_columns.items():
+            field = column.field
+            if field.hide_default and field.default is not no_default:
+                for row, item in zip(rows, objects[name], strict=True):
+                    if item == field.default:
+                        del row[name]
+
+        return rows
+
+    def child_components(self):
+        return self.fields_serializer.child_components()
+
+    def to_openapi_schema(self, serializer_to_ref: SerializerToRef, *, force: bool = False):
+        row_schema = self.fields_serializer.to_openapi_schema(serializer_to_ref)
+        if self.orient == "columns":
+            return {
+                "type": "object",
+                "required": row_schema["required"],
+                "properties": {
+                    name: {"type": "array", "items": schema}
+                    for name, schema in row_schema["properties"].items()
+                },
+            }
+        else:
+            return {"type": "array", "items": row_schema}
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class ColumnLengthError(Exception):
+    expected: int
+    actual: int
+
+    def __str__(self) -> str:
+        return f"Expected column of length {self.expected}, but got length {self.actual}"
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class ColumnDtypeError(Exception):
+    dtype: str
+    actual: Any
+
+    def __str__(self) -> str:
+        return f"Expected value that fits in {self.dtype}, but got {self.actual!r}"
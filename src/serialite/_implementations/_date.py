@@ -6,6 +6,7 @@ from datetime import date, datetime
 from .._base import Serializer, SerializerToRef
 from .._decorators import serializable
 from .._errors import Errors
+from .._native import current_native_types
 from .._result import Failure, Result, Success
 from .._type_errors import ExpectedStringError
 
@@ -21,6 +22,8 @@ class DateSerializer(Serializer[date]):
                 return Failure(Errors.one(InvalidDateError(data)))
             else:
                 return Success(value)
+        elif type(data) is date and date in current_native_types.get():
+            return Success(data)
         else:
             return Failure(Errors.one(ExpectedStringError(data)))
 
@@ -30,6 +33,8 @@ class DateSerializer(Serializer[date]):
         # explicitly.
         if not isinstance(value, date) or isinstance(value, datetime):
             raise TypeError(f"Not a Date: {value!r}")
+        if date in current_native_types.get():
+            return value
         return value.isoformat()
 
     def to_openapi_schema(self, serializer_to_ref: SerializerToRef, *, force: bool = False):
@@ -6,6 +6,7 @@ from datetime import datetime
 from .._base import Serializer, SerializerToRef
 from .._decorators import serializable
 from .._errors import Errors
+from .._native import current_native_types
 from .._result import Failure, Result, Success
 from .._type_errors import ExpectedStringError
 
@@ -25,12 +26,16 @@ class DateTimeSerializer(Serializer[datetime]):
                 return Failure(Errors.one(InvalidDateTimeError(data)))
             else:
                 return Success(value)
+        elif isinstance(data, datetime) and datetime in current_native_types.get():
+            return Success(data)
         else:
             return Failure(Errors.one(ExpectedStringError(data)))
 
     def to_data(self, value):
         if not isinstance(value, datetime):
             raise TypeError(f"Not a DateTime: {value!r}")
+        if datetime in current_native_types.get():
+            return value
         return value.isoformat(sep=" ")
 
     def to_openapi_schema(self, serializer_to_ref: SerializerToRef, *, force: bool = False):
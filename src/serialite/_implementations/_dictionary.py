@@ -78,6 +78,11 @@ class RawDictSerializer[Value](Serializer[dict[str, Value]]):
     `RawDictSerializer` can be used to serialize dictionaries when the key is a
     string and order is unimportant and a type that is understood by OpenAPI is
     important.
+
+    If both the key and value serializers are identity serializers, the items
+    are only validated and the dictionary is copied as a whole. If, in
+    addition, `copy` is `False`, the input dictionary itself is returned by
+    both `from_data` and `to_data`.
     """
 
     def __init__(
@@ -85,15 +90,36 @@ class RawDictSerializer[Value](Serializer[dict[str, Value]]):
         value_serializer: Serializer[Value],
         *,
         key_serializer: Serializer[str] = StringSerializer(),  # noqa: B008
+        copy: bool = True,
     ):
         self.value_serializer = value_serializer
         self.key_serializer = key_serializer
+        self.copy = copy
+        self.items_are_identity = getattr(key_serializer, "is_identity", False) and getattr(
+            value_serializer, "is_identity", False
+        )
 
     def from_data(self, data) -> Result[dict[str, Value]]:
         # Return early if the data isn't even a dict
         if not isinstance(data, dict):
             return Failure(Errors.one(ExpectedDictionaryError(data)))
 
+        if self.items_are_identity:
+            # Only validate keys and values
+            errors = Errors()
+            for key, value in data.items():
+                match self.key_serializer.from_data(key):
+                    case Failure(error):
+                        errors.extend(error, location=[key])
+                match self.value_serializer.from_data(value):
+                    case Failure(error):
+                        errors.extend(error, location=[key])
+
+            if not errors.is_empty():
+                return Failure(errors)
+            else:
+                return Success(dict(data) if self.copy else data)
+
         # Validate keys and values
         errors = Errors()
         values = {}
@@ -124,6 +150,14 @@ class RawDictSerializer[Value](Serializer[dict[str, Value]]):
         if not isinstance(value, dict):
             raise TypeError(f"Not an dict: {value!r}")
 
+        if self.items_are_identity:
+            # Only validate keys and values
+            for key, item in value.items():
+                self.key_serializer.to_data(key)
+                self.value_serializer.to_data(item)
+
+            return dict(value) if self.copy else value
+
         return {
             self.key_serializer.to_data(key): self.value_serializer.to_data(value)
             for key, value in value.items()
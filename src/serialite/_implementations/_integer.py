@@ -16,6 +16,8 @@ from .._type_errors import ExpectedIntegerError
 
 
 class IntegerSerializer(Serializer[int]):
+    is_identity = True
+
     def from_data(self, data) -> Result[int]:
         if isinstance(data, int):
             return Success(data)
@@ -32,6 +34,8 @@ class IntegerSerializer(Serializer[int]):
 
 
 class NonnegativeIntegerSerializer(Serializer[int]):
+    is_identity = True
+
     def from_data(self, data) -> Result[int]:
         if not is_int(data):
             return Failure(Errors.one(ExpectedIntegerError(data)))
@@ -51,6 +55,8 @@ class NonnegativeIntegerSerializer(Serializer[int]):
 
 
 class PositiveIntegerSerializer(Serializer[int]):
+    is_identity = True
+
     def from_data(self, data) -> Result[int]:
         if not is_int(data):
             return Failure(Errors.one(ExpectedIntegerError(data)))
@@ -0,0 +1,134 @@
+__all__ = ["LimitedSerializer", "Limits"]
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .._base import Serializer, SerializerToRef
+from .._errors import Errors
+from .._limit_errors import (
+    ElementBudgetError,
+    MaximumDepthError,
+    MaximumKeysError,
+    MaximumLengthError,
+    MaximumStringLengthError,
+)
+from .._openapi import is_openapi_component
+from .._result import Failure, Result
+
+
+@dataclass(frozen=True, slots=True)
+class Limits:
+    """Bounds on the size of data accepted by `LimitedSerializer`.
+
+    `max_depth` is the number of lists and dicts that may be nested within
+    each other, `max_length` the number of elements of each list,
+    `max_string_length` the number of characters of each string, including
+    keys, `max_keys` the number of keys of each dict, and `max_elements` the
+    number of list elements and dict values in the whole data. A limit of
+    `None` is not checked.
+    """
+
+    max_depth: int | None = None
+    max_length: int | None = None
+    max_string_length: int | None = None
+    max_keys: int | None = None
+    max_elements: int | None = None
+
+    def check(self, data: Any) -> Errors:
+        """Find the first place that `data` exceeds these limits.
+
+        The data is walked once with an explicit stack, stopping at the first
+        violation, so that the cost is bounded by the limits rather than by
+        the data. An empty `Errors` is returned if the data is within them.
+        """
+        # The iterators of the containers being walked and the key of the
+        # element of each one currently being checked
+        stack: list[Iterator[tuple[Any, Any]]] = []
+        location: list[Any] = []
+        elements = 0
+
+        item = data
+        while True:
+            error = self.check_item(item, len(stack))
+            if error is not None:
+                return Errors.one(error, location=location)
+
+            if isinstance(item, list):
+                stack.append(enumerate(item))
+                location.append(None)
+            elif isinstance(item, dict):
+                stack.append(iter(item.items()))
+                location.append(None)
+
+            while stack:
+                entry = next(stack[-1], None)
+                if entry is not None:
+                    location[-1], item = entry
+                    elements += 1
+                    if self.max_elements is not None and elements > self.max_elements:
+                        return Errors.one(ElementBudgetError(self.max_elements), location=location)
+                    break
+                stack.pop()
+                location.pop()
+            else:
+                return Errors()
+
+    def check_item(self, item: Any, depth: int) -> Exception | None:
+        if isinstance(item, str):
+            if self.max_string_length is not None and len(item) > self.max_string_length:
+                return MaximumStringLengthError(self.max_string_length, len(item))
+        elif isinstance(item, list):
+            if self.max_depth is not None and depth >= self.max_depth:
+                return MaximumDepthError(self.max_depth)
+            if self.max_length is not None and len(item) > self.max_length:
+                return MaximumLengthError(self.max_length, len(item))
+        elif isinstance(item, dict):
+            if self.max_depth is not None and depth >= self.max_depth:
+                return MaximumDepthError(self.max_depth)
+            if self.max_keys is not None and len(item) > self.max_keys:
+                return MaximumKeysError(self.max_keys, len(item))
+            if self.max_string_length is not None:
+                for key in item:
+                    if isinstance(key, str) and len(key) > self.max_string_length:
+                        return MaximumStringLengthError(self.max_string_length, len(key))
+        return None
+
+
+class LimitedSerializer[Output](Serializer[Output]):
+    """Reject data exceeding `limits` before deserializing it.
+
+    This is meant for untrusted input, like the bodies of requests to a
+    public endpoint, where a huge list or string would otherwise be walked in
+    full and an error collected for each of its elements. The data is checked
+    against `limits` in a single pass that stops at the first violation,
+    which is returned as the only error, located where it was found.
+    Otherwise, the data is passed to `serializer.from_data`. `to_data` is not
+    limited.
+    """
+
+    def __init__(self, serializer: Serializer[Output] | Any, limits: Limits):
+        from .. import serializer as lookup_serializer
+
+        if not isinstance(serializer, Serializer):
+            serializer = lookup_serializer(serializer)
+
+        self.serializer = serializer
+        self.limits = limits
+
+    def from_data(self, data) -> Result[Output]:
+        errors = self.limits.check(data)
+        if not errors.is_empty():
+            return Failure(errors)
+        return self.serializer.from_data(data)
+
+    def to_data(self, value: Output):
+        return self.serializer.to_data(value)
+
+    def child_components(self):
+        if is_openapi_component(self.serializer):
+            return {"element": self.serializer}
+        return self.serializer.child_components()
+
+    def to_openapi_schema(self, serializer_to_ref: SerializerToRef, *, force: bool = False):
+        return self.serializer.to_openapi_schema(serializer_to_ref)
@@ -1,10 +1,22 @@
-__all__ = ["ListSerializer"]
+__all__ = [
+    "BooleanListSerializer",
+    "FloatListSerializer",
+    "IntegerListSerializer",
+    "ListSerializer",
+    "StringListSerializer",
+]
+
+from itertools import repeat
 
 from .._base import Serializer, SerializerToRef
 from .._errors import Errors
 from .._openapi import is_openapi_component
 from .._result import Failure, Result, Success
 from .._type_errors import ExpectedListError
+from ._boolean import BooleanSerializer
+from ._float import FloatSerializer
+from ._integer import IntegerSerializer
+from ._string import StringSerializer
 
 try:
     from numpy import ndarray
@@ -15,14 +27,36 @@ except ImportError:
 
 
 class ListSerializer[Element](Serializer[list[Element]]):
-    def __init__(self, element_serializer: Serializer[Element]):
+    def __init__(self, element_serializer: Serializer[Element], *, copy: bool = True):
+        """Serialize a list of elements with `element_serializer`.
+
+        If `element_serializer` is an identity serializer, the elements are
+        only validated and the list is copied as a whole. If, in addition,
+        `copy` is `False`, the input list itself is returned by both
+        `from_data` and `to_data`.
+        """
         self.element_serializer = element_serializer
+        self.copy = copy
+        self.element_is_identity = getattr(element_serializer, "is_identity", False)
 
     def from_data(self, data) -> Result[list[Element]]:
         # Return early if the data isn't even a list
         if not isinstance(data, list):
             return Failure(Errors.one(ExpectedListError(data)))
 
+        if self.element_is_identity:
+            # Only validate values
+            errors = Errors()
+            for i, value in enumerate(data):
+                match self.element_serializer.from_data(value):
+                    case Failure(error):
+                        errors.extend(error, location=[i])
+
+            if not errors.is_empty():
+                return Failure(errors)
+            else:
+                return Success(list(data) if self.copy else data)
+
         # Validate values
         errors = Errors()
         values = []
@@ -43,6 +77,16 @@ class ListSerializer[Element](Serializer[list[Element]]):
         if not isinstance(value, (list, ndarray)):
             raise TypeError(f"Not a list: {value!r}")
 
+        if self.element_is_identity:
+            # Only validate values
+            for item in value:
+                self.element_serializer.to_data(item)
+
+            if self.copy or not isinstance(value, list):
+                return list(value)
+            else:
+                return value
+
         return [self.element_serializer.to_data(item) for item in value]
 
     def child_components(self):
@@ -55,3 +99,87 @@ class ListSerializer[Element](Serializer[list[Element]]):
             "type": "array",
             "items": self.element_serializer.to_openapi_schema(serializer_to_ref),
         }
+
+
+# The specialized serializers below check a whole list of primitives in one
+# pass with map, which runs in C, and allocate a single Success for the
+# list. If any element is invalid, they fall back to ListSerializer, which
+# deserializes each element individually to report its error.
+
+
+def all_instances(values: list, cls: type) -> bool:
+    return all(map(isinstance, values, repeat(cls)))
+
+
+class IntegerListSerializer(ListSerializer[int]):
+    """A fast `ListSerializer(IntegerSerializer())`."""
+
+    def __init__(self, *, copy: bool = True):
+        super().__init__(IntegerSerializer(), copy=copy)
+
+    def from_data(self, data) -> Result[list[int]]:
+        if isinstance(data, list) and all_instances(data, int):
+            return Success(list(data) if self.copy else data)
+        return super().from_data(data)
+
+    def to_data(self, value: list[int]):
+        if isinstance(value, list) and all_instances(value, int):
+            return list(value) if self.copy else value
+        return super().to_data(value)
+
+
+class StringListSerializer(ListSerializer[str]):
+    """A fast `ListSerializer(StringSerializer())`."""
+
+    def __init__(self, *, copy: bool = True):
+        super().__init__(StringSerializer(), copy=copy)
+
+    def from_data(self, data) -> Result[list[str]]:
+        if isinstance(data, list) and all_instances(data, str):
+            return Success(list(data) if self.copy else data)
+        return super().from_data(data)
+
+    def to_data(self, value: list[str]):
+        if isinstance(value, list) and all_instances(value, str):
+            return list(value) if self.copy else value
+        return super().to_data(value)
+
+
+class BooleanListSerializer(ListSerializer[bool]):
+    """A fast `ListSerializer(BooleanSerializer())`."""
+
+    def __init__(self, *, copy: bool = True):
+        super().__init__(BooleanSerializer(), copy=copy)
+
+    def from_data(self, data) -> Result[list[bool]]:
+        if isinstance(data, list) and all_instances(data, bool):
+            return Success(list(data) if self.copy else data)
+        return super().from_data(data)
+
+    def to_data(self, value: list[bool]):
+        if isinstance(value, list) and all_instances(value, bool):
+            return list(value) if self.copy else value
+        return super().to_data(value)
+
+
+class FloatListSerializer(ListSerializer[float]):
+    """A fast `ListSerializer(FloatSerializer())`.
+
+    Lists containing only `int`s and `float`s are converted with `float` in
+    one pass. This gives the same result as the default `FloatSerializer`,
+    which maps NaN and infinities to themselves. Any other element type,
+    including `bool`, takes the element-by-element path.
+    """
+
+    def __init__(self):
+        super().__init__(FloatSerializer())
+
+    def from_data(self, data) -> Result[list[float]]:
+        if isinstance(data, list) and set(map(type, data)) <= {float, int}:
+            return Success(list(map(float, data)))
+        return super().from_data(data)
+
+    def to_data(self, value: list[float]):
+        if isinstance(value, list) and set(map(type, value)) <= {float, int}:
+            return list(map(float, value))
+        return super().to_data(value)
@@ -11,6 +11,8 @@ from .._result import Failure, Success
 
 
 class LiteralSerializer(Serializer):
+    is_identity = True
+
     def __init__(self, *possibilities):
         self.possibilities = possibilities
 
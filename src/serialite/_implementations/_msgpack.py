@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+__all__ = ["MsgpackSerializer", "msgpack_dumps", "msgpack_loads"]
+
+import struct
+from datetime import UTC, date, datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from .._base import Serializer, SerializerToRef
+from .._errors import Errors
+from .._native import native_types
+from .._openapi import is_openapi_component
+from .._result import Failure, Result
+from ._binary import DEFAULT_MAX_DEPTH, DecodeError, MalformedBinaryError, Reader
+
+# Extension types of this library. The timestamp extension type -1 of the
+# MessagePack specification is also decoded, but naive datetimes and UTC
+# offsets other than zero cannot be written with it.
+DATETIME_EXT = 1
+DATE_EXT = 2
+UUID_EXT = 3
+TIMESTAMP_EXT = -1
+
+datetime_struct = struct.Struct(">HBBBBBI")
+offset_struct = struct.Struct(">q")
+date_struct = struct.Struct(">HBB")
+datetime_size = datetime_struct.size
+aware_datetime_size = datetime_struct.size + offset_struct.size
+
+# Each header is one byte followed by a big-endian length or value
+sized_headers = {
+    size: struct.Struct(f">B{code}")
+    for size, code in [(1, "B"), (2, "H"), (4, "I"), (8, "Q"), (-1, "b"), (-2, "h"), (-4, "i")]
+}
+signed_int64 = struct.Struct(">Bq")
+float64 = struct.Struct(">Bd")
+
+fixext_headers = {1: 0xD4, 2: 0xD5, 4: 0xD6, 8: 0xD7, 16: 0xD8}
+
+
+def write_length(out: bytearray, length: int, fix: int | None, fix_limit: int, codes: tuple):
+    # codes are the type bytes for 8-bit, 16-bit, and 32-bit lengths, if any
+    if fix is not None and length < fix_limit:
+        out.append(fix | length)
+    elif codes[0] is not None and length < 2**8:
+        out += sized_headers[1].pack(codes[0], length)
+    elif length < 2**16:
+        out += sized_headers[2].pack(codes[1], length)
+    elif length < 2**32:
+        out += sized_headers[4].pack(codes[2], length)
+    else:
+        raise ValueError(f"Too long for MessagePack: {length}")
+
+
+def write_ext(out: bytearray, code: int, payload: bytes) -> None:
+    header = fixext_headers.get(len(payload))
+    if header is not None:
+        out.append(header)
+    else:
+        write_length(out, len(payload), None, 0, (0xC7, 0xC8, 0xC9))
+    out += code.to_bytes(1, "big", signed=True)
+    out += payload
+
+
+def write_int(out: bytearray, value: int) -> None:
+    if value >= 0:
+        if value < 2**7:
+            out.append(value)
+        elif value < 2**8:
+            out += sized_headers[1].pack(0xCC, value)
+        elif value < 2**16:
+            out += sized_headers[2].pack(0xCD, value)
+        elif value < 2**32:
+            out += sized_headers[4].pack(0xCE, value)
+        elif value < 2**64:
+            out += sized_headers[8].pack(0xCF, value)
+        else:
+            raise ValueError(f"Integer out of range for MessagePack: {value}")
+    elif value >= -(2**5):
+        out.append(value & 0xFF)
+    elif value >= -(2**7):
+        out += sized_headers[-1].pack(0xD0, value)
+    elif value >= -(2**15):
+        out += sized_headers[-2].pack(0xD1, value)
+    elif value >= -(2**31):
+        out += sized_headers[-4].pack(0xD2, value)
+    elif value >= -(2**63):
+        out += signed_int64.pack(0xD3, value)
+    else:
+        raise ValueError(f"Integer out of range for MessagePack: {value}")
+
+
+def write_datetime(out: bytearray, value: datetime) -> None:
+    payload = datetime_struct.pack(
+        value.year,
+        value.month,
+        value.day,
+        value.hour,
+        value.minute,
+        value.second,
+        value.microsecond,
+    )
+    offset = value.utcoffset()
+    if offset is not None:
+        payload += offset_struct.pack(offset // timedelta(microseconds=1))
+    write_ext(out, DATETIME_EXT, payload)
+
+
+def write(out: bytearray, data: Any) -> None:
+    # Exact type checks first, as these are by far the most common
+    data_type = type(data)
+    if data_type is str:
+        encoded = data.encode()
+        write_length(out, len(encoded), 0xA0, 32, (0xD9, 0xDA, 0xDB))
+        out += encoded
+    elif data_type is int:
+        write_int(out, data)
+    elif data is None:
+        out.append(0xC0)
+    elif data is False:
+        out.append(0xC2)
+    elif data is True:
+        out.append(0xC3)
+    elif data_type is float:
+        out += float64.pack(0xCB, data)
+    elif data_type is dict:
+        write_length(out, len(data), 0x80, 16, (None, 0xDE, 0xDF))
+        for key, value in data.items():
+            write(out, key)
+            write(out, value)
+    elif data_type is list or data_type is tuple:
+        write_length(out, len(data), 0x90, 16, (None, 0xDC, 0xDD))
+        for value in data:
+            write(out, value)
+    elif isinstance(data, bytes | bytearray | memoryview):
+        write_length(out, memoryview(data).nbytes, None, 0, (0xC4, 0xC5, 0xC6))
+        out += data
+    elif isinstance(data, datetime):
+        write_datetime(out, data)
+    elif isinstance(data, date):
+        write_ext(out, DATE_EXT, date_struct.pack(data.year, data.month, data.day))
+    elif isinstance(data, UUID):
+        write_ext(out, UUID_EXT, data.bytes)
+    elif isinstance(data, int):
+        write_int(out, int(data))
+    elif isinstance(data, float):
+        out += float64.pack(0xCB, data)
+    else:
+        raise TypeError(f"Cannot write to MessagePack: {data!r}")
+
+
+def msgpack_dumps(data: Any) -> bytes:
+    """Encode data as MessagePack.
+
+    Besides JSON data, this writes `bytes`, `bytearray`, and `memoryview` as
+    MessagePack binary and `datetime`, `date`, and `UUID` as extension types.
+    """
+    out = bytearray()
+    write(out, data)
+    return bytes(out)
+
+
+def read_ext(code: int, payload: bytes, position: int) -> Any:
+    try:
+        if code == DATETIME_EXT and len(payload) in (datetime_size, aware_datetime_size):
+            value = datetime(*datetime_struct.unpack(payload[:datetime_size]))
+            if len(payload) == aware_datetime_size:
+                (offset,) = offset_struct.unpack(payload[datetime_size:])
+                value = value.replace(tzinfo=timezone(timedelta(microseconds=offset)))
+            return value
+        elif code == DATE_EXT and len(payload) == date_struct.size:
+            return date(*date_struct.unpack(payload))
+        elif code == UUID_EXT and len(payload) == 16:
+            return UUID(bytes=bytes(payload))
+        elif code == TIMESTAMP_EXT and len(payload) in (4, 8, 12):
+            if len(payload) == 4:
+                nanoseconds, seconds = 0, int.from_bytes(payload, "big")
+            elif len(payload) == 8:
+                combined = int.from_bytes(payload, "big")
+                nanoseconds, seconds = combined >> 34, combined & (2**34 - 1)
+            else:
+                nanoseconds = int.from_bytes(payload[:4], "big")
+                seconds = int.from_bytes(payload[4:], "big", signed=True)
+            return datetime(1970, 1, 1, tzinfo=UTC) + timedelta(
+                seconds=seconds, microseconds=nanoseconds // 1000
+            )
+    except (ValueError, OverflowError) as error:
+        raise DecodeError(position, f"invalid extension value: {error}") from None
+
+    raise DecodeError(position, f"unknown extension type {code} of {len(payload)} bytes")
+
+
+def read_sized(reader: Reader, size: int, signed: bool = False) -> int:
+    return int.from_bytes(reader.read(size), "big", signed=signed)
+
+
+def read(reader: Reader) -> Any:
+    position = reader.position
+    code = reader.byte()
+
+    if code < 0x80:
+        return code
+    elif code >= 0xE0:
+        return code - 0x100
+    elif 0xA0 <= code < 0xC0:
+        return read_string(reader, code & 0x1F, position)
+    elif 0x90 <= code < 0xA0:
+        return read_array(reader, code & 0x0F)
+    elif 0x80 <= code < 0x90:
+        return read_map(reader, code & 0x0F)
+
+    match code:
+        case 0xC0:
+            return None
+        case 0xC2:
+            return False
+        case 0xC3:
+            return True
+        case 0xCC | 0xCD | 0xCE | 0xCF:
+            return read_sized(reader, 1 << (code - 0xCC))
+        case 0xD0 | 0xD1 | 0xD2 | 0xD3:
+            return read_sized(reader, 1 << (code - 0xD0), signed=True)
+        case 0xCA:
+            return struct.unpack(">f", reader.read(4))[0]
+        case 0xCB:
+            return struct.unpack(">d", reader.read(8))[0]
+        case 0xD9 | 0xDA | 0xDB:
+            return read_string(reader, read_sized(reader, 1 << (code - 0xD9)), position)
+        case 0xC4 | 0xC5 | 0xC6:
+            return bytes(reader.read(read_sized(reader, 1 << (code - 0xC4))))
+        case 0xDC | 0xDD:
+            return read_array(reader, read_sized(reader, 2 << (code - 0xDC)))
+        case 0xDE | 0xDF:
+            return read_map(reader, read_sized(reader, 2 << (code - 0xDE)))
+        case 0xD4 | 0xD5 | 0xD6 | 0xD7 | 0xD8:
+            ext_code = read_sized(reader, 1, signed=True)
+            return read_ext(ext_code, reader.read(1 << (code - 0xD4)), position)
+        case 0xC7 | 0xC8 | 0xC9:
+            size = read_sized(reader, 1 << (code - 0xC7))
+            ext_code = read_sized(reader, 1, signed=True)
+            return read_ext(ext_code, reader.read(size), position)
+        case _:
+            raise DecodeError(position, f"invalid type byte {code:#04x}")
+
+
+def read_string(reader: Reader, size: int, position: int) -> str:
+    try:
+        return str(reader.read(size), "utf-8")
+    except UnicodeDecodeError:
+        raise DecodeError(position, "invalid UTF-8") from None
+
+
+def read_array(reader: Reader, size: int) -> list:
+    reader.enter()
+    values = [read(reader) for _ in range(size)]
+    reader.leave()
+    return values
+
+
+def read_map(reader: Reader, size: int) -> dict:
+    reader.enter()
+    values = {}
+    for _ in range(size):
+        position = reader.position
+        key = read(reader)
+        try:
+            values[key] = read(reader)
+        except TypeError:
+            raise DecodeError(position, "unhashable map key") from None
+    reader.leave()
+    return values
+
+
+def msgpack_loads(data: bytes, *, max_depth: int = DEFAULT_MAX_DEPTH) -> Any:
+    """Decode one MessagePack value that fills `data`.
+
+    Raises `ValueError` if `data` is not valid MessagePack written by
+    `msgpack_dumps` or a compatible encoder, or if it has arrays and maps
+    nested more than `max_depth` deep.
+    """
+    reader = Reader(data, max_depth=max_depth)
+    try:
+        value = read(reader)
+    except DecodeError as error:
+        raise ValueError(f"{error.reason} at byte {error.position}") from None
+    if reader.position != len(data):
+        raise ValueError(f"trailing bytes at byte {reader.position}")
+    return value
+
+
+class MsgpackSerializer[Output](Serializer[Output]):
+    """Serialize to MessagePack bytes with native datetimes and UUIDs.
+
+    `to_data` and `from_data` of `serializer` are run within `native_types`
+    for `bytes`, `datetime`, `date`, and `UUID`, so binary data goes to
+    MessagePack binary and the others to extension types and back without
+    being formatted and parsed as strings. Everything else is validated
+    exactly as for JSON.
+
+    Bytes that are not valid MessagePack, or that have arrays and maps nested
+    more than `max_depth` deep, are reported as a `MalformedBinaryError`.
+    """
+
+    def __init__(
+        self, serializer: Serializer[Output] | Any, *, max_depth: int = DEFAULT_MAX_DEPTH
+    ):
+        from .. import serializer as lookup_serializer
+
+        if not isinstance(serializer, Serializer):
+            serializer = lookup_serializer(serializer)
+
+        self.serializer = serializer
+        self.max_depth = max_depth
+
+    def from_data(self, data: bytes) -> Result[Output]:
+        if not isinstance(data, bytes | bytearray | memoryview):
+            return Failure(Errors.one(MalformedBinaryError(0, "expected bytes")))
+
+        reader = Reader(bytes(data), max_depth=self.max_depth)
+        try:
+            decoded = read(reader)
+        except DecodeError as error:
+            return Failure(Errors.one(MalformedBinaryError(error.position, error.reason)))
+
+        if reader.position != len(reader.data):
+            return Failure(Errors.one(MalformedBinaryError(reader.position, "trailing bytes")))
+
+        with native_types(bytes, datetime, date, UUID):
+            return self.serializer.from_data(decoded)
+
+    def to_data(self, value: Output) -> bytes:
+        with native_types(bytes, datetime, date, UUID):
+            data = self.serializer.to_data(value)
+        return msgpack_dumps(data)
+
+    def child_components(self):
+        if is_openapi_component(self.serializer):
+            return {"element": self.serializer}
+        return self.serializer.child_components()
+
+    def to_openapi_schema(self, serializer_to_ref: SerializerToRef, *, force: bool = False):
+        return {"type": "string", "format": "binary"}
@@ -7,6 +7,8 @@ from .._type_errors import ExpectedNullError
 
 
 class NoneSerializer(Serializer[None]):
+    is_identity = True
+
     def from_data(self, data):
         if data is None:
             return Success(None)
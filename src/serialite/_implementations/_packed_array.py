@@ -0,0 +1,123 @@
+__all__ = ["FloatOutOfRangeError", "PackedArraySerializer"]
+
+import struct
+from array import array
+from dataclasses import dataclass
+from math import inf, isinf
+
+from .._base import Serializer, SerializerToRef
+from .._decorators import serializable
+from .._errors import Errors
+from .._result import Failure, Result, Success
+from .._type_errors import ExpectedIntegerError, ExpectedListError
+from ._integer import IntegerOutOfRangeError
+from ._list import FloatListSerializer
+
+float_typecodes = frozenset("fd")
+integer_typecodes = frozenset("bBhHiIlLqQ")
+
+# The largest finite single-precision float
+float32_maximum = struct.unpack("<f", b"\xff\xff\x7f\x7f")[0]
+
+
+class PackedArraySerializer(Serializer[array]):
+    """Serializing a list of numbers to and from a compact `array.array`.
+
+    A `list[float]` stores each element as a separate float object plus a
+    pointer to it. An `array.array` stores the raw machine values
+    contiguously, which takes a fraction of the memory. The data is the same
+    JSON list of numbers as for a `list`.
+
+    `typecode` is any `array.array` typecode for integers or floats. For
+    integer typecodes, elements outside the range of the machine type are
+    rejected with an `IntegerOutOfRangeError`. For `"f"`, finite elements
+    too large for single precision, which would become infinite, are
+    rejected with a `FloatOutOfRangeError`.
+    """
+
+    def __init__(self, typecode: str = "d"):
+        if typecode in float_typecodes:
+            self.minimum = None
+            self.maximum = None
+        elif typecode in integer_typecodes:
+            bits = 8 * array(typecode).itemsize
+            if typecode.isupper():
+                self.minimum = 0
+                self.maximum = 2**bits - 1
+            else:
+                self.minimum = -(2 ** (bits - 1))
+                self.maximum = 2 ** (bits - 1) - 1
+        else:
+            raise ValueError(f"Expected an integer or float array typecode, not {typecode!r}")
+
+        self.typecode = typecode
+
+    def from_data(self, data) -> Result[array]:
+        # Return early if the data isn't even a list
+        if not isinstance(data, list):
+            return Failure(Errors.one(ExpectedListError(data)))
+
+        if self.typecode in float_typecodes:
+            if set(map(type, data)) <= {float, int}:
+                values = data
+            else:
+                # Let the float list serializer convert other reals or report errors
+                match FloatListSerializer().from_data(data):
+                    case Failure(error):
+                        return Failure(error)
+                    case Success(values):
+                        pass
+
+            value = array(self.typecode, values)
+            if self.typecode == "f" and (inf in value or -inf in value):
+                # Find the finite elements that overflowed
+                errors = Errors()
+                for i, (element, packed) in enumerate(zip(values, value, strict=True)):
+                    if isinf(packed) and not isinf(element):
+                        errors.add(FloatOutOfRangeError(element, float32_maximum), location=[i])
+                if not errors.is_empty():
+                    return Failure(errors)
+
+            return Success(value)
+
+        try:
+            # array validates the type and range of every element in C
+            return Success(array(self.typecode, data))
+        except (TypeError, OverflowError):
+            pass
+
+        # Find the offending elements
+        errors = Errors()
+        for i, value in enumerate(data):
+            if not isinstance(value, int):
+                errors.add(ExpectedIntegerError(value), location=[i])
+            elif not self.minimum <= value <= self.maximum:
+                errors.add(
+                    IntegerOutOfRangeError(value, minimum=self.minimum, maximum=self.maximum),
+                    location=[i],
+                )
+        return Failure(errors)
+
+    def to_data(self, value: array):
+        if not isinstance(value, array):
+            raise TypeError(f"Not an array.array: {value!r}")
+        return value.tolist()
+
+    def to_openapi_schema(self, serializer_to_ref: SerializerToRef, *, force: bool = False):
+        if self.typecode in float_typecodes:
+            return {"type": "array", "items": {"type": "number"}}
+        else:
+            return {
+                "type": "array",
+                "items": {"type": "integer", "minimum": self.minimum, "maximum": self.maximum},
+            }
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class FloatOutOfRangeError(Exception):
+    actual: float
+    maximum: float
+
+    def __str__(self) -> str:
+        return f"Expected float of magnitude at most {self.maximum}, but got {self.actual!r}"
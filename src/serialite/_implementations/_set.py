@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from .._base import Serializer, SerializerToRef
+from .._canonical import canonical_key, current_canonical
 from .._decorators import serializable
 from .._errors import Errors
 from .._openapi import is_openapi_component
@@ -14,12 +15,30 @@ from .._type_errors import ExpectedListError
 class SetSerializer[Element](Serializer[set[Element]]):
     def __init__(self, element_serializer: Serializer[Element]):
         self.element_serializer = element_serializer
+        self.element_is_identity = getattr(element_serializer, "is_identity", False)
 
     def from_data(self, data) -> Result[set[Element]]:
         # Return early if the data isn't even a list
         if not isinstance(data, list):
             return Failure(Errors.one(ExpectedListError(data)))
 
+        if self.element_is_identity:
+            # Only validate values
+            errors = Errors()
+            for i, value in enumerate(data):
+                match self.element_serializer.from_data(value):
+                    case Failure(error):
+                        errors.extend(error, location=[i])
+
+            if not errors.is_empty():
+                return Failure(errors)
+
+            values = set(data)
+            if len(values) == len(data):
+                return Success(values)
+
+            # Fall through to locate the duplicates
+
         # Validate values
         errors = Errors()
         values = set()
@@ -42,7 +61,19 @@ class SetSerializer[Element](Serializer[set[Element]]):
         if not isinstance(value, set):
             raise TypeError(f"Not a set: {value!r}")
 
-        return [self.element_serializer.to_data(item) for item in value]
+        if self.element_is_identity:
+            # Only validate values
+            for item in value:
+                self.element_serializer.to_data(item)
+
+            data = list(value)
+        else:
+            data = [self.element_serializer.to_data(item) for item in value]
+
+        if current_canonical.get():
+            data.sort(key=canonical_key)
+
+        return data
 
     def child_components(self):
         if is_openapi_component(self.element_serializer):
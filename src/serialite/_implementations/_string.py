@@ -11,6 +11,8 @@ from .._type_errors import ExpectedStringError
 
 
 class StringSerializer(Serializer[str]):
+    is_identity = True
+
     def __init__(self, accept: str | None = None):
         self.accept = accept
         self.accept_regex = re.compile(accept) if accept is not None else None
@@ -6,6 +6,7 @@ from uuid import UUID
 from .._base import Serializer, SerializerToRef
 from .._decorators import serializable
 from .._errors import Errors
+from .._native import current_native_types
 from .._result import Failure, Result, Success
 from .._type_errors import ExpectedStringError
 
@@ -19,12 +20,16 @@ class UuidSerializer(Serializer[UUID]):
                 return Failure(Errors.one(InvalidUuidError(data)))
             else:
                 return Success(value)
+        elif isinstance(data, UUID) and UUID in current_native_types.get():
+            return Success(data)
         else:
             return Failure(Errors.one(ExpectedStringError(data)))
 
     def to_data(self, value: UUID):
         if not isinstance(value, UUID):
             raise TypeError(f"Not a UUID: {value!r}")
+        if UUID in current_native_types.get():
+            return value
         return str(value)
 
     def to_openapi_schema(self, serializer_to_ref: SerializerToRef, *, force: bool = False):
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+__all__ = ["InternTable", "from_data_interned"]
+
+import sys
+from collections.abc import Hashable
+from contextvars import ContextVar
+from typing import Any
+
+from ._base import Serializer
+from ._cache import value_cache_key
+from ._result import Result
+
+# The table in which SerializableMixin shares equal frozen instances. None
+# means that instances are not shared, which is the fast path.
+current_intern_table: ContextVar[InternTable | None] = ContextVar("intern_table", default=None)
+
+
+class InternTable:
+    """A table of shared strings and frozen objects for `from_data_interned`.
+
+    A table can be passed to many calls so that equal values are shared
+    across all of them. The values are held until the table is discarded.
+
+    Attributes:
+        strings: The shared strings, each mapped to itself.
+        objects: The shared frozen dataclass instances, each keyed by the
+            type-aware key of its fields, so that fields like `1` and `True`
+            or `0.0` and `-0.0`, which are equal, are not conflated.
+    """
+
+    def __init__(self):
+        self.strings: dict[str, str] = {}
+        self.objects: dict[Hashable, Any] = {}
+
+    def string(self, value: str) -> str:
+        """Return the shared string equal to `value`."""
+        return self.strings.setdefault(value, value)
+
+    def share(self, value: Any) -> Any:
+        """Return the shared instance identical to `value` if it is frozen."""
+        params = getattr(type(value), "__dataclass_params__", None)
+        if params is None or not params.frozen:
+            return value
+
+        try:
+            return self.objects.setdefault(value_cache_key(value), value)
+        except TypeError:
+            # Unhashable field
+            return value
+
+    def intern_data(self, data: Any) -> Any:
+        """Copy data, replacing its strings with shared ones.
+
+        Dict keys are interned with `sys.intern`, which also makes lookups of
+        them faster. Other strings are shared through this table.
+        """
+        if isinstance(data, str):
+            return self.string(data)
+        elif isinstance(data, dict):
+            return {
+                sys.intern(key) if isinstance(key, str) else key: self.intern_data(value)
+                for key, value in data.items()
+            }
+        elif isinstance(data, list):
+            return [self.intern_data(value) for value in data]
+        else:
+            return data
+
+
+def from_data_interned[Output](
+    serializer: Serializer[Output], data: Any, *, table: InternTable | None = None
+) -> Result[Output]:
+    """Deserialize so that equal strings and frozen objects are shared.
+
+    Deserializing a list with many equal elements normally creates a
+    separate object for each of them. Here, the strings of `data` are
+    replaced by shared ones before deserializing, which all serializers that
+    return strings unchanged pass through, and each instance of a frozen
+    dataclass using `SerializableMixin` is replaced by a shared equal
+    instance once it is constructed. This uses much less memory for values
+    that are kept around and contain many duplicates.
+
+    If `table` is not provided, a new table is used for this call only.
+    """
+    if table is None:
+        table = InternTable()
+
+    token = current_intern_table.set(table)
+    try:
+        return serializer.from_data(table.intern_data(data))
+    finally:
+        current_intern_table.reset(token)
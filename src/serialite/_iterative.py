@@ -0,0 +1,517 @@
+from __future__ import annotations
+
+__all__ = ["iterative_from_data", "iterative_to_data"]
+
+from collections.abc import Callable, Generator
+from copy import copy
+from types import SimpleNamespace
+from typing import Any
+
+from ._base import Serializer
+from ._errors import Errors
+from ._fields_serializer import (
+    FieldsSerializer,
+    MultiField,
+    SingleField,
+    empty_default,
+    no_default,
+)
+from ._implementations import (
+    ListSerializer,
+    OptionalSerializer,
+    OrderedDictSerializer,
+    RawDictSerializer,
+    ReservedSerializer,
+    SetSerializer,
+    TryUnionSerializer,
+    TupleSerializer,
+)
+from ._limit_errors import MaximumDepthError
+from ._mixins import (
+    AbstractSerializableMixin,
+    SerializableMixin,
+    has_from_data_of,
+    has_to_data_of,
+)
+from ._projection import Projection, current_projection
+from ._result import Failure, Result
+
+# A handler is a generator for one container. It yields a request for each
+# child, a tuple of the child serializer, the child data or value, whether
+# the child is nested one level deeper, and the projection of the child. It
+# is sent the result of each child, or thrown its exception, and returns the
+# result of the container.
+Request = tuple[Any, Any, bool, Projection | None]
+Handler = Generator[Request, Any, Any]
+
+
+class Raised:
+    """An exception raised by a child, to be raised again when replayed."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class Replay(Serializer):
+    """Return the results of a child computed by the engine, in order.
+
+    A container is shallowly copied with its child serializers replaced by
+    replays, and then `from_data` or `to_data` of the copy is called. This
+    way, the container does all of its usual checks and error locations
+    exactly as when it is called recursively, but none of the work on its
+    children.
+    """
+
+    def __init__(self, serializer: Any, outcomes: list[Any]):
+        self.serializer = serializer
+        self.outcomes = iter(outcomes)
+
+    def from_data(self, data):
+        return next(self.outcomes)
+
+    def to_data(self, value):
+        outcome = next(self.outcomes)
+        if isinstance(outcome, Raised):
+            raise outcome.error
+        return outcome
+
+    def __str__(self) -> str:
+        return str(self.serializer)
+
+
+def replayed(container: Any, **children: Any) -> Any:
+    shadow = copy(container)
+    for name, child in children.items():
+        setattr(shadow, name, child)
+    return shadow
+
+
+def run(
+    handler_for: Callable[[Any, Any, Projection | None], Handler | None],
+    leaf: Callable[[Any, Any], Any],
+    too_deep: Callable[[int], Any],
+    serializer: Any,
+    argument: Any,
+    max_depth: int | None,
+) -> Any:
+    """Drive the handlers of the containers in a tree with a stack.
+
+    Serializers without a handler are called directly with `leaf`. A
+    container at `max_depth` or deeper is not entered; `too_deep` gives its
+    result instead.
+    """
+    stack: list[tuple[Handler, int, Projection | None]] = []
+
+    def enter(serializer: Any, argument: Any, depth: int, projection: Projection | None):
+        # Returns the outcome, or None after pushing a frame, as a tuple of
+        # the value and the exception
+        current_projection.set(projection)
+        try:
+            handler = handler_for(serializer, argument, projection)
+            # Serializers of flat containers, like lists of integers, have no
+            # handler but still count
+            is_container = handler is not None or isinstance(argument, list | tuple | set | dict)
+            if max_depth is not None and depth >= max_depth and is_container:
+                if handler is not None:
+                    handler.close()
+                return too_deep(max_depth), None
+            elif handler is None:
+                return leaf(serializer, argument), None
+            else:
+                stack.append((handler, depth, projection))
+                return None, None
+        except Exception as error:  # noqa: BLE001, passed to the parent like a recursive call
+            return None, error
+
+    token = current_projection.set(current_projection.get())
+    try:
+        value, error = enter(serializer, argument, 0, current_projection.get())
+        while stack:
+            handler, depth, projection = stack[-1]
+            current_projection.set(projection)
+            try:
+                if error is None:
+                    request = handler.send(value)
+                else:
+                    request = handler.throw(error)
+            except StopIteration as stop:
+                stack.pop()
+                value, error = stop.value, None
+                continue
+            except Exception as exception:  # noqa: BLE001, passed to the parent like a recursive call
+                stack.pop()
+                value, error = None, exception
+                continue
+
+            child_serializer, child_argument, nested, child_projection = request
+            value, error = enter(
+                child_serializer, child_argument, depth + nested, child_projection
+            )
+    finally:
+        current_projection.reset(token)
+
+    if error is not None:
+        raise error
+    return value
+
+
+def iterative_from_data[Output](
+    serializer: Serializer[Output], data: Any, *, max_depth: int | None = None
+) -> Result[Output]:
+    """Deserialize like `from_data`, but without recursion.
+
+    The lists, sets, tuples, dicts, optionals, unions, and serializable
+    classes in `serializer` are driven with an explicit stack rather than by
+    each serializer calling its children, so that data nested far deeper
+    than the recursion limit, like long chains of expression trees or
+    comment threads, can be deserialized. Each container still performs its
+    own checks, so the values and the locations of errors are the same as
+    `serializer.from_data(data)`. Other serializers, including those with a
+    custom `from_data`, are called as usual.
+
+    If `max_depth` is given, a container nested within `max_depth` other
+    containers is not deserialized and fails with a `MaximumDepthError`
+    instead, which bounds the work done on hostile input.
+    """
+    return run(
+        from_data_handler,
+        lambda serializer, data: serializer.from_data(data),
+        lambda maximum: Failure(Errors.one(MaximumDepthError(maximum))),
+        serializer,
+        data,
+        max_depth,
+    )
+
+
+def iterative_to_data[Output](
+    serializer: Serializer[Output], value: Output, *, max_depth: int | None = None
+) -> Any:
+    """Serialize like `to_data`, but without recursion.
+
+    This is the counterpart of `iterative_from_data`. If `max_depth` is
+    given, a `ValueError` is raised for a value with more nested containers.
+    """
+
+    def too_deep(maximum: int):
+        raise ValueError(f"Value has more than {maximum} nested containers")
+
+    return run(
+        to_data_handler,
+        lambda serializer, value: serializer.to_data(value),
+        too_deep,
+        serializer,
+        value,
+        max_depth,
+    )
+
+
+def from_data_handler(serializer: Any, data: Any, projection: Projection | None) -> Handler | None:
+    serializer_type = type(serializer)
+    if serializer_type is OptionalSerializer:
+        return None if data is None else delegate(serializer.element_serializer, data, projection)
+    elif serializer_type in (ListSerializer, SetSerializer):
+        if serializer.element_is_identity:
+            return None
+        return list_from_data(serializer, data, projection)
+    elif serializer_type is TupleSerializer:
+        return tuple_from_data(serializer, data, projection)
+    elif serializer_type is RawDictSerializer:
+        if serializer.items_are_identity:
+            return None
+        return raw_dict_from_data(serializer, data, projection)
+    elif serializer_type is OrderedDictSerializer:
+        return ordered_dict_from_data(serializer, data, projection)
+    elif serializer_type is TryUnionSerializer:
+        return union_from_data(serializer, data, projection)
+    elif serializer_type is ReservedSerializer:
+        return reserved_from_data(serializer, data, projection)
+    elif serializer_type is FieldsSerializer:
+        return fields_from_data(serializer, data, projection)
+    elif has_from_data_of(serializer, SerializableMixin):
+        return class_from_data(serializer, data, projection)
+    elif has_from_data_of(serializer, AbstractSerializableMixin):
+        return abstract_from_data(serializer, data, projection)
+    else:
+        return None
+
+
+def delegate(serializer: Any, argument: Any, projection: Projection | None) -> Handler:
+    return (yield serializer, argument, False, projection)
+
+
+def list_from_data(serializer, data, projection):
+    results = []
+    if isinstance(data, list):
+        for item in data:
+            results.append((yield serializer.element_serializer, item, True, projection))
+
+    element = Replay(serializer.element_serializer, results)
+    return replayed(serializer, element_serializer=element).from_data(data)
+
+
+def tuple_from_data(serializer, data, projection):
+    elements = serializer.element_serializers
+    results = []
+    if isinstance(data, list) and len(data) == len(elements):
+        for item, element in zip(data, elements, strict=True):
+            results.append((yield element, item, True, projection))
+
+    if len(results) != len(elements):
+        # The length check fails before any element is deserialized
+        return serializer.from_data(data)
+
+    replays = tuple(
+        Replay(element, [result]) for element, result in zip(elements, results, strict=True)
+    )
+    return replayed(serializer, element_serializers=replays).from_data(data)
+
+
+def raw_dict_from_data(serializer, data, projection):
+    keys = []
+    values = []
+    if isinstance(data, dict):
+        for key, value in data.items():
+            keys.append((yield serializer.key_serializer, key, True, projection))
+            values.append((yield serializer.value_serializer, value, True, projection))
+
+    return replayed(
+        serializer,
+        key_serializer=Replay(serializer.key_serializer, keys),
+        value_serializer=Replay(serializer.value_serializer, values),
+    ).from_data(data)
+
+
+def ordered_dict_from_data(serializer, data, projection):
+    keys = []
+    values = []
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, list | tuple) and len(item) == 2:
+                keys.append((yield serializer.key_serializer, item[0], True, projection))
+                values.append((yield serializer.value_serializer, item[1], True, projection))
+
+    return replayed(
+        serializer,
+        key_serializer=Replay(serializer.key_serializer, keys),
+        value_serializer=Replay(serializer.value_serializer, values),
+    ).from_data(data)
+
+
+def union_from_data(serializer, data, projection):
+    replays = []
+    for member in serializer.serializers:
+        result = yield member, data, False, projection
+        replays.append(Replay(member, [result]))
+        if not isinstance(result, Failure):
+            break
+
+    return replayed(serializer, serializers=tuple(replays)).from_data(data)
+
+
+def reserved_from_data(serializer, data, projection):
+    result = yield serializer.internal_serializer, data, False, projection
+    internal = Replay(serializer.internal_serializer, [result])
+    return replayed(serializer, internal_serializer=internal).from_data(data)
+
+
+def fields_from_data(serializer, data, projection):
+    replays = {}
+    if isinstance(data, dict):
+        for key, value in data.items():
+            object_field_name = serializer.data_name_to_object_name.get(key)
+            if object_field_name is None:
+                continue
+            if not serializer.object_field_serializers[object_field_name].writable:
+                continue
+            if projection is not None and not projection.selects(object_field_name):
+                continue
+
+            child_projection = None if projection is None else projection.child(object_field_name)
+            deserializer = serializer.data_field_deserializers[key]
+            result = yield deserializer, value, True, child_projection
+            replays[key] = Replay(deserializer, [result])
+
+    return replayed(serializer, data_field_deserializers=replays).from_data(data)
+
+
+def class_from_data(serializer, data, projection):
+    fields_serializer = serializer.__fields_serializer__
+    result = yield fields_serializer, data, False, projection
+    # A copy of the fields serializer, so that its fields can still be
+    # inspected, whose from_data is the replay
+    replay = replayed(fields_serializer, from_data=Replay(fields_serializer, [result]).from_data)
+    stand_in = ClassStandIn(serializer, replay)
+    return SerializableMixin.__dict__["from_data"].__func__(stand_in, data)
+
+
+class ClassStandIn:
+    """A class with its fields serializer replaced by a replay."""
+
+    __slots__ = ("__fields_serializer__", "cls")
+
+    def __init__(self, cls: type, fields_serializer: Any):
+        self.cls = cls
+        self.__fields_serializer__ = fields_serializer
+
+    def __call__(self, **values):
+        return self.cls(**values)
+
+
+def abstract_from_data(serializer, data, projection):
+    subclasses = serializer.__subclass_serializers__
+    type_name = data.get("_type") if isinstance(data, dict) else None
+    if isinstance(type_name, str) and type_name in subclasses:
+        subclass = subclasses[type_name]
+        subclass_data = {key: value for key, value in data.items() if key != "_type"}
+        result = yield subclass, subclass_data, False, projection
+        subclasses = subclasses | {type_name: Replay(subclass, [result])}
+
+    shadow = SimpleNamespace(__subclass_serializers__=subclasses)
+    return AbstractSerializableMixin.__dict__["from_data"].__func__(shadow, data)
+
+
+def to_data_handler(serializer: Any, value: Any, projection: Projection | None) -> Handler | None:
+    serializer_type = type(serializer)
+    if serializer_type is OptionalSerializer:
+        return (
+            None if value is None else delegate(serializer.element_serializer, value, projection)
+        )
+    elif serializer_type is ListSerializer:
+        if serializer.element_is_identity or not isinstance(value, list):
+            return None
+        return list_to_data(serializer, value, projection)
+    elif serializer_type is SetSerializer:
+        if serializer.element_is_identity or not isinstance(value, set):
+            return None
+        return list_to_data(serializer, value, projection)
+    elif serializer_type is TupleSerializer:
+        if not isinstance(value, tuple | list) or len(value) != len(
+            serializer.element_serializers
+        ):
+            return None
+        return tuple_to_data(serializer, value, projection)
+    elif serializer_type is RawDictSerializer:
+        if serializer.items_are_identity or not isinstance(value, dict):
+            return None
+        return dict_to_data(serializer, value, projection)
+    elif serializer_type is OrderedDictSerializer:
+        if not isinstance(value, dict):
+            return None
+        return dict_to_data(serializer, value, projection)
+    elif serializer_type is TryUnionSerializer:
+        return union_to_data(serializer, value, projection)
+    elif serializer_type is ReservedSerializer:
+        return reserved_to_data(serializer, value, projection)
+    elif serializer_type is FieldsSerializer:
+        return fields_to_data(serializer, value, projection, "dictionary")
+    elif has_to_data_of(serializer, SerializableMixin):
+        return fields_to_data(serializer.__fields_serializer__, value, projection, "object")
+    elif has_to_data_of(serializer, AbstractSerializableMixin):
+        if not isinstance(value, serializer) or value.to_data == serializer.to_data:
+            # Let the class raise its error
+            return None
+        return abstract_to_data(serializer, value, projection)
+    else:
+        return None
+
+
+def list_to_data(serializer, value, projection):
+    outcomes = []
+    for item in value:
+        outcomes.append((yield serializer.element_serializer, item, True, projection))
+
+    element = Replay(serializer.element_serializer, outcomes)
+    return replayed(serializer, element_serializer=element).to_data(value)
+
+
+def tuple_to_data(serializer, value, projection):
+    replays = []
+    for item, element in zip(value, serializer.element_serializers, strict=True):
+        replays.append(Replay(element, [(yield element, item, True, projection)]))
+
+    return replayed(serializer, element_serializers=tuple(replays)).to_data(value)
+
+
+def dict_to_data(serializer, value, projection):
+    keys = []
+    values = []
+    for key, item in value.items():
+        keys.append((yield serializer.key_serializer, key, True, projection))
+        values.append((yield serializer.value_serializer, item, True, projection))
+
+    return replayed(
+        serializer,
+        key_serializer=Replay(serializer.key_serializer, keys),
+        value_serializer=Replay(serializer.value_serializer, values),
+    ).to_data(value)
+
+
+def union_to_data(serializer, value, projection):
+    replays = []
+    for member in serializer.serializers:
+        try:
+            data = yield member, value, False, projection
+        except Exception as error:  # noqa: BLE001, replayed to TryUnionSerializer
+            replays.append(Replay(member, [Raised(error)]))
+        else:
+            replays.append(Replay(member, [data]))
+            break
+
+    return replayed(serializer, serializers=tuple(replays)).to_data(value)
+
+
+def reserved_to_data(serializer, value, projection):
+    if value in serializer.reserved:
+        return serializer.to_data(value)
+
+    data = yield serializer.internal_serializer, value, False, projection
+    internal = Replay(serializer.internal_serializer, [data])
+    return replayed(serializer, internal_serializer=internal).to_data(value)
+
+
+def fields_to_data(serializer: FieldsSerializer, values, projection, source):
+    # The same steps as FieldsSerializer.to_data, which only has one line per
+    # field, so it is not worth replaying
+    if source not in ("dictionary", "object"):
+        raise ValueError(f"Input argument source must be 'dictionary' or 'object' not {source!r}")
+
+    data = {}
+    for object_field_name, serializer_field in serializer.object_field_serializers.items():
+        if not serializer_field.readable:
+            continue
+        if projection is not None and not projection.selects(object_field_name):
+            continue
+
+        if source == "object":
+            value = getattr(values, object_field_name)
+        else:
+            value = values[object_field_name]
+
+        if (
+            serializer_field.hide_default
+            and serializer_field.default is not no_default
+            and serializer_field.default is not empty_default
+            and value == serializer_field.default
+        ):
+            continue
+
+        if isinstance(serializer_field, SingleField):
+            field_serializer = serializer_field.serializer
+            data_field_name = object_field_name
+        elif isinstance(serializer_field, MultiField):
+            field_serializer = serializer_field.serializers[serializer_field.to_data]
+            data_field_name = serializer_field.to_data
+        else:
+            raise TypeError(f"Expected FieldsSerializerField, not {type(serializer_field)}")
+
+        child_projection = None if projection is None else projection.child(object_field_name)
+        data[data_field_name] = yield field_serializer, value, True, child_projection
+
+    return data
+
+
+def abstract_to_data(serializer, value, projection):
+    data = yield type(value), value, False, projection
+    return {"_type": type(value).__name__} | data
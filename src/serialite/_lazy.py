@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+__all__ = ["LazyDict", "LazyList", "LazyObject", "lazy_from_data"]
+
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+from ._base import Serializer
+from ._errors import Errors
+from ._field_errors import ConflictingFieldsError, RequiredFieldError, RequiredOneOfFieldsError
+from ._fields_serializer import MultiField, empty_default, no_default
+from ._implementations import ListSerializer, OptionalSerializer, RawDictSerializer
+from ._mixins import AbstractSerializableMixin, SerializableMixin, has_from_data_of
+from ._result import Failure, Result, Success
+
+Location = tuple[str | int, ...]
+
+# A sentinel for values that have not been deserialized yet
+unset = object()
+
+
+def raise_errors_at(error: Errors, location: Location) -> None:
+    errors = Errors()
+    errors.extend(error, location=location)
+    errors.raise_on_errors()
+
+
+def located(result: Result[Any], location: Location) -> Result[Any]:
+    match result:
+        case Failure(error):
+            errors = Errors()
+            errors.extend(error, location=location)
+            return Failure(errors)
+        case Success():
+            return result
+
+
+def lazy_from_data(serializer: Serializer | Any, data: Any, *, location: Location = ()) -> Any:
+    """Deserialize `data` with `serializer`, deferring the work on subtrees.
+
+    Lists and string-keyed dicts are returned as a `LazyList` or a `LazyDict`
+    and instances of classes using `SerializableMixin` as a `LazyObject`.
+    Each of these deserializes an element, value, or field only when it is
+    first accessed and caches the result, so the work done is proportional
+    to the parts of `data` that are used. Everything else is deserialized
+    immediately.
+
+    Errors cannot be returned from attribute or item access, so an invalid
+    subtree raises a `ValidationExceptionGroup` when it is accessed. Error
+    locations are relative to the outermost data, as `location` is prefixed
+    to each of them. Errors in parts that are never accessed are never
+    found. `materialize()` on a lazy value deserializes it completely and
+    returns a `Result` with all errors, exactly like `from_data`.
+    """
+    if isinstance(serializer, OptionalSerializer):
+        if data is None:
+            return None
+        else:
+            return lazy_from_data(serializer.element_serializer, data, location=location)
+    elif (
+        type(serializer) is ListSerializer
+        and not serializer.element_is_identity
+        and isinstance(data, list)
+    ):
+        return LazyList(serializer, data, location)
+    elif (
+        type(serializer) is RawDictSerializer
+        and getattr(serializer.key_serializer, "is_identity", False)
+        and not getattr(serializer.value_serializer, "is_identity", False)
+        and isinstance(data, dict)
+    ):
+        return LazyDict(serializer, data, location)
+    elif has_from_data_of(serializer, SerializableMixin) and isinstance(data, dict):
+        return LazyObject(serializer, data, location)
+    elif (
+        has_from_data_of(serializer, AbstractSerializableMixin)
+        and isinstance(data, dict)
+        and data.get("_type") in serializer.__subclass_serializers__
+    ):
+        subclass = serializer.__subclass_serializers__[data["_type"]]
+        subclass_data = {key: value for key, value in data.items() if key != "_type"}
+        return lazy_from_data(subclass, subclass_data, location=location)
+
+    match serializer.from_data(data):
+        case Failure(error):
+            raise_errors_at(error, location)
+        case Success(value):
+            return value
+
+
+class LazyValue:
+    """Base class of the proxies returned by `lazy_from_data`."""
+
+    __slots__ = ("_data", "_location", "_materialized", "_serializer")
+
+    def __init__(self, serializer: Any, data: Any, location: Location):
+        self._serializer = serializer
+        self._data = data
+        self._location = location
+        self._materialized = unset
+
+    def materialize(self) -> Result[Any]:
+        """Deserialize the whole value, reporting all errors."""
+        if self._materialized is unset:
+            self._materialized = located(self._serializer.from_data(self._data), self._location)
+        return self._materialized
+
+
+class LazyList(LazyValue, Sequence):
+    """A list whose elements are deserialized on first access."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, serializer: ListSerializer, data: list, location: Location):
+        super().__init__(serializer, data, location)
+        self._values = [unset] * len(data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        value = self._values[index]
+        if value is unset:
+            i = range(len(self))[index]
+            value = lazy_from_data(
+                self._serializer.element_serializer, self._data[i], location=(*self._location, i)
+            )
+            self._values[i] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"LazyList(<{len(self)} elements>)"
+
+
+class LazyDict(LazyValue, Mapping):
+    """A string-keyed dict whose values are deserialized on first access."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, serializer: RawDictSerializer, data: dict, location: Location):
+        super().__init__(serializer, data, location)
+        self._values = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __getitem__(self, key: str):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        raw_value = self._data[key]
+        location = (*self._location, key)
+        match self._serializer.key_serializer.from_data(key):
+            case Failure(error):
+                raise_errors_at(error, location)
+
+        value = lazy_from_data(self._serializer.value_serializer, raw_value, location=location)
+        self._values[key] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"LazyDict(<{len(self)} items>)"
+
+
+class LazyObject(LazyValue):
+    """An instance of a `SerializableMixin` class whose fields are
+    deserialized on first access.
+
+    Attributes that are not fields, such as methods and properties, are
+    looked up on the materialized instance, which raises a
+    `ValidationExceptionGroup` if any part of the data is invalid.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, cls: type, data: dict, location: Location):
+        super().__init__(cls, data, location)
+        self._values = {}
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not found normally, that is, not slots
+        # or methods of the proxy itself
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        field = self._serializer.__fields_serializer__.object_field_serializers.get(name)
+        if field is None or not field.writable:
+            match self.materialize():
+                case Failure(error):
+                    raise_errors_at(error, ())
+                case Success(value):
+                    return getattr(value, name)
+
+        if isinstance(field, MultiField):
+            data_names = [data_name for data_name in field.serializers if data_name in self._data]
+        else:
+            data_names = [name] if name in self._data else []
+
+        if len(data_names) == 1:
+            (data_name,) = data_names
+            field_serializer = (
+                field.serializers[data_name] if isinstance(field, MultiField) else field.serializer
+            )
+            value = lazy_from_data(
+                field_serializer, self._data[data_name], location=(*self._location, data_name)
+            )
+        elif len(data_names) == 0 and field.default is not no_default:
+            if field.default is empty_default:
+                raise AttributeError(name)
+            value = field.default
+        elif len(data_names) == 0:
+            if isinstance(field, MultiField):
+                error = RequiredOneOfFieldsError(list(field.serializers.keys()))
+            else:
+                error = RequiredFieldError(name)
+            raise_errors_at(Errors.one(error, location=[name]), self._location)
+        else:
+            # Report the conflict on the last key, as FieldsSerializer does
+            *preexisting_keys, key = [
+                data_name for data_name in self._data if data_name in data_names
+            ]
+            raise_errors_at(
+                Errors.one(ConflictingFieldsError(key, preexisting_keys), location=[key]),
+                self._location,
+            )
+
+        self._values[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"LazyObject({self._serializer.__name__})"
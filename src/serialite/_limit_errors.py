@@ -0,0 +1,61 @@
+__all__ = [
+    "ElementBudgetError",
+    "MaximumDepthError",
+    "MaximumKeysError",
+    "MaximumLengthError",
+    "MaximumStringLengthError",
+]
+
+from dataclasses import dataclass
+
+from ._decorators import serializable
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class MaximumDepthError(Exception):
+    maximum: int
+
+    def __str__(self) -> str:
+        return f"Expected at most {self.maximum} nested containers, but got more"
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class MaximumLengthError(Exception):
+    maximum: int
+    actual_length: int
+
+    def __str__(self) -> str:
+        return f"Expected list of at most {self.maximum} elements, but got {self.actual_length}"
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class MaximumStringLengthError(Exception):
+    maximum: int
+    actual_length: int
+
+    def __str__(self) -> str:
+        return (
+            f"Expected string of at most {self.maximum} characters, but got {self.actual_length}"
+        )
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class MaximumKeysError(Exception):
+    maximum: int
+    actual_length: int
+
+    def __str__(self) -> str:
+        return f"Expected dictionary of at most {self.maximum} keys, but got {self.actual_length}"
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class ElementBudgetError(Exception):
+    maximum: int
+
+    def __str__(self) -> str:
+        return f"Expected at most {self.maximum} elements in total, but got more"
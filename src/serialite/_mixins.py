@@ -4,8 +4,11 @@ from typing import Any, ClassVar, Self
 
 from ._base import Serializable, SerializerToRef
 from ._errors import Errors
-from ._fields_serializer import FieldsSerializer
+from ._fields_serializer import FieldsSerializer, no_default
+from ._graph import current_graph_reader, current_graph_writer
+from ._intern import current_intern_table
 from ._openapi import is_openapi_component
+from ._projection import current_projection
 from ._result import Failure, Result, Success
 
 
@@ -20,13 +23,42 @@ class SerializableMixin(Serializable):
 
     @classmethod
     def from_data(cls, data: Any) -> Result[Self]:
+        reader = current_graph_reader.get()
+        if reader is not None and reader.is_node(data):
+            return reader.read(cls, data, abstract=False)
+
         match cls.__fields_serializer__.from_data(data):
             case Failure(error):
                 return Failure(error)
             case Success(value):
-                return Success(cls(**value))
+                if current_projection.get() is not None:
+                    errors = unprojected_fields(cls.__fields_serializer__, value)
+                    if not errors.is_empty():
+                        return Failure(errors)
+
+                instance = cls(**value)
+                table = current_intern_table.get()
+                if table is not None:
+                    instance = table.share(instance)
+                return Success(instance)
+
+    @classmethod
+    def lazy_from_data(cls, data: Any) -> Self:
+        """Deserialize lazily, deserializing each field on first access.
+
+        See `serialite.lazy_from_data`.
+        """
+        from ._lazy import lazy_from_data
+
+        return lazy_from_data(cls, data)
 
     def to_data(self) -> dict[str, Any]:
+        writer = current_graph_writer.get()
+        if writer is not None:
+            return writer.write(
+                self, lambda: self.__fields_serializer__.to_data(self, source="object")
+            )
+
         return self.__fields_serializer__.to_data(self, source="object")
 
     is_openapi_component: bool = True
@@ -59,6 +91,25 @@ class SerializableMixin(Serializable):
             return serializer_to_ref(cls)
 
 
+def unprojected_fields(fields_serializer: FieldsSerializer, values: dict[str, Any]) -> Errors:
+    """Report the fields without a default that a projection left out.
+
+    The class cannot be constructed without them, even though the fields
+    serializer alone succeeds.
+    """
+    from ._field_errors import UnprojectedFieldError
+
+    errors = Errors()
+    for object_field_name, serializer_field in fields_serializer.object_field_serializers.items():
+        if (
+            object_field_name not in values
+            and serializer_field.writable
+            and serializer_field.default is no_default
+        ):
+            errors.add(UnprojectedFieldError(object_field_name), location=[object_field_name])
+    return errors
+
+
 class AbstractSerializableMixin(Serializable):
     """Provides Serializable for abstract base classes.
 
@@ -80,6 +131,10 @@ class AbstractSerializableMixin(Serializable):
 
     @classmethod
     def from_data(cls, data):
+        reader = current_graph_reader.get()
+        if reader is not None and reader.is_node(data):
+            return reader.read(cls, data, abstract=True)
+
         try:
             type_name = data["_type"]
         except KeyError:
@@ -119,6 +174,10 @@ class AbstractSerializableMixin(Serializable):
                 f" {value}.This likely do to a failure to implement to_data on {type(value)}"
             )
 
+        writer = current_graph_writer.get()
+        if writer is not None:
+            return writer.tag(value.__class__.__name__, value.to_data())
+
         return {"_type": value.__class__.__name__} | value.to_data()
 
     is_openapi_component: bool = True
@@ -153,3 +212,27 @@ class AbstractSerializableMixin(Serializable):
             return schema
         else:
             return serializer_to_ref(cls)
+
+
+def has_from_data_of(serializer: Any, mixin: type[Serializable]) -> bool:
+    """Whether `serializer` deserializes with the `from_data` of `mixin`.
+
+    Classes decorated with `serializable` that could not inherit from
+    `SerializableMixin` have its `from_data` copied onto them, so this is
+    more reliable than `issubclass`. A class overriding `from_data` does not
+    count, as its data may have any structure.
+    """
+    function = getattr(getattr(serializer, "from_data", None), "__func__", None)
+    return function is mixin.__dict__["from_data"].__func__
+
+
+def has_to_data_of(serializer: Any, mixin: type[Serializable]) -> bool:
+    """Whether `serializer` serializes with the `to_data` of `mixin`.
+
+    This is the counterpart of `has_from_data_of`. A class whose `to_data` is
+    wrapped, like by `cache_to_data`, does not count.
+    """
+    function = getattr(serializer, "to_data", None)
+    function = getattr(function, "__func__", function)
+    expected = mixin.__dict__["to_data"]
+    return function is getattr(expected, "__func__", expected)
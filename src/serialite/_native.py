@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+__all__ = ["native_types"]
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+from uuid import UUID
+
+# The types that serializers pass through unchanged instead of converting to
+# strings. Empty means that all data is JSON data, which is the fast path.
+current_native_types: ContextVar[frozenset[type]] = ContextVar("native_types", default=frozenset())
+
+supported_native_types = frozenset({bytes, date, datetime, UUID})
+
+
+@contextmanager
+def native_types(*types: type) -> Iterator[None]:
+    """Pass values of `types` through serializers as native data.
+
+    Within this context, `DateTimeSerializer`, `DateSerializer`,
+    `UuidSerializer`, and `BytesSerializer` return the value itself from
+    `to_data` if its type is in `types` and accept such a value in
+    `from_data`, instead of formatting and parsing a string. This is for
+    data formats that can represent these types directly, like MessagePack,
+    where the string conversion is wasted work. Data that is a string is
+    still accepted.
+
+    Caches of `to_data` are bypassed within this context, as the data is
+    different.
+    """
+    unsupported = set(types) - supported_native_types
+    if unsupported:
+        names = ", ".join(sorted(t.__name__ for t in unsupported))
+        raise TypeError(f"Unsupported native types: {names}")
+
+    token = current_native_types.set(current_native_types.get() | frozenset(types))
+    try:
+        yield
+    finally:
+        current_native_types.reset(token)
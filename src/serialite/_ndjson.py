@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+__all__ = ["InvalidJsonError", "read_ndjson", "write_ndjson"]
+
+import gzip
+import io
+import json
+import lzma
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import partial
+from itertools import batched
+from pathlib import Path
+from typing import IO, Any, Literal
+
+from ._base import Serializer
+from ._decorators import serializable
+from ._errors import Errors
+from ._result import Failure, Result, Success
+
+type Source = str | os.PathLike[str] | IO[bytes] | IO[str]
+type Compression = Literal["infer", "gzip", "lzma"] | None
+
+compression_suffixes = {".gz": "gzip", ".xz": "lzma", ".lzma": "lzma"}
+compression_magic = {b"\x1f\x8b": "gzip", b"\xfd7zXZ": "lzma"}
+
+# NaN and infinities are written as JavaScript literals, as FloatSerializer
+# passes them through and json.loads reads them back
+encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def infer_compression(source: Any, mode: str, compression: Compression) -> str | None:
+    if compression != "infer":
+        return compression
+    elif isinstance(source, str | os.PathLike):
+        return compression_suffixes.get(Path(source).suffix.lower())
+    elif mode == "r" and hasattr(source, "peek"):
+        # A buffered binary stream, whose first bytes can be seen without
+        # consuming them
+        start = source.peek(6)
+        for magic, name in compression_magic.items():
+            if start.startswith(magic):
+                return name
+    return None
+
+
+def open_binary(stack: ExitStack, source: Source, mode: str, compression: Compression) -> IO[Any]:
+    """Open a path or wrap a stream, decompressing or compressing it."""
+    if isinstance(source, str | os.PathLike):
+        # Closed by the stack
+        stream = stack.enter_context(Path(source).open(mode + "b"))  # noqa: SIM115
+    else:
+        stream = source
+
+    compression = infer_compression(source, mode, compression)
+    if compression is None:
+        return stream
+    elif isinstance(stream, io.TextIOBase):
+        raise ValueError(f"Compression {compression!r} requires a binary stream")
+    elif compression == "gzip":
+        return stack.enter_context(gzip.GzipFile(fileobj=stream, mode=mode))
+    elif compression == "lzma":
+        return stack.enter_context(lzma.LZMAFile(stream, mode=mode))
+    else:
+        raise ValueError(f"Unknown compression {compression!r}")
+
+
+def load_line(line: bytes | str) -> Result[Any]:
+    """Parse one line of JSON, failing with an `InvalidJsonError`."""
+    try:
+        return Success(json.loads(line))
+    except ValueError as error:
+        # Includes UnicodeDecodeError
+        message = error.msg if isinstance(error, json.JSONDecodeError) else str(error)
+        return Failure(Errors.one(InvalidJsonError(message)))
+
+
+def decode_line[Output](serializer: Serializer[Output], line: bytes | str) -> Result[Output]:
+    match load_line(line):
+        case Failure(errors):
+            return Failure(errors)
+        case Success(data):
+            return serializer.from_data(data)
+
+
+def read_ndjson[Output](
+    source: Source,
+    serializer: Serializer[Output] | Any,
+    *,
+    compression: Compression = "infer",
+    executor: Executor | None = None,
+    chunk_size: int = 1_000,
+) -> Iterator[Result[Output]]:
+    """Deserialize each line of newline-delimited JSON.
+
+    `source` is a path or an open binary or text stream, which is not closed.
+    A `Result` is yielded for each line that is not blank, in order. Errors
+    are located at the 1-based line number in the file, followed by their
+    location within the line, and a line that is not valid JSON fails with
+    an `InvalidJsonError`. A failure in one line does not affect the others.
+
+    If `compression` is `"infer"`, files ending in `.gz` are read with
+    `gzip` and those ending in `.xz` or `.lzma` with `lzma`, and buffered
+    binary streams are recognized by their first bytes. It may also be
+    given as `"gzip"`, `"lzma"`, or `None`.
+
+    The file is read through a buffer in chunks of `chunk_size` lines, so
+    that files larger than memory can be processed. If `executor` is given,
+    the lines of each chunk are parsed and deserialized on it, which requires
+    `serializer` and the values to be picklable for a process pool.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+
+    if not isinstance(serializer, Serializer):
+        from . import serializer as lookup_serializer
+
+        serializer = lookup_serializer(serializer)
+
+    decode = partial(decode_line, serializer)
+    with ExitStack() as stack:
+        stream = open_binary(stack, source, "r", compression)
+        for chunk in batched(enumerate(stream, start=1), chunk_size):
+            lines = [(number, line) for number, line in chunk if not line.isspace()]
+            if executor is None:
+                results = map(decode, [line for _, line in lines])
+            else:
+                results = executor.map(decode, [line for _, line in lines])
+
+            for (number, _), result in zip(lines, results, strict=True):
+                match result:
+                    case Failure(errors):
+                        located = Errors()
+                        located.extend(errors, location=[number])
+                        yield Failure(located)
+                    case Success():
+                        yield result
+
+
+def encode_value[Output](serializer: Serializer[Output], value: Output) -> str:
+    return encoder.encode(serializer.to_data(value)) + "\n"
+
+
+def write_ndjson[Output](
+    destination: Source,
+    serializer: Serializer[Output] | Any,
+    values: Iterable[Output],
+    *,
+    compression: Compression = "infer",
+    executor: Executor | None = None,
+    chunk_size: int = 1_000,
+) -> int:
+    """Serialize each value as one line of newline-delimited JSON.
+
+    `destination` is a path, which is overwritten, or an open binary or text
+    stream, which is not closed. Each line is compact JSON of
+    `serializer.to_data` of a value, with NaN and infinities written as
+    `NaN`, `Infinity`, and `-Infinity` as `read_ndjson` accepts them. The
+    number of lines written is returned.
+
+    `compression` is as in `read_ndjson`, except that it can only be
+    inferred from paths. The values are consumed and written in chunks of
+    `chunk_size` lines, each with a single write. If `executor` is given, the
+    values of each chunk are serialized on it.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+
+    if not isinstance(serializer, Serializer):
+        from . import serializer as lookup_serializer
+
+        serializer = lookup_serializer(serializer)
+
+    encode = partial(encode_value, serializer)
+    count = 0
+    with ExitStack() as stack:
+        stream = open_binary(stack, destination, "w", compression)
+        is_text = isinstance(stream, io.TextIOBase)
+        for chunk in batched(values, chunk_size):
+            lines = map(encode, chunk) if executor is None else executor.map(encode, chunk)
+            text = "".join(lines)
+            stream.write(text if is_text else text.encode())
+            count += len(chunk)
+
+    return count
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class InvalidJsonError(Exception):
+    message: str
+
+    def __str__(self) -> str:
+        return f"Expected valid JSON, but got error {self.message!r}"
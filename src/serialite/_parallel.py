@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+__all__ = ["from_data_many", "parallel_from_data"]
+
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from ._base import Serializer
+from ._errors import ErrorElement, Errors
+from ._result import Failure, Result, Success
+
+
+def chunk_bounds(length: int, chunk_size: int) -> list[tuple[int, int]]:
+    """Split `range(length)` into consecutive `(start, stop)` pairs."""
+    return [(start, min(start + chunk_size, length)) for start in range(0, length, chunk_size)]
+
+
+def merge_chunk_results(
+    results: Sequence[Result[list[Any]]], offsets: Sequence[int]
+) -> Result[list[Any]]:
+    """Concatenate the results of deserializing consecutive chunks of a list.
+
+    Each chunk was deserialized as a list on its own, so the first element of
+    each error location is an index into the chunk. It is shifted by the
+    offset of the chunk so that it becomes an index into the full list.
+    """
+    errors = Errors()
+    values = []
+    for result, offset in zip(results, offsets, strict=True):
+        match result:
+            case Failure(error):
+                for element in error.errors:
+                    index, *rest = element.location
+                    errors.errors.append(
+                        ErrorElement(element.error, location=(index + offset, *rest))
+                    )
+            case Success(value):
+                values.extend(value)
+
+    if not errors.is_empty():
+        return Failure(errors)
+    else:
+        return Success(values)
+
+
+def ndjson_chunk_from_data[Element](
+    serializer: Serializer[list[Element]], lines: list[bytes] | list[str]
+) -> Result[list[Element]]:
+    """Parse lines of JSON and deserialize them as a list with `serializer`.
+
+    Lines that are not valid JSON fail with an `InvalidJsonError` at their
+    index, and the other lines are still deserialized, with their error
+    locations shifted back to the index of their line.
+    """
+    from ._ndjson import load_line
+
+    errors = Errors()
+    indexes = []
+    elements = []
+    for i, line in enumerate(lines):
+        match load_line(line):
+            case Failure(error):
+                errors.extend(error, location=[i])
+            case Success(element):
+                indexes.append(i)
+                elements.append(element)
+
+    match serializer.from_data(elements):
+        case Failure(error):
+            for element in error.errors:
+                index, *rest = element.location
+                errors.errors.append(ErrorElement(element.error, location=(indexes[index], *rest)))
+        case Success(values):
+            pass
+
+    if not errors.is_empty():
+        # Report errors in the order of the lines
+        errors.errors.sort(key=lambda element: element.location[0])
+        return Failure(errors)
+    else:
+        return Success(values)
+
+
+def parallel_from_data[Element](
+    serializer: Serializer[list[Element]],
+    data: Any,
+    *,
+    executor: Executor | None = None,
+    chunk_size: int = 10_000,
+) -> Result[list[Element]]:
+    """Deserialize a large list in chunks across a pool of workers.
+
+    `serializer` must deserialize each element of a list independently of the
+    others, such as `ListSerializer`. The list is split into chunks of
+    `chunk_size` elements, each chunk is deserialized by `serializer` on
+    `executor`, and the results are concatenated. Error locations are
+    reported relative to the full list, exactly as `serializer.from_data`
+    would report them.
+
+    `data` may also be a batch of newline-delimited JSON as `str` or
+    `bytes`, in which case each line that is not blank is an element of the
+    list. The lines are parsed on `executor` as well, and a line that is not
+    valid JSON fails with an `InvalidJsonError` at the index of its element.
+    Use `read_ndjson` for files that do not fit in memory.
+
+    If `executor` is not provided, a `ProcessPoolExecutor` is created for the
+    duration of the call. With a process pool, `serializer`, the data, and the
+    deserialized values must all be picklable. Data that is not a list or that
+    fits in a single chunk is deserialized in the current thread.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+
+    if isinstance(data, str | bytes):
+        newline = "\n" if isinstance(data, str) else b"\n"
+        data = [line for line in data.split(newline) if not line.isspace() and line]
+        chunk_from_data = partial(ndjson_chunk_from_data, serializer)
+    else:
+        chunk_from_data = serializer.from_data
+
+    if not isinstance(data, list) or len(data) <= chunk_size:
+        return chunk_from_data(data)
+
+    bounds = chunk_bounds(len(data), chunk_size)
+    chunks = [data[start:stop] for start, stop in bounds]
+    offsets = [start for start, _ in bounds]
+
+    if executor is None:
+        with ProcessPoolExecutor() as owned_executor:
+            results = list(owned_executor.map(chunk_from_data, chunks))
+    else:
+        results = list(executor.map(chunk_from_data, chunks))
+
+    return merge_chunk_results(results, offsets)
+
+
+def from_data_many[Output](
+    serializer: Serializer[Output],
+    items: Iterable[Any],
+    *,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+) -> list[Result[Output]]:
+    """Deserialize many independent payloads concurrently.
+
+    Each item of `items` is deserialized by `serializer` on its own, and the
+    results are returned in the same order as `items`. Unlike
+    `parallel_from_data`, a failure in one item does not affect the others.
+
+    If `executor` is not provided, a `ThreadPoolExecutor` with `max_workers`
+    threads is created for the duration of the call. The state that calls
+    share is safe to use from many threads: the dispatch cache of
+    `serializer` is locked on misses and registration, the `LruCache` of
+    `cache_to_data`, `cache_from_data`, and `CachedSerializer` is locked on
+    every access, and an `InternTable` only adds entries with the atomic
+    `dict.setdefault`. So on free-threaded builds of Python the threads
+    deserialize in parallel without needing to pickle anything.
+    """
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as owned_executor:
+            return list(owned_executor.map(serializer.from_data, items))
+    else:
+        return list(executor.map(serializer.from_data, items))
@@ -0,0 +1,514 @@
+__all__ = ["InvalidPatchOperationError", "PatchPathError", "apply_patch", "diff_to_data"]
+
+from dataclasses import dataclass
+from typing import Any
+
+from ._base import Serializer
+from ._decorators import serializable
+from ._errors import Errors
+from ._field_errors import RequiredFieldError
+from ._fields_serializer import FieldsSerializer, MultiField, empty_default, no_default
+from ._implementations import (
+    BooleanListSerializer,
+    FloatListSerializer,
+    IntegerListSerializer,
+    ListSerializer,
+    OptionalSerializer,
+    RawDictSerializer,
+    StringListSerializer,
+    TupleSerializer,
+)
+from ._mixins import (
+    AbstractSerializableMixin,
+    SerializableMixin,
+    has_from_data_of,
+    has_to_data_of,
+)
+from ._result import Failure, Result, Success
+from ._type_errors import ExpectedDictionaryError, ExpectedListError, ExpectedStringError
+
+operations = frozenset({"add", "remove", "replace"})
+
+# The fast lists of primitives have the same data as ListSerializer, so their
+# elements are diffed and patched individually too
+list_serializer_types = frozenset(
+    {
+        ListSerializer,
+        IntegerListSerializer,
+        FloatListSerializer,
+        StringListSerializer,
+        BooleanListSerializer,
+    }
+)
+
+
+def diff_to_data[Output](serializer: Serializer[Output], old: Output, new: Output) -> list[Any]:
+    """Compute a JSON Patch from the data of `old` to the data of `new`.
+
+    The patch is a list of RFC 6902 operations that transforms
+    `serializer.to_data(old)` into `serializer.to_data(new)`. It is computed
+    by walking `serializer` and both values together, so that only the
+    fields, elements, and entries that changed are serialized. Subtrees that
+    are the same object in `old` and `new` are skipped without being
+    compared, which makes diffing a new version of a large immutable document
+    cheap. The fields of serializable classes, lists, tuples, and dicts are
+    diffed individually; other values are replaced whole if their data
+    differs.
+    """
+    patch = []
+    diff(serializer, old, new, [], patch)
+    return patch
+
+
+def diff(serializer: Any, old: Any, new: Any, path: list[Any], patch: list[Any]) -> None:
+    if old is new:
+        return
+
+    serializer_type = type(serializer)
+    if has_to_data_of(serializer, SerializableMixin):
+        if type(old) is type(new):
+            diff_fields(serializer.__fields_serializer__, old, new, "object", path, patch)
+            return
+    elif has_to_data_of(serializer, AbstractSerializableMixin):
+        if type(old) is type(new) and has_to_data_of(type(new), SerializableMixin):
+            diff_fields(type(new).__fields_serializer__, old, new, "object", path, patch)
+            return
+    elif serializer_type is FieldsSerializer:
+        if isinstance(old, dict) and isinstance(new, dict):
+            diff_fields(serializer, old, new, "dictionary", path, patch)
+            return
+    elif serializer_type is OptionalSerializer:
+        if old is not None and new is not None:
+            diff(serializer.element_serializer, old, new, path, patch)
+            return
+    elif serializer_type in list_serializer_types:
+        if isinstance(old, list) and isinstance(new, list):
+            diff_list(serializer, old, new, path, patch)
+            return
+    elif serializer_type is TupleSerializer:
+        if len(old) == len(new) == len(serializer.element_serializers):
+            for i, element_serializer in enumerate(serializer.element_serializers):
+                diff(element_serializer, old[i], new[i], [*path, i], patch)
+            return
+    elif serializer_type is RawDictSerializer and isinstance(old, dict) and isinstance(new, dict):
+        diff_dict(serializer, old, new, path, patch)
+        return
+
+    new_data = serializer.to_data(new)
+    if serializer.to_data(old) != new_data:
+        patch.append({"op": "replace", "path": pointer(path), "value": new_data})
+
+
+def diff_fields(
+    serializer: FieldsSerializer,
+    old: Any,
+    new: Any,
+    source: str,
+    path: list[Any],
+    patch: list[Any],
+) -> None:
+    # The same decisions as FieldsSerializer.to_data for each field
+    for object_field_name, serializer_field in serializer.object_field_serializers.items():
+        if not serializer_field.readable:
+            continue
+
+        if source == "object":
+            old_value = getattr(old, object_field_name)
+            new_value = getattr(new, object_field_name)
+        else:
+            old_value = old[object_field_name]
+            new_value = new[object_field_name]
+
+        if old_value is new_value:
+            continue
+
+        if isinstance(serializer_field, MultiField):
+            data_field_name = serializer_field.to_data
+            field_serializer = serializer_field.serializers[data_field_name]
+        else:
+            data_field_name = object_field_name
+            field_serializer = serializer_field.serializer
+
+        field_path = [*path, data_field_name]
+        old_shown = not is_hidden(serializer_field, old_value)
+        new_shown = not is_hidden(serializer_field, new_value)
+        if old_shown and new_shown:
+            diff(field_serializer, old_value, new_value, field_path, patch)
+        elif new_shown:
+            value_data = field_serializer.to_data(new_value)
+            patch.append({"op": "add", "path": pointer(field_path), "value": value_data})
+        elif old_shown:
+            patch.append({"op": "remove", "path": pointer(field_path)})
+
+
+def is_hidden(serializer_field: Any, value: Any) -> bool:
+    return (
+        serializer_field.hide_default
+        and serializer_field.default is not no_default
+        and serializer_field.default is not empty_default
+        and value == serializer_field.default
+    )
+
+
+def diff_list(
+    serializer: ListSerializer, old: list[Any], new: list[Any], path: list[Any], patch: list[Any]
+) -> None:
+    element_serializer = serializer.element_serializer
+
+    list_patch = []
+    common = min(len(old), len(new))
+    for i in range(common):
+        diff(element_serializer, old[i], new[i], [*path, i], list_patch)
+    for i in reversed(range(common, len(old))):
+        list_patch.append({"op": "remove", "path": pointer([*path, i])})
+    for item in new[common:]:
+        value_data = element_serializer.to_data(item)
+        list_patch.append({"op": "add", "path": pointer([*path, "-"]), "value": value_data})
+
+    if len(list_patch) > len(new):
+        # Such as after an insertion near the front, when replacing the list
+        # is smaller than changing every element
+        patch.append({"op": "replace", "path": pointer(path), "value": serializer.to_data(new)})
+    else:
+        patch.extend(list_patch)
+
+
+def diff_dict(
+    serializer: RawDictSerializer,
+    old: dict[Any, Any],
+    new: dict[Any, Any],
+    path: list[Any],
+    patch: list[Any],
+) -> None:
+    key_serializer = serializer.key_serializer
+    value_serializer = serializer.value_serializer
+
+    for key, old_value in old.items():
+        key_path = [*path, key_serializer.to_data(key)]
+        if key in new:
+            diff(value_serializer, old_value, new[key], key_path, patch)
+        else:
+            patch.append({"op": "remove", "path": pointer(key_path)})
+
+    for key, new_value in new.items():
+        if key not in old:
+            key_path = [*path, key_serializer.to_data(key)]
+            value_data = value_serializer.to_data(new_value)
+            patch.append({"op": "add", "path": pointer(key_path), "value": value_data})
+
+
+def pointer(path: list[Any]) -> str:
+    return "".join("/" + str(token).replace("~", "~0").replace("/", "~1") for token in path)
+
+
+def apply_patch[Output](
+    serializer: Serializer[Output], value: Output, patch: Any
+) -> Result[Output]:
+    """Apply a JSON Patch to `value`, as if to its data.
+
+    The result is the same as deserializing the data of `value` with the
+    patch applied, but only the values at the paths of the operations are
+    deserialized, and only the objects, lists, and dicts containing them are
+    rebuilt. Everything else is shared with `value`, which is not modified.
+    The `add`, `remove`, and `replace` operations of RFC 6902 are supported.
+    Removing a field of a serializable class sets it to its default.
+
+    The operations are applied in order. The first invalid operation fails
+    the patch with errors located at its index in the patch: an
+    `InvalidPatchOperationError` for an unsupported operation, a
+    `PatchPathError` for a path that does not exist in the data, or the
+    errors of deserializing its value.
+    """
+    if not isinstance(patch, list):
+        return Failure(Errors.one(ExpectedListError(patch)))
+
+    for i, operation in enumerate(patch):
+        if not isinstance(operation, dict):
+            return Failure(Errors.one(ExpectedDictionaryError(operation), location=[i]))
+
+        op = operation.get("op")
+        if op not in operations:
+            return Failure(Errors.one(InvalidPatchOperationError(op), location=[i, "op"]))
+
+        path = operation.get("path")
+        if not isinstance(path, str):
+            return Failure(Errors.one(ExpectedStringError(path), location=[i, "path"]))
+
+        if op != "remove" and "value" not in operation:
+            return Failure(Errors.one(RequiredFieldError("value"), location=[i]))
+
+        tokens = parse_pointer(path)
+        try:
+            if tokens is None:
+                raise LookupError(path)
+            result = apply_at(serializer, value, tokens, op, operation.get("value"))
+        except LookupError:
+            return Failure(Errors.one(PatchPathError(path), location=[i, "path"]))
+
+        match result:
+            case Failure(errors):
+                located = Errors()
+                located.extend(errors, location=[i])
+                return Failure(located)
+            case Success(value):
+                pass
+
+    return Success(value)
+
+
+def parse_pointer(path: str) -> list[str] | None:
+    if path == "":
+        return []
+    elif not path.startswith("/"):
+        return None
+    else:
+        return [token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")]
+
+
+def parse_index(token: str, length: int) -> int:
+    if not (token.isascii() and token.isdigit()) or (len(token) > 1 and token[0] == "0"):
+        raise LookupError(token)
+    index = int(token)
+    if index >= length:
+        raise LookupError(token)
+    return index
+
+
+def deserialize(serializer: Any, data: Any) -> Result[Any]:
+    # Errors in the value are located within the value of the operation
+    match serializer.from_data(data):
+        case Failure(errors):
+            located = Errors()
+            located.extend(errors, location=["value"])
+            return Failure(located)
+        case success:
+            return success
+
+
+def apply_at(serializer: Any, value: Any, tokens: list[str], op: str, data: Any) -> Result[Any]:
+    """Apply one operation at `tokens` within `value`.
+
+    A `LookupError` is raised if the path does not exist.
+    """
+    if len(tokens) == 0:
+        if op == "remove":
+            raise LookupError
+        return deserialize(serializer, data)
+
+    serializer_type = type(serializer)
+    if is_serializable_class(serializer, SerializableMixin) and isinstance(value, serializer):
+        return apply_fields(serializer.__fields_serializer__, serializer, value, tokens, op, data)
+    elif is_serializable_class(serializer, AbstractSerializableMixin) and isinstance(
+        value, serializer
+    ):
+        concrete = type(value)
+        if tokens[0] != "_type" and is_serializable_class(concrete, SerializableMixin):
+            return apply_fields(concrete.__fields_serializer__, concrete, value, tokens, op, data)
+    elif serializer_type is FieldsSerializer and isinstance(value, dict):
+        return apply_fields(serializer, dict, value, tokens, op, data)
+    elif serializer_type is OptionalSerializer:
+        if value is None:
+            raise LookupError
+        return apply_at(serializer.element_serializer, value, tokens, op, data)
+    elif serializer_type in list_serializer_types and isinstance(value, list):
+        return apply_list(serializer, value, tokens, op, data)
+    elif serializer_type is TupleSerializer and isinstance(value, tuple):
+        return apply_tuple(serializer, value, tokens, op, data)
+    elif serializer_type is RawDictSerializer and isinstance(value, dict):
+        return apply_dict(serializer, value, tokens, op, data)
+
+    # The structure of the data of other serializers is not known, so the
+    # operation is applied to the data, which is deserialized again
+    return deserialize(serializer, patch_data(serializer.to_data(value), tokens, op, data))
+
+
+def is_serializable_class(serializer: Any, mixin: type) -> bool:
+    return has_to_data_of(serializer, mixin) and has_from_data_of(serializer, mixin)
+
+
+def apply_fields(
+    serializer: FieldsSerializer,
+    construct: Any,
+    value: Any,
+    tokens: list[str],
+    op: str,
+    data: Any,
+) -> Result[Any]:
+    token, rest = tokens[0], tokens[1:]
+    object_field_name = serializer.data_name_to_object_name.get(token)
+    if object_field_name is None:
+        raise LookupError(token)
+    serializer_field = serializer.object_field_serializers[object_field_name]
+    if not serializer_field.writable:
+        raise LookupError(token)
+    field_serializer = serializer.data_field_deserializers[token]
+
+    if construct is dict:
+        values = dict(value)
+    else:
+        values = {
+            name: getattr(value, name)
+            for name, field in serializer.object_field_serializers.items()
+            if field.writable
+        }
+
+    if len(rest) > 0:
+        if object_field_name not in values:
+            raise LookupError(token)
+        result = apply_at(field_serializer, values[object_field_name], rest, op, data)
+    elif op == "remove":
+        if serializer_field.default is no_default:
+            return Failure(Errors.one(RequiredFieldError(object_field_name), location=["path"]))
+        elif serializer_field.default is empty_default:
+            if construct is not dict:
+                return Failure(
+                    Errors.one(RequiredFieldError(object_field_name), location=["path"])
+                )
+            values.pop(object_field_name, None)
+            return Success(values)
+        result = Success(serializer_field.default)
+    else:
+        result = deserialize(field_serializer, data)
+
+    match result:
+        case Failure():
+            return result
+        case Success(field_value):
+            values[object_field_name] = field_value
+            return Success(construct(**values))
+
+
+def apply_list(
+    serializer: ListSerializer, value: list[Any], tokens: list[str], op: str, data: Any
+) -> Result[Any]:
+    token, rest = tokens[0], tokens[1:]
+    items = list(value)
+    element_serializer = serializer.element_serializer
+
+    if len(rest) > 0:
+        index = parse_index(token, len(items))
+        result = apply_at(element_serializer, items[index], rest, op, data)
+    elif op == "remove":
+        del items[parse_index(token, len(items))]
+        return Success(items)
+    elif op == "add":
+        index = len(items) if token == "-" else parse_index(token, len(items) + 1)
+        match deserialize(element_serializer, data):
+            case Failure() as failure:
+                return failure
+            case Success(item):
+                items.insert(index, item)
+                return Success(items)
+    else:
+        index = parse_index(token, len(items))
+        result = deserialize(element_serializer, data)
+
+    match result:
+        case Failure():
+            return result
+        case Success(item):
+            items[index] = item
+            return Success(items)
+
+
+def apply_tuple(
+    serializer: TupleSerializer, value: tuple[Any, ...], tokens: list[str], op: str, data: Any
+) -> Result[Any]:
+    token, rest = tokens[0], tokens[1:]
+    index = parse_index(token, len(value))
+    if len(rest) == 0 and op != "replace":
+        # The length of a tuple is fixed
+        raise LookupError(token)
+
+    match apply_at(serializer.element_serializers[index], value[index], rest, op, data):
+        case Failure() as failure:
+            return failure
+        case Success(item):
+            return Success((*value[:index], item, *value[index + 1 :]))
+
+
+def apply_dict(
+    serializer: RawDictSerializer, value: dict[Any, Any], tokens: list[str], op: str, data: Any
+) -> Result[Any]:
+    token, rest = tokens[0], tokens[1:]
+    match serializer.key_serializer.from_data(token):
+        case Failure():
+            raise LookupError(token)
+        case Success(key):
+            pass
+
+    items = dict(value)
+    if len(rest) > 0 or op != "add":
+        if key not in items:
+            raise LookupError(token)
+        if op == "remove" and len(rest) == 0:
+            del items[key]
+            return Success(items)
+
+    if len(rest) > 0:
+        result = apply_at(serializer.value_serializer, items[key], rest, op, data)
+    else:
+        result = deserialize(serializer.value_serializer, data)
+
+    match result:
+        case Failure():
+            return result
+        case Success(item):
+            items[key] = item
+            return Success(items)
+
+
+def patch_data(value: Any, tokens: list[str], op: str, data: Any) -> Any:
+    """Apply one operation to plain data, copying the containers on the path."""
+    if len(tokens) == 0:
+        if op == "remove":
+            raise LookupError
+        return data
+
+    token, rest = tokens[0], tokens[1:]
+    if not isinstance(value, dict | list):
+        # A scalar has no locations within it
+        raise LookupError(token)  # noqa: TRY004, a missing path rather than a wrong type
+
+    if isinstance(value, dict):
+        items = dict(value)
+        if len(rest) > 0:
+            items[token] = patch_data(items[token], rest, op, data)
+        elif op == "remove":
+            del items[token]
+        elif op == "replace" and token not in items:
+            raise LookupError(token)
+        else:
+            items[token] = data
+        return items
+    elif isinstance(value, list):
+        items = list(value)
+        if len(rest) > 0:
+            index = parse_index(token, len(items))
+            items[index] = patch_data(items[index], rest, op, data)
+        elif op == "remove":
+            del items[parse_index(token, len(items))]
+        elif op == "add":
+            index = len(items) if token == "-" else parse_index(token, len(items) + 1)
+            items.insert(index, data)
+        else:
+            items[parse_index(token, len(items))] = data
+        return items
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class InvalidPatchOperationError(Exception):
+    actual: Any
+
+    def __str__(self) -> str:
+        return f"Expected 'add', 'remove', or 'replace', but got {self.actual!r}"
+
+
+@serializable
+@dataclass(frozen=True, slots=True)
+class PatchPathError(Exception):
+    path: str
+
+    def __str__(self) -> str:
+        return f"Expected path to an existing location, but got {self.path!r}"
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+__all__ = ["NodeStatistics", "Profile", "profile"]
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from types import FrameType
+from typing import Any, Literal
+
+from ._result import Failure
+
+
+@dataclass(slots=True)
+class NodeStatistics:
+    """Timing and call statistics of one node of a serializer tree.
+
+    Attributes:
+        path: The location of the node in the tree, such as
+            `Order.items[].price`. Elements of lists and sets are marked by
+            `[]` and values of dictionaries by `{}`.
+        direction: Either `"from_data"` or `"to_data"`.
+        serializer: The name of the serializer at this node.
+        calls: The number of times the node was called.
+        failures: The number of times `from_data` returned a `Failure`.
+        elements: The total number of elements of the lists and dictionaries
+            passed to the node.
+        total_time: Seconds spent in the node, including its children.
+        self_time: Seconds spent in the node, excluding its children.
+    """
+
+    path: str
+    direction: Literal["from_data", "to_data"]
+    serializer: str
+    calls: int = 0
+    failures: int = 0
+    elements: int = 0
+    total_time: float = 0.0
+    self_time: float = 0.0
+
+    def to_data(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "direction": self.direction,
+            "serializer": self.serializer,
+            "calls": self.calls,
+            "failures": self.failures,
+            "elements": self.elements,
+            "total_time": self.total_time,
+            "self_time": self.self_time,
+        }
+
+
+@dataclass(slots=True)
+class Profile:
+    """Statistics collected by `profile`, keyed by direction and path."""
+
+    nodes: dict[tuple[str, str], NodeStatistics] = field(default_factory=dict)
+
+    def sorted_nodes(self) -> list[NodeStatistics]:
+        """Return the nodes sorted by decreasing self time."""
+        return sorted(self.nodes.values(), key=lambda node: node.self_time, reverse=True)
+
+    def to_data(self) -> list[dict[str, Any]]:
+        """Convert to a JSON-serializable list sorted by decreasing self time."""
+        return [node.to_data() for node in self.sorted_nodes()]
+
+    def table(self) -> str:
+        """Render the statistics as a plain-text table."""
+        header = (
+            "path",
+            "direction",
+            "serializer",
+            "calls",
+            "failures",
+            "elements",
+            "total ms",
+            "self ms",
+        )
+        rows = [
+            (
+                node.path,
+                node.direction,
+                node.serializer,
+                str(node.calls),
+                str(node.failures),
+                str(node.elements),
+                f"{node.total_time * 1000:.3f}",
+                f"{node.self_time * 1000:.3f}",
+            )
+            for node in self.sorted_nodes()
+        ]
+        widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+        lines = [
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True)).rstrip()
+            for row in [header, *rows]
+        ]
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.table()
+
+
+# The local variable holding the name of the data field being processed in
+# each method of FieldsSerializer
+field_name_locals = {"from_data": "key", "to_data": "data_field_name"}
+
+
+def path_segment(parent: FrameType) -> str:
+    """The path segment of a child called from the serializer frame `parent`.
+
+    An empty segment means that the parent delegated to the child, as
+    `SerializableMixin` delegates to its `FieldsSerializer`, so both share
+    a node. A field whose name cannot be found is `.?`.
+    """
+    qualname = parent.f_code.co_qualname
+    owner_name, _, method_name = qualname.rpartition(".")
+    if owner_name == "FieldsSerializer":
+        local_name = field_name_locals.get(method_name)
+        field_name = None if local_name is None else parent.f_locals.get(local_name)
+        if isinstance(field_name, str):
+            return f".{field_name}"
+        else:
+            # The field is unknown, but it is still a child of the parent
+            return ".?"
+    elif owner_name in {
+        "ListSerializer",
+        "SetSerializer",
+        "OrderedSetSerializer",
+        "TupleSerializer",
+    }:
+        return "[]"
+    elif owner_name in {"RawDictSerializer", "OrderedDictSerializer"}:
+        return "{}"
+    else:
+        return ""
+
+
+def serializer_frame_owner(frame: FrameType) -> Any | None:
+    """The serializer running in `frame`, or `None` if it is not a serializer."""
+    code = frame.f_code
+    if code.co_name not in {"from_data", "to_data"} or code.co_argcount < 1:
+        return None
+
+    # Serializers are duck typed, as in `serializer`. This also catches
+    # classes decorated with `serializable` that could not inherit from
+    # `SerializableMixin` and instances of them in `to_data`.
+    owner = frame.f_locals.get(code.co_varnames[0])
+    if hasattr(owner, "from_data") and hasattr(owner, "to_data"):
+        return owner
+    else:
+        return None
+
+
+@dataclass(slots=True)
+class ActiveCall:
+    frame: FrameType
+    path: str
+    node: NodeStatistics | None
+    start: float
+    child_time: float = 0.0
+
+
+class Profiler:
+    def __init__(self, result: Profile):
+        self.result = result
+        self.stack: list[ActiveCall] = []
+
+    def __call__(self, frame: FrameType, event: str, arg: Any) -> None:
+        if event == "call":
+            self.enter(frame)
+        elif event == "return" and self.stack and self.stack[-1].frame is frame:
+            self.exit(arg)
+
+    def enter(self, frame: FrameType) -> None:
+        owner = serializer_frame_owner(frame)
+        if owner is None:
+            return
+
+        direction = frame.f_code.co_name
+        name = owner.__name__ if isinstance(owner, type) else type(owner).__name__
+
+        if self.stack:
+            parent = self.stack[-1]
+            segment = path_segment(parent.frame)
+            path = parent.path + segment
+        else:
+            segment = None
+            path = name
+
+        if segment == "":
+            # Delegation from the parent; the time is attributed to the parent
+            node = None
+        else:
+            node = self.result.nodes.get((direction, path))
+            if node is None:
+                node = NodeStatistics(path, direction, name)
+                self.result.nodes[(direction, path)] = node
+            node.calls += 1
+
+            code = frame.f_code
+            if code.co_argcount >= 2:
+                data = frame.f_locals.get(code.co_varnames[1])
+                if isinstance(data, (list, dict, set, tuple)):
+                    node.elements += len(data)
+
+        self.stack.append(ActiveCall(frame, path, node, perf_counter()))
+
+    def exit(self, return_value: Any) -> None:
+        call = self.stack.pop()
+        if call.node is None:
+            return
+
+        elapsed = perf_counter() - call.start
+        call.node.total_time += elapsed
+        call.node.self_time += elapsed - call.child_time
+        if isinstance(return_value, Failure):
+            call.node.failures += 1
+
+        for ancestor in reversed(self.stack):
+            if ancestor.node is not None:
+                ancestor.child_time += elapsed
+                break
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """Collect statistics of every serializer call in the current thread.
+
+    ```
+    with profile() as result:
+        Order.from_data(data)
+    print(result.table())
+    ```
+
+    Each node of the serializer tree is identified by its path from the
+    outermost serializer called in the block. The profiler is installed with
+    `sys.setprofile` only for the duration of the block, so serializers run
+    without any overhead when not profiling.
+    """
+    result = Profile()
+    previous = sys.getprofile()
+    sys.setprofile(Profiler(result))
+    try:
+        yield result
+    finally:
+        sys.setprofile(previous)
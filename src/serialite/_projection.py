@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+__all__ = ["Projection", "project"]
+
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+# The projection applying to the FieldsSerializer that is about to run. None
+# means that all fields are selected, which is the fast path.
+current_projection: ContextVar[Projection | None] = ContextVar("projection", default=None)
+
+# Marks a field that is selected or excluded as a whole, rather than only some
+# of its nested fields
+whole = object()
+
+type PathTree = dict[str, PathTree | object]
+
+
+@dataclass(frozen=True, slots=True)
+class Projection:
+    """The selection of fields at one level of nesting.
+
+    Attributes:
+        include: The names of the selected fields, or `None` if all fields
+            are selected unless excluded.
+        exclude: The names of the fields that are not selected.
+        children: The projections applying to the values of individual
+            fields. The values of other fields are not projected.
+    """
+
+    include: frozenset[str] | None = None
+    exclude: frozenset[str] = frozenset()
+    children: dict[str, Projection] = field(default_factory=dict)
+
+    def selects(self, name: str) -> bool:
+        return (self.include is None or name in self.include) and name not in self.exclude
+
+    def child(self, name: str) -> Projection | None:
+        return self.children.get(name)
+
+    @staticmethod
+    def from_spec(include: Any = None, exclude: Any = None) -> Projection:
+        """Compile a projection from include and exclude specs.
+
+        A spec is either a comma-separated string of dotted paths like
+        `"id,name,items.sku"`, an iterable of such paths, or a nested set or
+        dict in the form accepted by Pydantic's `model_dump`, like
+        `{"id": True, "items": {"__all__": {"sku"}}}`. Paths descend
+        transparently through lists, sets, dicts, and abstract classes, so
+        `items.sku` selects the `sku` of every element of `items`.
+
+        Compiled projections are cached by spec.
+        """
+        include_paths = None if include is None else spec_paths(include)
+        exclude_paths = () if exclude is None else spec_paths(exclude)
+        return compile_projection(include_paths, exclude_paths)
+
+
+def spec_paths(spec: Any, prefix: str = "") -> tuple[str, ...]:
+    if isinstance(spec, str):
+        return tuple(sorted(prefix + path.strip() for path in spec.split(",") if path.strip()))
+    elif isinstance(spec, Mapping):
+        paths = []
+        for key, value in spec.items():
+            if not isinstance(key, str):
+                raise TypeError(f"Projection keys must be field names, not {key!r}")
+            # "__all__" applies to every element of a container, which
+            # projections pass through anyway
+            key_prefix = prefix if key == "__all__" else f"{prefix}{key}."
+            if value is True or value is ...:
+                paths.append(key_prefix.removesuffix("."))
+            else:
+                paths.extend(spec_paths(value, key_prefix))
+        return tuple(sorted(paths))
+    elif isinstance(spec, Iterable):
+        return tuple(sorted(prefix + path for path in spec))
+    else:
+        raise TypeError(f"Expected a projection spec, not {spec!r}")
+
+
+def path_tree(paths: tuple[str, ...]) -> PathTree:
+    tree: PathTree = {}
+    for path in paths:
+        node = tree
+        *parents, last = path.split(".")
+        for name in parents:
+            child = node.setdefault(name, {})
+            if child is whole:
+                break
+            node = child
+        else:
+            node[last] = whole
+    return tree
+
+
+def build_projection(include: PathTree | None, exclude: PathTree) -> Projection:
+    children = {}
+    for name in {*(include or {}), *exclude}:
+        child_include = None if include is None else include.get(name)
+        child_exclude = exclude.get(name)
+        if isinstance(child_include, dict) or isinstance(child_exclude, dict):
+            children[name] = build_projection(
+                child_include if isinstance(child_include, dict) else None,
+                child_exclude if isinstance(child_exclude, dict) else {},
+            )
+
+    return Projection(
+        include=None if include is None else frozenset(include),
+        exclude=frozenset(name for name, value in exclude.items() if value is whole),
+        children=children,
+    )
+
+
+@lru_cache(maxsize=256)
+def compile_projection(
+    include_paths: tuple[str, ...] | None, exclude_paths: tuple[str, ...]
+) -> Projection:
+    include = None if include_paths is None else path_tree(include_paths)
+    return build_projection(include, path_tree(exclude_paths))
+
+
+@contextmanager
+def project(include: Any = None, exclude: Any = None) -> Iterator[Projection]:
+    """Restrict serialization and deserialization to a subset of fields.
+
+    ```
+    with project(include="id,name,items.sku"):
+        data = Order.to_data(order)
+    ```
+
+    Within the block, `FieldsSerializer`, and therefore every
+    `SerializableMixin` class, only serializes the selected fields, so that
+    the work done and the size of the data are proportional to the
+    selection. When deserializing, fields that are not selected are ignored
+    in the data and take their default, if any. Unselected fields without a
+    default are left out, which is fine for `FieldsSerializer`, but a class
+    cannot be constructed without them, so it fails with an
+    `UnprojectedFieldError` for each of them.
+
+    `include` and `exclude` are specs as accepted by `Projection.from_spec`.
+    The projection applies to the outermost object reached from the value,
+    whether it is the value itself or the elements of a container. A
+    projection within the block replaces the outer one.
+    """
+    projection = Projection.from_spec(include, exclude)
+    token = current_projection.set(projection)
+    try:
+        yield projection
+    finally:
+        current_projection.reset(token)
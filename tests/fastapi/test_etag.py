@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from serialite import LruCache, canonical_dumps, etag_response, project, serializable
+
+
+@serializable
+@dataclass(frozen=True)
+class Summary:
+    title: str
+    tags: set[str]
+
+
+report_cache = LruCache(maxsize=10)
+reports = {"a": Summary("a", {"x", "y", "z"}), "b": Summary("b", set())}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/reports/{name}", response_model=Summary)
+    def get_report(name: str, request: Request):
+        return etag_response(
+            request, Summary, reports[name], headers={"Cache-Control": "no-cache"}
+        )
+
+    @app.post("/reports/{name}", response_model=Summary)
+    def post_report(name: str, request: Request):
+        return etag_response(request, Summary, reports[name])
+
+    @app.get("/titles/{name}", response_model=str)
+    def get_title(name: str, request: Request):
+        return etag_response(request, str, name, cache=report_cache)
+
+    return TestClient(app)
+
+
+def test_etag(client):
+    response = client.get("/reports/a")
+    assert response.status_code == 200
+    assert response.content == canonical_dumps(Summary, reports["a"]).encode()
+    assert response.json() == {"title": "a", "tags": ["x", "y", "z"]}
+    assert response.headers["ETag"].startswith('"')
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    assert client.get("/reports/a").headers["ETag"] == response.headers["ETag"]
+    assert client.get("/reports/b").headers["ETag"] != response.headers["ETag"]
+
+
+@pytest.mark.parametrize("if_none_match", ["{etag}", "W/{etag}", '"other", {etag}', "*"])
+def test_not_modified(client, if_none_match):
+    etag = client.get("/reports/a").headers["ETag"]
+
+    response = client.get("/reports/a", headers={"If-None-Match": if_none_match.format(etag=etag)})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "no-cache"
+
+
+def test_modified(client):
+    etag = client.get("/reports/b").headers["ETag"]
+    response = client.get("/reports/a", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "a"
+
+
+def test_unsafe_method_is_not_conditional(client):
+    etag = client.get("/reports/a").headers["ETag"]
+    response = client.post("/reports/a", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+
+
+def test_cache(client):
+    report_cache.cache_clear()
+    first = client.get("/titles/a")
+    second = client.get("/titles/a", headers={"If-None-Match": first.headers["ETag"]})
+    assert first.json() == "a"
+    assert second.status_code == 304
+    assert report_cache.cache_info().hits == 1
+    assert report_cache.cache_info().currsize == 1
+
+
+def test_cache_bypassed_under_projection():
+    cache = LruCache(maxsize=10)
+    request = Request({"type": "http", "method": "GET", "headers": []})
+    summary = Summary("a", {"x"})
+
+    with project(include="title"):
+        response = etag_response(request, Summary, summary, cache=cache)
+    assert response.body == b'{"title":"a"}'
+    assert cache.cache_info().currsize == 0
+
+
+@serializable
+@dataclass(frozen=True)
+class Value:
+    x: float | bool
+
+
+def test_cache_distinguishes_equal_values_of_different_types():
+    cache = LruCache(maxsize=10)
+    request = Request({"type": "http", "method": "GET", "headers": []})
+
+    true_response = etag_response(request, Value, Value(True), cache=cache)
+    one_response = etag_response(request, Value, Value(1), cache=cache)
+    assert true_response.body == b'{"x":true}'
+    assert one_response.body == b'{"x":1.0}'
+    assert true_response.headers["ETag"] != one_response.headers["ETag"]
+    assert cache.cache_info().currsize == 2
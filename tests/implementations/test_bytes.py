@@ -0,0 +1,148 @@
+import base64
+from dataclasses import dataclass
+
+import pytest
+
+from serialite import (
+    BytesSerializer,
+    Errors,
+    ExpectedStringError,
+    Failure,
+    InvalidBase64Error,
+    MsgpackSerializer,
+    Success,
+    ValidationExceptionGroup,
+    msgpack_loads,
+    native_types,
+    serializable,
+    serializer,
+)
+
+bytes_serializer = BytesSerializer()
+urlsafe_serializer = BytesSerializer(urlsafe=True)
+
+
+@pytest.mark.parametrize("value", [b"", b"a", b"ab", b"abc", bytes(range(256))])
+def test_valid_inputs(value):
+    data = base64.b64encode(value).decode()
+    assert bytes_serializer.from_data(data) == Success(value)
+    assert bytes_serializer.to_data(value) == data
+
+
+@pytest.mark.parametrize("value", [b"\xfb\xff", b"\xfb\xff\xfe", bytes(range(256))])
+def test_urlsafe(value):
+    data = base64.urlsafe_b64encode(value).decode()
+    assert urlsafe_serializer.to_data(value) == data.rstrip("=")
+    assert urlsafe_serializer.from_data(data) == Success(value)
+    assert urlsafe_serializer.from_data(data.rstrip("=")) == Success(value)
+
+
+def test_to_data_buffers():
+    assert bytes_serializer.to_data(bytearray(b"abc")) == "YWJj"
+    assert bytes_serializer.to_data(memoryview(b"xabcx")[1:4]) == "YWJj"
+    assert bytes_serializer.to_data(memoryview(b"a-b-c")[::2]) == "YWJj"
+
+
+def test_view():
+    view_serializer = BytesSerializer(view=True)
+    value = view_serializer.from_data("YWJj").unwrap()
+    assert isinstance(value, memoryview)
+    assert value == b"abc"
+
+
+def test_mutable():
+    mutable_serializer = BytesSerializer(mutable=True)
+    value = mutable_serializer.from_data("YWJj").unwrap()
+    assert isinstance(value, bytearray)
+    assert value == b"abc"
+
+    data = bytearray(b"abc")
+    with native_types(bytes):
+        native = mutable_serializer.from_data(data).unwrap()
+    assert native == data
+    assert native is not data
+
+
+def test_view_and_mutable():
+    with pytest.raises(ValueError):
+        _ = BytesSerializer(view=True, mutable=True)
+
+
+def test_dispatcher():
+    assert isinstance(serializer(bytes), BytesSerializer)
+    assert serializer(bytearray).mutable
+    assert serializer(memoryview).view
+
+
+@pytest.mark.parametrize("data", ["YWJ", "YW=j", "YWJj!", "YWJj\n", "é"])
+def test_from_data_failure_invalid_string(data):
+    assert bytes_serializer.from_data(data) == Failure(Errors.one(InvalidBase64Error(data)))
+
+
+def test_from_data_failure_urlsafe_alphabet():
+    assert urlsafe_serializer.from_data("+/8") == Failure(Errors.one(InvalidBase64Error("+/8")))
+
+
+def test_from_data_failure_non_string():
+    assert bytes_serializer.from_data(b"abc") == Failure(Errors.one(ExpectedStringError(b"abc")))
+
+
+def test_to_data_failure():
+    with pytest.raises(TypeError):
+        _ = bytes_serializer.to_data("abc")
+
+
+@pytest.mark.parametrize("urlsafe", [False, True])
+def test_chunks(urlsafe):
+    chunk_serializer = BytesSerializer(urlsafe=urlsafe)
+    value = bytes(range(256)) * 4
+    chunks = [value[i : i + 100] for i in range(0, len(value), 100)]
+
+    encoded = list(chunk_serializer.to_data_chunks(chunks))
+    assert "".join(encoded) == chunk_serializer.to_data(value)
+
+    data = chunk_serializer.to_data(value)
+    pieces = [data[i : i + 7] for i in range(0, len(data), 7)]
+    assert b"".join(chunk_serializer.from_data_chunks(pieces)) == value
+
+
+def test_from_data_chunks_failure():
+    with pytest.raises(ValidationExceptionGroup) as exception_info:
+        _ = list(bytes_serializer.from_data_chunks(["YWJj", "YW!j"]))
+    assert exception_info.value.errors[0].location == (1,)
+
+
+def test_native_bytes():
+    with native_types(bytes):
+        assert bytes_serializer.to_data(b"abc") == b"abc"
+        assert bytes_serializer.from_data(bytearray(b"abc")) == Success(b"abc")
+        assert bytes_serializer.from_data("YWJj") == Success(b"abc")
+
+
+@serializable
+@dataclass(frozen=True)
+class Attachment:
+    name: str
+    content: bytes
+
+
+def test_msgpack_bytes_are_binary():
+    msgpack_serializer = MsgpackSerializer(Attachment)
+    attachment = Attachment("a.bin", b"\x00\x01")
+    encoded = msgpack_serializer.to_data(attachment)
+    assert msgpack_loads(encoded) == {"name": "a.bin", "content": b"\x00\x01"}
+    assert msgpack_serializer.from_data(encoded) == Success(attachment)
+
+
+def test_bytes_error_to_data_and_to_string():
+    e = InvalidBase64Error("YW!j")
+    assert e.to_data() == {"actual": "YW!j"}
+    assert str(e) == "Expected base64 string, but got 'YW!j'"
+
+
+def test_to_openapi_schema():
+    assert bytes_serializer.to_openapi_schema(lambda _: {}) == {"type": "string", "format": "byte"}
+    assert urlsafe_serializer.to_openapi_schema(lambda _: {}) == {
+        "type": "string",
+        "contentEncoding": "base64url",
+    }
@@ -0,0 +1,98 @@
+import pytest
+
+from serialite import (
+    ElementBudgetError,
+    Errors,
+    ExpectedIntegerError,
+    Failure,
+    LimitedSerializer,
+    Limits,
+    MaximumDepthError,
+    MaximumKeysError,
+    MaximumLengthError,
+    MaximumStringLengthError,
+    Success,
+    serializer,
+)
+
+limits = Limits(max_depth=3, max_length=3, max_string_length=5, max_keys=2, max_elements=10)
+limited_serializer = LimitedSerializer(list[dict[str, list[int]]], limits)
+
+
+@pytest.mark.parametrize("data", [[], [{"a": [1, 2, 3]}], [{"abcde": []}, {"a": [], "b": [1]}]])
+def test_within_limits(data):
+    assert limited_serializer.from_data(data) == Success(data)
+
+
+@pytest.mark.parametrize(
+    ("data", "error", "location"),
+    [
+        ([{"a": [1, 2, 3, 4]}], MaximumLengthError(3, 4), [0, "a"]),
+        ([{}, {}, {}, {}], MaximumLengthError(3, 4), []),
+        ([{"abcdef": []}], MaximumStringLengthError(5, 6), [0]),
+        ("abcdef", MaximumStringLengthError(5, 6), []),
+        ([{"a": [], "b": [], "c": []}], MaximumKeysError(2, 3), [0]),
+        ([{"a": [[1]]}], MaximumDepthError(3), [0, "a", 0]),
+        ([{"a": [1, 2, 3]}, {"a": [1, 2, 3]}, {"a": [1]}], ElementBudgetError(10), [2]),
+    ],
+)
+def test_exceeded_limits(data, error, location):
+    assert limited_serializer.from_data(data) == Failure(Errors.one(error, location=location))
+
+
+def test_stops_at_first_violation():
+    data = [{"a": ["x"] * 100}] * 100
+    assert limited_serializer.from_data(data) == Failure(
+        Errors.one(MaximumLengthError(3, 100), location=[])
+    )
+
+
+def test_data_deeper_than_recursion_limit():
+    data = []
+    for _ in range(100_000):
+        data = [data]
+
+    assert LimitedSerializer(list[int], Limits(max_depth=10)).from_data(data) == Failure(
+        Errors.one(MaximumDepthError(10), location=[0] * 10)
+    )
+
+
+def test_no_limits():
+    data = ["a" * 1000] * 1000
+    assert LimitedSerializer(list[str], Limits()).from_data(data) == Success(data)
+
+
+def test_inner_errors():
+    assert limited_serializer.from_data([{"a": ["x"]}]) == Failure(
+        Errors.one(ExpectedIntegerError("x"), location=[0, "a", 0])
+    )
+
+
+def test_to_data():
+    assert limited_serializer.to_data([{"a": [1, 2, 3, 4]}]) == [{"a": [1, 2, 3, 4]}]
+
+
+def test_to_openapi_schema():
+    inner_serializer = serializer(list[int])
+    assert LimitedSerializer(inner_serializer, limits).to_openapi_schema(
+        lambda _: {}
+    ) == inner_serializer.to_openapi_schema(lambda _: {})
+
+
+@pytest.mark.parametrize(
+    ("error", "message"),
+    [
+        (MaximumDepthError(3), "Expected at most 3 nested containers, but got more"),
+        (MaximumLengthError(3, 4), "Expected list of at most 3 elements, but got 4"),
+        (MaximumStringLengthError(5, 6), "Expected string of at most 5 characters, but got 6"),
+        (MaximumKeysError(2, 3), "Expected dictionary of at most 2 keys, but got 3"),
+        (ElementBudgetError(10), "Expected at most 10 elements in total, but got more"),
+    ],
+)
+def test_limit_errors_to_string(error, message):
+    assert str(error) == message
+
+
+def test_limit_errors_to_data():
+    assert MaximumLengthError(3, 4).to_data() == {"maximum": 3, "actual_length": 4}
+    assert ElementBudgetError(10).to_data() == {"maximum": 10}
@@ -1,16 +1,27 @@
 from dataclasses import dataclass
+from fractions import Fraction
 
 import pytest
 
 from serialite import (
+    BooleanListSerializer,
     Errors,
+    ExpectedBooleanError,
     ExpectedFloatError,
+    ExpectedIntegerError,
     ExpectedListError,
+    ExpectedStringError,
     Failure,
+    FloatListSerializer,
     FloatSerializer,
+    IntegerListSerializer,
+    IntegerSerializer,
+    JsonSerializer,
     ListSerializer,
+    StringListSerializer,
     Success,
     serializable,
+    serializer,
 )
 
 list_serializer = ListSerializer(FloatSerializer())
@@ -73,3 +84,80 @@ def test_to_openapi_schema():
     schema = list_serializer.to_openapi_schema(lambda _: {})
     expected_schema = {"type": "array", "items": {"type": "number"}}
     assert schema == expected_schema
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_identity_elements(copy):
+    identity_serializer = ListSerializer(IntegerSerializer(), copy=copy)
+    data = [1, 2, 3]
+
+    value = identity_serializer.from_data(data).unwrap()
+    assert value == data
+    assert (value is data) != copy
+
+    output = identity_serializer.to_data(value)
+    assert output == data
+    assert (output is value) != copy
+
+
+def test_identity_elements_failure():
+    identity_serializer = ListSerializer(IntegerSerializer(), copy=False)
+    data = [1, "a", 3, "b"]
+    expected = Errors()
+    expected.add(ExpectedIntegerError("a"), location=[1])
+    expected.add(ExpectedIntegerError("b"), location=[3])
+    assert identity_serializer.from_data(data) == Failure(expected)
+
+    with pytest.raises(TypeError):
+        _ = identity_serializer.to_data(data)
+
+
+def test_json_elements_are_identity():
+    assert ListSerializer(JsonSerializer()).element_is_identity
+    assert not ListSerializer(FloatSerializer()).element_is_identity
+
+
+@pytest.mark.parametrize(
+    ("element_type", "serializer_class", "data", "value"),
+    [
+        (int, IntegerListSerializer, [1, 2, True], [1, 2, True]),
+        (float, FloatListSerializer, [1, 2.5, float("inf")], [1.0, 2.5, float("inf")]),
+        (str, StringListSerializer, ["a", "b"], ["a", "b"]),
+        (bool, BooleanListSerializer, [True, False], [True, False]),
+    ],
+)
+def test_primitive_lists(element_type, serializer_class, data, value):
+    primitive_serializer = serializer(list[element_type])
+    assert type(primitive_serializer) is serializer_class
+
+    assert primitive_serializer.from_data(data) == Success(value)
+    assert primitive_serializer.to_data(value) == value
+    assert primitive_serializer.from_data([]) == Success([])
+    assert primitive_serializer.from_data(12) == Failure(Errors.one(ExpectedListError(12)))
+
+
+@pytest.mark.parametrize(
+    ("primitive_serializer", "data", "error"),
+    [
+        (IntegerListSerializer(), [1, 2.5, 3], ExpectedIntegerError(2.5)),
+        (FloatListSerializer(), [1.5, True, 3], ExpectedFloatError(True)),
+        (StringListSerializer(), ["a", None, "c"], ExpectedStringError(None)),
+        (BooleanListSerializer(), [True, 1, False], ExpectedBooleanError(1)),
+    ],
+)
+def test_primitive_lists_failure(primitive_serializer, data, error):
+    assert primitive_serializer.from_data(data) == Failure(Errors.one(error, location=[1]))
+    with pytest.raises((TypeError, ValueError)):
+        _ = primitive_serializer.to_data(data)
+
+
+def test_float_list_falls_back_for_other_reals():
+    float_serializer = FloatListSerializer()
+    assert float_serializer.from_data([1.5, Fraction(1, 4)]) == Success([1.5, 0.25])
+    assert float_serializer.to_data([1.5, Fraction(1, 4)]) == [1.5, 0.25]
+
+
+def test_primitive_list_without_copy():
+    data = ["a", "b"]
+    assert StringListSerializer(copy=False).from_data(data).unwrap() is data
+    assert StringListSerializer().from_data(data).unwrap() is not data
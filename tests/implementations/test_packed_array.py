@@ -0,0 +1,118 @@
+from array import array
+from math import inf
+
+import pytest
+
+from serialite import (
+    Errors,
+    ExpectedFloatError,
+    ExpectedIntegerError,
+    ExpectedListError,
+    Failure,
+    FloatOutOfRangeError,
+    IntegerOutOfRangeError,
+    PackedArraySerializer,
+    Success,
+    serializer,
+)
+
+
+@pytest.mark.parametrize(
+    ("typecode", "data"),
+    [
+        ("d", [1.5, 2.0, -3.25]),
+        ("f", [1.5, 2.0, -3.25]),
+        ("q", [1, -2, 2**62]),
+        ("B", [0, 255]),
+    ],
+)
+def test_valid_inputs(typecode, data):
+    packed_serializer = PackedArraySerializer(typecode)
+    value = array(typecode, data)
+
+    assert packed_serializer.from_data(data) == Success(value)
+    assert packed_serializer.to_data(value) == data
+
+
+def test_float_array_accepts_integers():
+    assert PackedArraySerializer("d").from_data([1, 2.5]) == Success(array("d", [1.0, 2.5]))
+
+
+def test_from_data_failure_top_level():
+    assert PackedArraySerializer().from_data(12) == Failure(Errors.one(ExpectedListError(12)))
+
+
+def test_from_data_failure_float_element():
+    actual = PackedArraySerializer("d").from_data([1.5, "a", True])
+    expected = Errors()
+    expected.add(ExpectedFloatError("a"), location=[1])
+    expected.add(ExpectedFloatError(True), location=[2])
+    assert actual == Failure(expected)
+
+
+def test_from_data_failure_integer_element():
+    actual = PackedArraySerializer("b").from_data([1, 2.5, 128, -129])
+    expected = Errors()
+    expected.add(ExpectedIntegerError(2.5), location=[1])
+    expected.add(IntegerOutOfRangeError(128, minimum=-128, maximum=127), location=[2])
+    expected.add(IntegerOutOfRangeError(-129, minimum=-128, maximum=127), location=[3])
+    assert actual == Failure(expected)
+
+
+def test_from_data_failure_float32_range():
+    packed_serializer = PackedArraySerializer("f")
+    maximum = 3.4028234663852886e38
+    assert packed_serializer.from_data([maximum, -inf, inf]) == Success(
+        array("f", [maximum, -inf, inf])
+    )
+
+    actual = packed_serializer.from_data([1.0, 1e300, inf, -1e39])
+    expected = Errors()
+    expected.add(FloatOutOfRangeError(1e300, maximum), location=[1])
+    expected.add(FloatOutOfRangeError(-1e39, maximum), location=[3])
+    assert actual == Failure(expected)
+
+    assert PackedArraySerializer("d").from_data([1e300]) == Success(array("d", [1e300]))
+
+
+def test_float_out_of_range_error_to_string():
+    assert (
+        str(FloatOutOfRangeError(1e300, 3.4028234663852886e38))
+        == "Expected float of magnitude at most 3.4028234663852886e+38, but got 1e+300"
+    )
+
+
+def test_to_data_failure():
+    with pytest.raises(TypeError):
+        _ = PackedArraySerializer().to_data([1.5])
+
+
+def test_invalid_typecode():
+    with pytest.raises(ValueError):
+        _ = PackedArraySerializer("u")
+
+
+def test_to_openapi_schema():
+    assert PackedArraySerializer("d").to_openapi_schema(lambda _: {}) == {
+        "type": "array",
+        "items": {"type": "number"},
+    }
+    assert PackedArraySerializer("H").to_openapi_schema(lambda _: {}) == {
+        "type": "array",
+        "items": {"type": "integer", "minimum": 0, "maximum": 65535},
+    }
+
+
+@pytest.mark.parametrize(
+    ("annotation", "typecode"),
+    [(array, "d"), (array[float], "d"), (array[int], "q")],
+)
+def test_dispatch(annotation, typecode):
+    packed_serializer = serializer(annotation)
+    assert isinstance(packed_serializer, PackedArraySerializer)
+    assert packed_serializer.typecode == typecode
+
+
+def test_dispatch_unsupported_element():
+    with pytest.raises(TypeError):
+        _ = serializer(array[str])
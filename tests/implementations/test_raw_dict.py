@@ -6,9 +6,12 @@ from serialite import (
     Errors,
     ExpectedDictionaryError,
     ExpectedFloatError,
+    ExpectedIntegerError,
     Failure,
     FloatSerializer,
+    IntegerSerializer,
     RawDictSerializer,
+    RegexMismatchError,
     ReservedSerializer,
     ReservedValueError,
     StringSerializer,
@@ -93,3 +96,31 @@ def test_to_openapi_schema():
     schema = raw_dict_serializer.to_openapi_schema(lambda _: {})
     expected_schema = {"type": "object", "additionalProperties": {"type": "number"}}
     assert schema == expected_schema
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_identity_items(copy):
+    identity_serializer = RawDictSerializer(IntegerSerializer(), copy=copy)
+    data = {"a": 1, "b": 2}
+
+    value = identity_serializer.from_data(data).unwrap()
+    assert value == data
+    assert (value is data) != copy
+
+    output = identity_serializer.to_data(value)
+    assert output == data
+    assert (output is value) != copy
+
+
+def test_identity_items_failure():
+    identity_serializer = RawDictSerializer(
+        IntegerSerializer(), key_serializer=StringSerializer(accept="[a-z]")
+    )
+    data = {"a": 1, "bb": 2, "c": "x"}
+    expected = Errors()
+    expected.add(RegexMismatchError("[a-z]", "bb"), location=["bb"])
+    expected.add(ExpectedIntegerError("x"), location=["c"])
+    assert identity_serializer.from_data(data) == Failure(expected)
+
+    with pytest.raises(TypeError):
+        _ = identity_serializer.to_data({"a": "x"})
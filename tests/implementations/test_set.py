@@ -7,9 +7,11 @@ from serialite import (
     Errors,
     ExpectedFloatError,
     ExpectedListError,
+    ExpectedStringError,
     Failure,
     FloatSerializer,
     SetSerializer,
+    StringSerializer,
     Success,
     serializable,
 )
@@ -85,3 +87,26 @@ def test_to_openapi_schema():
     schema = set_serializer.to_openapi_schema(lambda _: {})
     expected_schema = {"type": "array", "items": {"type": "number"}, "uniqueItems": True}
     assert schema == expected_schema
+
+
+def test_identity_elements():
+    identity_serializer = SetSerializer(StringSerializer())
+    data = ["a", "b", "c"]
+    value = {"a", "b", "c"}
+
+    assert identity_serializer.from_data(data) == Success(value)
+    assert sorted(identity_serializer.to_data(value)) == data
+
+
+def test_identity_elements_duplicates():
+    identity_serializer = SetSerializer(StringSerializer())
+    data = ["a", "b", "a"]
+    expected = Errors.one(DuplicatedValueError("a"), location=[2])
+    assert identity_serializer.from_data(data) == Failure(expected)
+
+
+def test_identity_elements_failure():
+    identity_serializer = SetSerializer(StringSerializer())
+    data = ["a", 1, "a"]
+    expected = Errors.one(ExpectedStringError(1), location=[1])
+    assert identity_serializer.from_data(data) == Failure(expected)
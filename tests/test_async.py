@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pytest
+
+from serialite import (
+    Errors,
+    ExpectedIntegerError,
+    Failure,
+    IntegerSerializer,
+    ListSerializer,
+    Serializer,
+    Success,
+    from_data_async,
+    serializable,
+    serializer,
+    to_data_async,
+)
+
+
+class ThreadRecordingSerializer(Serializer[list[int]]):
+    def __init__(self):
+        self.threads = []
+        self.list_serializer = ListSerializer(IntegerSerializer())
+
+    def from_data(self, data):
+        self.threads.append(threading.get_ident())
+        return self.list_serializer.from_data(data)
+
+    def to_data(self, value):
+        self.threads.append(threading.get_ident())
+        return self.list_serializer.to_data(value)
+
+
+@pytest.mark.parametrize(
+    ("size", "offload", "in_loop_thread"),
+    [
+        (5, None, True),
+        (50, None, False),
+        (50, False, True),
+        (5, True, False),
+    ],
+)
+def test_offload_decision(size, offload, in_loop_thread):
+    recording_serializer = ThreadRecordingSerializer()
+    data = list(range(size))
+
+    async def main():
+        from_result = await from_data_async(
+            recording_serializer, data, offload=offload, threshold=10
+        )
+        to_result = await to_data_async(recording_serializer, data, offload=offload, threshold=10)
+        return threading.get_ident(), from_result, to_result
+
+    loop_thread, from_result, to_result = asyncio.run(main())
+
+    assert from_result == Success(data)
+    assert to_result == data
+    assert all(
+        (thread == loop_thread) == in_loop_thread for thread in recording_serializer.threads
+    )
+
+
+def test_failure_is_returned():
+    list_serializer = ListSerializer(IntegerSerializer())
+    data = [1] * 20 + ["a"]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        actual = asyncio.run(
+            from_data_async(list_serializer, data, threshold=10, executor=executor)
+        )
+
+    assert actual == Failure(Errors.one(ExpectedIntegerError("a"), location=[20]))
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.mark.parametrize(("size", "submitted"), [(20, 1), (5, 0)])
+def test_dataclass_fields_are_counted(size, submitted):
+    @serializable
+    @dataclass
+    class Series:
+        name: str
+        values: list[float]
+
+    series_serializer = serializer(Series)
+    value = Series("a", [1.0] * size)
+
+    with CountingExecutor() as executor:
+        actual = asyncio.run(
+            to_data_async(series_serializer, value, threshold=10, executor=executor)
+        )
+
+    assert actual == {"name": "a", "values": [1.0] * size}
+    assert executor.submitted == submitted
@@ -0,0 +1,271 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+import pytest
+
+from serialite import (
+    BinarySerializer,
+    Errors,
+    Failure,
+    IntegerOutOfRangeError,
+    JsonSerializer,
+    ListSerializer,
+    MalformedBinaryError,
+    NoneSerializer,
+    OrderedDictSerializer,
+    PositiveIntegerSerializer,
+    RawDictSerializer,
+    SchemaFingerprintError,
+    Success,
+    TryUnionSerializer,
+    abstract_serializable,
+    field,
+    serializable,
+    serializer,
+)
+
+
+@abstract_serializable
+class Shape:
+    pass
+
+
+@serializable
+@dataclass(frozen=True)
+class Circle(Shape):
+    radius: float
+
+
+@serializable
+@dataclass(frozen=True)
+class Square(Shape):
+    side: float
+
+
+@serializable
+@dataclass(frozen=True)
+class Item:
+    id: UUID
+    name: str
+    count: int
+    created: datetime
+    shape: Shape
+    kind: Literal["a", "b"] = "a"
+    tags: list[str] = field(default_factory=list)
+    parent: int | None = None
+    extra: dict[str, float] = field(default_factory=dict)
+
+
+@serializable
+@dataclass(frozen=True)
+class Group(Shape):
+    members: list[Shape]
+
+
+@serializable
+@dataclass(frozen=True)
+class Empty:
+    pass
+
+
+item = Item(
+    id=UUID(int=7),
+    name="widget",
+    count=-3,
+    created=datetime(2024, 1, 2, 3, 4, 5),
+    shape=Circle(1.5),
+    kind="b",
+    tags=["x", "y"],
+    parent=12,
+    extra={"weight": 0.5},
+)
+
+
+@pytest.mark.parametrize(
+    ("value_type", "value"),
+    [
+        (int, 0),
+        (int, -(2**70)),
+        (int, 2**700),
+        (bytes, b"\x00\xff"),
+        (ListSerializer(NoneSerializer()), [None, None]),
+        (tuple[()], ()),
+        (list[Empty], [Empty(), Empty()]),
+        (float, 2.5),
+        (bool, True),
+        (str, "héllo"),
+        (type(None), None),
+        (list[int], [1, 300, -5]),
+        (tuple[int, str], (1, "a")),
+        (dict[str, int], {"a": 1}),
+        (OrderedDictSerializer(serializer(int), serializer(str)), {1: "a"}),
+        (set[int], {1, 2}),
+        (int | None, None),
+        (int | None, 5),
+        (Literal[1, True, "a"], True),
+        (Shape, Square(2.0)),
+        (Item, item),
+        (Item, Item(UUID(int=0), "", 0, datetime(2024, 1, 1), Square(1.0))),
+    ],
+)
+def test_round_trip(value_type, value):
+    binary_serializer = BinarySerializer(value_type)
+    encoded = binary_serializer.to_data(value)
+    assert isinstance(encoded, bytes)
+    assert binary_serializer.from_data(encoded) == Success(value)
+
+
+def test_recursive_type():
+    binary_serializer = BinarySerializer(Shape)
+    value = Group([Circle(1.0), Group([Square(2.0), Group([])])])
+    assert binary_serializer.from_data(binary_serializer.to_data(value)) == Success(value)
+
+
+def test_union_member_index():
+    binary_serializer = BinarySerializer(TryUnionSerializer(serializer(int), serializer(str)))
+    assert binary_serializer.from_data(binary_serializer.to_data("1")) == Success("1")
+    assert binary_serializer.from_data(binary_serializer.to_data(1)) == Success(1)
+
+
+def test_smaller_than_json():
+    binary_serializer = BinarySerializer(list[Item])
+    items = [item] * 10
+    encoded = binary_serializer.to_data(items)
+    assert len(encoded) < len(json.dumps(serializer(list[Item]).to_data(items))) / 2
+
+
+def test_openapi():
+    assert BinarySerializer(Item).to_openapi_schema(None) == {"type": "string", "format": "binary"}
+
+
+def test_fingerprint_depends_on_schema():
+    assert BinarySerializer(list[int]).fingerprint == BinarySerializer(list[int]).fingerprint
+    assert BinarySerializer(list[int]).fingerprint != BinarySerializer(list[str]).fingerprint
+    assert BinarySerializer(Item).fingerprint != BinarySerializer(Shape).fingerprint
+
+
+def test_failure_fingerprint():
+    encoded = BinarySerializer(list[str]).to_data(["a"])
+    actual = BinarySerializer(list[int]).from_data(encoded)
+    assert actual == Failure(
+        Errors.one(
+            SchemaFingerprintError(
+                BinarySerializer(list[int]).fingerprint.hex(),
+                BinarySerializer(list[str]).fingerprint.hex(),
+            )
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ("abc", MalformedBinaryError(0, "expected bytes")),
+        (b"SLB", MalformedBinaryError(0, "missing header")),
+        (b"JSON{}", MalformedBinaryError(0, "missing header")),
+    ],
+)
+def test_failure_header(data, expected):
+    assert BinarySerializer(int).from_data(data) == Failure(Errors.one(expected))
+
+
+def test_failure_truncated():
+    binary_serializer = BinarySerializer(list[str])
+    encoded = binary_serializer.to_data(["abc"])
+    assert binary_serializer.from_data(encoded[:-1]) == Failure(
+        Errors.one(MalformedBinaryError(14, "expected 3 more bytes"))
+    )
+    assert binary_serializer.from_data(encoded + b"\x00") == Failure(
+        Errors.one(MalformedBinaryError(len(encoded), "trailing bytes"))
+    )
+
+
+def test_failure_index_out_of_range():
+    binary_serializer = BinarySerializer(Shape)
+    encoded = binary_serializer.to_data(Circle(1.0))
+    assert binary_serializer.from_data(encoded[:12] + b"\x05" + encoded[13:]) == Failure(
+        Errors.one(MalformedBinaryError(12, "index 5 is out of range for 3 choices"))
+    )
+
+
+def test_bytes_are_raw():
+    binary_serializer = BinarySerializer(bytes)
+    assert binary_serializer.to_data(b"\x00\xff") == binary_serializer.header + b"\x02\x00\xff"
+
+
+def test_failure_varint_too_long():
+    binary_serializer = BinarySerializer(list[int])
+    assert binary_serializer.from_data(binary_serializer.header + b"\xff" * 11) == Failure(
+        Errors.one(MalformedBinaryError(12, "varint longer than 10 bytes"))
+    )
+
+
+@pytest.mark.parametrize(
+    "value_type",
+    [
+        ListSerializer(NoneSerializer()),
+        list[Empty],
+        RawDictSerializer(NoneSerializer()),
+        JsonSerializer(),
+    ],
+)
+def test_failure_count_exceeds_bytes(value_type):
+    binary_serializer = BinarySerializer(value_type)
+    tag = b"\x06" if isinstance(value_type, JsonSerializer) else b""
+    encoded = binary_serializer.header + tag + b"\x80\x89\x7a\x00"
+    assert binary_serializer.from_data(encoded) == Failure(
+        Errors.one(MalformedBinaryError(12 + len(tag), "count 2000000 exceeds the 1 bytes left"))
+    )
+
+
+def test_failure_unhashable_key():
+    binary_serializer = BinarySerializer(
+        RawDictSerializer(serializer(int), key_serializer=JsonSerializer())
+    )
+    encoded = binary_serializer.header + b"\x01\x06\x00\x02"
+    assert binary_serializer.from_data(encoded) == Failure(
+        Errors.one(MalformedBinaryError(13, "unhashable key []"))
+    )
+
+
+def test_validation_is_reused():
+    # The decoded data goes through from_data like JSON data does
+    encoded = BinarySerializer(int).to_data(-1)
+    assert BinarySerializer(PositiveIntegerSerializer()).from_data(encoded) == Failure(
+        Errors.one(IntegerOutOfRangeError(actual=-1, minimum=1))
+    )
+
+
+def test_to_data_failure():
+    with pytest.raises(TypeError):
+        _ = BinarySerializer(int).to_data("a")
+
+
+def test_failure_nesting_too_deep():
+    binary_serializer = BinarySerializer(JsonSerializer())
+    encoded = binary_serializer.header + b"\x06\x01" * 100_000
+    assert binary_serializer.from_data(encoded) == Failure(
+        Errors.one(MalformedBinaryError(12 + 2 * 100 + 1, "nesting too deep"))
+    )
+
+
+def test_max_depth():
+    # Each group is a class and a list, and the circle is a class
+    value = Circle(1.0)
+    for _ in range(3):
+        value = Group([value])
+    encoded = BinarySerializer(Shape).to_data(value)
+    assert BinarySerializer(Shape, max_depth=7).from_data(encoded) == Success(value)
+    assert isinstance(BinarySerializer(Shape, max_depth=6).from_data(encoded), Failure)
+
+
+def test_failure_recursive_type_too_deep():
+    binary_serializer = BinarySerializer(Shape)
+    group_index = binary_serializer.codec.parameters.index("Group").to_bytes()
+    encoded = binary_serializer.header + (group_index + b"\x01\x01") * 100_000
+    result = binary_serializer.from_data(encoded)
+    assert isinstance(result, Failure)
+    assert isinstance(result.failure().errors[0].error, MalformedBinaryError)
@@ -0,0 +1,269 @@
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from serialite import (
+    CachedSerializer,
+    CacheInfo,
+    DateTimeSerializer,
+    Errors,
+    ExpectedIntegerError,
+    Failure,
+    FloatSerializer,
+    IntegerSerializer,
+    JsonSerializer,
+    LruCache,
+    Success,
+    UuidSerializer,
+    cache_from_data,
+    cache_to_data,
+    project,
+    serializable,
+    serializer,
+)
+
+
+def test_lru_cache():
+    cache = LruCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b", None) is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.cache_info() == CacheInfo(hits=3, misses=1, evictions=1, maxsize=2, currsize=2)
+
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=2, currsize=0)
+
+
+def test_lru_cache_failure_negative_maxsize():
+    with pytest.raises(ValueError):
+        _ = LruCache(-1)
+
+
+@cache_to_data(maxsize=2)
+@serializable
+@dataclass(frozen=True)
+class Product:
+    sku: str
+    tags: tuple[str, str]
+
+
+@cache_to_data(copy=False)
+@serializable
+@dataclass(frozen=True, slots=True)
+class Shared:
+    name: str
+
+
+@serializable
+@dataclass(frozen=True)
+class Catalog:
+    products: list[Product]
+
+
+def test_to_data_is_cached():
+    Product.__to_data_cache__.cache_clear()
+    product = Product("a", ("x", "y"))
+
+    first = product.to_data()
+    second = Product("a", ("x", "y")).to_data()
+
+    assert first == second == {"sku": "a", "tags": ["x", "y"]}
+    assert Product.__to_data_cache__.cache_info().hits == 1
+    assert Product.__to_data_cache__.cache_info().misses == 1
+
+    # Copies protect the cache from mutation
+    assert first is not second
+    first["tags"].append("z")
+    assert product.to_data() == {"sku": "a", "tags": ["x", "y"]}
+
+
+def test_nested_to_data_is_cached():
+    Product.__to_data_cache__.cache_clear()
+    catalog = Catalog(
+        [Product("a", ("x", "y")), Product("a", ("x", "y")), Product("b", ("x", "y"))]
+    )
+
+    assert Catalog.to_data(catalog) == {
+        "products": [
+            {"sku": "a", "tags": ["x", "y"]},
+            {"sku": "a", "tags": ["x", "y"]},
+            {"sku": "b", "tags": ["x", "y"]},
+        ]
+    }
+    assert Product.__to_data_cache__.cache_info() == CacheInfo(
+        hits=1, misses=2, evictions=0, maxsize=2, currsize=2
+    )
+
+
+def test_shared_to_data():
+    value = Shared("a")
+    assert serializer(Shared).to_data(value) is value.to_data()
+
+
+def test_projection_bypasses_cache():
+    Product.__to_data_cache__.cache_clear()
+    with project("sku"):
+        assert Product("a", ("x", "y")).to_data() == {"sku": "a"}
+    assert Product("a", ("x", "y")).to_data() == {"sku": "a", "tags": ["x", "y"]}
+    assert Product.__to_data_cache__.cache_info().hits == 0
+
+
+def test_unhashable_instances_are_not_cached():
+    @cache_to_data
+    @serializable
+    @dataclass(frozen=True)
+    class Bag:
+        items: list[int]
+
+    assert Bag([1]).to_data() == {"items": [1]}
+    assert Bag.__to_data_cache__.cache_info().currsize == 0
+
+
+def test_equal_instances_of_different_types_are_not_shared():
+    @cache_to_data
+    @serializable
+    @dataclass(frozen=True)
+    class Box:
+        x: Any
+
+    assert Box(1).to_data() == {"x": 1}
+    assert Box(True).to_data() == {"x": True}
+    assert type(Box(1.0).to_data()["x"]) is float
+    assert Box(0.0).to_data() == {"x": 0.0}
+    assert math.copysign(1.0, Box(-0.0).to_data()["x"]) == -1.0
+    assert Box.__to_data_cache__.cache_info().hits == 0
+
+
+def test_cache_to_data_failure_not_frozen():
+    with pytest.raises(TypeError):
+
+        @cache_to_data
+        @serializable
+        @dataclass
+        class Mutable:
+            name: str
+
+
+def test_cached_serializer_leaves():
+    datetime_serializer = CachedSerializer(DateTimeSerializer())
+    first = datetime_serializer.from_data("2024-01-02T03:04:05")
+    second = datetime_serializer.from_data("2024-01-02T03:04:05")
+
+    assert first == Success(datetime(2024, 1, 2, 3, 4, 5))
+    assert first.unwrap() is second.unwrap()
+    assert datetime_serializer.cache_info() == CacheInfo(
+        hits=1, misses=1, evictions=0, maxsize=1024, currsize=1
+    )
+    assert datetime_serializer.to_data(first.unwrap()) == "2024-01-02 03:04:05"
+
+    uuid_serializer = CachedSerializer(UuidSerializer(), maxsize=1)
+    uuid_serializer.from_data("00000000-0000-0000-0000-000000000001")
+    uuid_serializer.from_data("00000000-0000-0000-0000-000000000002")
+    assert uuid_serializer.from_data("00000000-0000-0000-0000-000000000002") == Success(
+        UUID(int=2)
+    )
+    assert uuid_serializer.cache_info() == CacheInfo(
+        hits=1, misses=2, evictions=1, maxsize=1, currsize=1
+    )
+
+    uuid_serializer.cache_clear()
+    assert uuid_serializer.cache_info().currsize == 0
+
+
+def test_cached_serializer_distinguishes_scalar_types():
+    json_serializer = CachedSerializer(JsonSerializer())
+    assert json_serializer.from_data({"a": [1]}) == Success({"a": [1]})
+    assert json_serializer.from_data({"a": [1.0]}).unwrap()["a"][0].__class__ is float
+    assert json_serializer.from_data({"a": [True]}) == Success({"a": [True]})
+    assert json_serializer.from_data({True: 1}) == Success({True: 1})
+    assert json_serializer.cache_info().hits == 0
+
+
+def test_cached_serializer_distinguishes_signed_zeros():
+    float_serializer = CachedSerializer(FloatSerializer())
+    assert float_serializer.from_data(0.0) == Success(0.0)
+    assert math.copysign(1.0, float_serializer.from_data(-0.0).unwrap()) == -1.0
+    assert float_serializer.cache_info().hits == 0
+
+
+def test_cached_serializer_does_not_cache_failures():
+    integer_serializer = CachedSerializer(IntegerSerializer())
+    assert integer_serializer.from_data("a") == Failure(Errors.one(ExpectedIntegerError("a")))
+    assert integer_serializer.cache_info().currsize == 0
+
+
+def test_cached_serializer_bypasses_other_data():
+    integer_serializer = CachedSerializer(IntegerSerializer())
+    assert integer_serializer.from_data(1) == Success(1)
+    assert integer_serializer.from_data((1,)) == Failure(Errors.one(ExpectedIntegerError((1,))))
+    assert integer_serializer.cache_info().misses == 1
+
+
+@cache_from_data(maxsize=16)
+@serializable
+@dataclass(frozen=True)
+class Filter:
+    field: str
+    values: tuple[int, int]
+
+
+@serializable
+@dataclass(frozen=True)
+class SubFilter(Filter):
+    pass
+
+
+def test_cache_from_data():
+    Filter.__from_data_cache__.cache_clear()
+    data = {"field": "a", "values": [1, 2]}
+
+    first = Filter.from_data(data).unwrap()
+    second = serializer(Filter).from_data({"field": "a", "values": [1, 2]}).unwrap()
+
+    assert first == Filter("a", (1, 2))
+    assert first is second
+    assert Filter.__from_data_cache__.cache_info().hits == 1
+
+
+@cache_from_data
+@serializable
+@dataclass(frozen=True)
+class Scale:
+    x: float
+
+
+def test_cache_from_data_distinguishes_signed_zeros():
+    assert Scale.from_data({"x": 0.0}) == Success(Scale(0.0))
+    assert math.copysign(1.0, Scale.from_data({"x": -0.0}).unwrap().x) == -1.0
+
+
+def test_cache_from_data_subclass_is_not_cached():
+    Filter.__from_data_cache__.cache_clear()
+    assert SubFilter.from_data({"field": "a", "values": [1, 2]}) == Success(SubFilter("a", (1, 2)))
+    assert Filter.__from_data_cache__.cache_info().currsize == 0
+
+
+def test_cache_from_data_projection_bypasses_cache():
+    Filter.__from_data_cache__.cache_clear()
+    with project("field,values"):
+        assert Filter.from_data({"field": "a", "values": [1, 2]}) == Success(Filter("a", (1, 2)))
+    assert Filter.__from_data_cache__.cache_info().currsize == 0
+
+
+def test_cache_from_data_failure_not_frozen():
+    with pytest.raises(TypeError):
+
+        @cache_from_data
+        @serializable
+        @dataclass
+        class Mutable:
+            name: str
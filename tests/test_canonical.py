@@ -0,0 +1,85 @@
+import hashlib
+from dataclasses import dataclass
+
+import pytest
+
+from serialite import (
+    cache_to_data,
+    canonical,
+    canonical_dumps,
+    content_hash,
+    serializable,
+    serializer,
+)
+
+
+@cache_to_data
+@serializable
+@dataclass(frozen=True)
+class Tagged:
+    name: str
+    tags: set[str]
+    weights: dict[str, float]
+
+
+def make_set(items):
+    # Sets of strings built in different orders may iterate differently
+    value = set()
+    for item in items:
+        value.add(item)
+    return value
+
+
+def test_sets_are_sorted():
+    set_serializer = serializer(set[str])
+    items = [f"tag{i}" for i in range(100)]
+    with canonical():
+        assert set_serializer.to_data(make_set(items)) == sorted(items)
+        assert set_serializer.to_data(make_set(reversed(items))) == sorted(items)
+
+
+def test_mixed_sets_are_ordered_by_data():
+    set_serializer = serializer(set[int | str])
+    with canonical():
+        assert set_serializer.to_data({"b", 2, "a", 10}) == ["a", "b", 10, 2]
+
+
+def test_canonical_dumps():
+    value = {"b": 1.5, "a": -0.0, "c": 1e100}
+    assert canonical_dumps(serializer(dict[str, float]), value) == '{"a":0.0,"b":1.5,"c":1e+100}'
+
+
+def test_canonical_dumps_non_ascii():
+    assert canonical_dumps(serializer(str), "é") == '"é"'
+
+
+def test_canonical_dumps_nan():
+    with pytest.raises(ValueError):
+        _ = canonical_dumps(serializer(list[float]), [float("nan")])
+
+
+def test_cache_is_bypassed():
+    items = [f"tag{i}" for i in range(50)]
+    value = Tagged("a", make_set(reversed(items)), {"y": 1.0, "x": 2.0})
+    _ = Tagged.to_data(value)
+    assert canonical_dumps(Tagged, value) == (
+        '{"name":"a","tags":[' + ",".join(f'"{item}"' for item in sorted(items)) + "],"
+        '"weights":{"x":2.0,"y":1.0}}'
+    )
+
+
+def test_content_hash():
+    first = Tagged("a", {"x", "y", "z"}, {"p": 1.0, "q": 2.0})
+    second = Tagged("a", {"z", "y", "x"}, {"q": 2.0, "p": 1.0})
+    assert content_hash(Tagged, first) == content_hash(Tagged, second)
+    assert content_hash(Tagged, first) != content_hash(Tagged, Tagged("b", set(), {}))
+
+    expected = hashlib.sha256(canonical_dumps(Tagged, first).encode()).hexdigest()
+    assert content_hash(Tagged, first) == expected
+
+    expected = hashlib.blake2b(canonical_dumps(Tagged, first).encode()).hexdigest()
+    assert content_hash(Tagged, first, algorithm="blake2b") == expected
+
+
+def test_outside_canonical_is_unchanged():
+    assert sorted(serializer(set[int]).to_data({3, 1, 2})) == [1, 2, 3]
@@ -0,0 +1,198 @@
+from dataclasses import dataclass
+
+import pytest
+
+from serialite import serializable
+
+try:
+    import numpy as np
+except ImportError:
+    pytest.skip("NumPy not available", allow_module_level=True)
+
+from serialite import (
+    ColumnarSerializer,
+    ColumnDtypeError,
+    ColumnLengthError,
+    Errors,
+    ExpectedDictionaryError,
+    ExpectedFloatError,
+    ExpectedIntegerError,
+    ExpectedListError,
+    Failure,
+    FieldsSerializer,
+    MultiField,
+    RequiredFieldError,
+    UnknownFieldError,
+)
+
+
+@serializable
+@dataclass(frozen=True)
+class Point:
+    x: float
+    y: float
+
+
+@serializable
+@dataclass(frozen=True)
+class Row:
+    id: int
+    value: float
+    flag: bool
+    name: str = "unnamed"
+    point: Point | None = None
+
+
+rows_data = [
+    {"id": 1, "value": 1.5, "flag": True, "name": "a", "point": {"x": 1, "y": 2}},
+    {"id": 2, "value": 2, "flag": False},
+]
+
+
+def test_from_rows():
+    actual = ColumnarSerializer(Row).from_data(rows_data).unwrap()
+
+    assert list(actual.keys()) == ["id", "value", "flag", "name", "point"]
+    assert actual["id"].dtype == np.int64
+    assert actual["value"].dtype == np.float64
+    assert actual["flag"].dtype == np.bool_
+    assert actual["name"].dtype == object
+    np.testing.assert_equal(actual["id"], [1, 2])
+    np.testing.assert_equal(actual["value"], [1.5, 2.0])
+    np.testing.assert_equal(actual["flag"], [True, False])
+    assert actual["name"].tolist() == ["a", "unnamed"]
+    assert actual["point"].tolist() == [Point(1.0, 2.0), None]
+
+
+def test_from_columns():
+    data = {"id": [1, 2], "value": [1.5, 2], "flag": [True, False]}
+    actual = ColumnarSerializer(Row).from_data(data).unwrap()
+
+    np.testing.assert_equal(actual["id"], [1, 2])
+    assert actual["name"].tolist() == ["unnamed", "unnamed"]
+    assert actual["point"].tolist() == [None, None]
+
+
+def test_structured_layout():
+    actual = ColumnarSerializer(Row, layout="structured").from_data(rows_data).unwrap()
+
+    assert actual.dtype.names == ("id", "value", "flag", "name", "point")
+    assert actual.dtype["id"] == np.int64
+    assert actual.shape == (2,)
+    assert actual[1]["value"] == 2.0
+
+
+def test_dtypes_override():
+    column_serializer = ColumnarSerializer(Point, dtypes={"x": np.float32})
+    actual = column_serializer.from_data([{"x": 1, "y": 2}]).unwrap()
+    assert actual["x"].dtype == np.float32
+    assert actual["y"].dtype == np.float64
+
+
+def test_dtypes_override_failures():
+    column_serializer = ColumnarSerializer(FieldsSerializer(id=int, x=int), dtypes={"id": np.int8})
+    assert column_serializer.from_data([{"id": 1, "x": 2**70}, {"id": 300, "x": 1}]) == Failure(
+        Errors.one(ColumnDtypeError("int8", 300), location=[1, "id"])
+    )
+    assert column_serializer.from_data({"id": [2**70, 1, -200], "x": [1, 2, 3]}) == Failure(
+        Errors(
+            [
+                *Errors.one(ColumnDtypeError("int8", 2**70), location=["id", 0]).errors,
+                *Errors.one(ColumnDtypeError("int8", -200), location=["id", 2]).errors,
+            ]
+        )
+    )
+
+
+def test_large_integers_fall_back_to_object():
+    actual = ColumnarSerializer(FieldsSerializer(id=int)).from_data([{"id": 2**70}]).unwrap()
+    assert actual["id"].dtype == object
+    assert actual["id"].tolist() == [2**70]
+
+
+def test_empty():
+    actual = ColumnarSerializer(Point).from_data([]).unwrap()
+    assert actual["x"].shape == (0,)
+
+
+def test_row_failures():
+    data = [
+        {"id": 1.5, "value": 1, "flag": True},
+        {"id": 2, "value": "a", "flag": True, "extra": 1},
+        "row",
+        {"value": 1, "flag": True, "point": {"x": "b", "y": 1}},
+    ]
+    actual = ColumnarSerializer(Row).from_data(data)
+
+    expected = Errors()
+    expected.add(ExpectedIntegerError(1.5), location=[0, "id"])
+    expected.add(UnknownFieldError("extra"), location=[1, "extra"])
+    expected.add(ExpectedFloatError("a"), location=[1, "value"])
+    expected.add(ExpectedDictionaryError("row"), location=[2])
+    expected.add(RequiredFieldError("id"), location=[3, "id"])
+    expected.add(ExpectedFloatError("b"), location=[3, "point", "x"])
+    assert actual == Failure(expected)
+
+
+def test_column_failures():
+    data = {"id": [1, 1.5], "value": [1.0, 2.0, 3.0], "flag": True, "extra": []}
+    actual = ColumnarSerializer(Row).from_data(data)
+
+    expected = Errors()
+    expected.add(ExpectedIntegerError(1.5), location=["id", 1])
+    expected.add(ColumnLengthError(2, 3), location=["value"])
+    expected.add(ExpectedListError(True), location=["flag"])
+    expected.add(UnknownFieldError("extra"), location=["extra"])
+    assert actual == Failure(expected)
+
+
+def test_missing_column():
+    actual = ColumnarSerializer(Point).from_data({"x": [1.0]})
+    assert actual == Failure(Errors.one(RequiredFieldError("y"), location=["y"]))
+
+
+def test_from_data_failure_not_list():
+    actual = ColumnarSerializer(Point).from_data(1)
+    assert actual == Failure(Errors.one(ExpectedListError(1)))
+
+
+def test_to_data_records_matches_list_serializer():
+    value = ColumnarSerializer(Row).from_data(rows_data).unwrap()
+    assert ColumnarSerializer(Row).to_data(value) == [
+        {"id": 1, "value": 1.5, "flag": True, "name": "a", "point": {"x": 1.0, "y": 2.0}},
+        {"id": 2, "value": 2.0, "flag": False},
+    ]
+
+
+def test_to_data_columns_from_structured():
+    value = ColumnarSerializer(Point, layout="structured").from_data([{"x": 1, "y": 2}]).unwrap()
+    assert ColumnarSerializer(Point, orient="columns").to_data(value) == {"x": [1.0], "y": [2.0]}
+
+
+def test_to_data_failure():
+    with pytest.raises(TypeError):
+        _ = ColumnarSerializer(Point).to_data([1.0])
+
+
+def test_multi_field_not_supported():
+    with pytest.raises(TypeError):
+        _ = ColumnarSerializer(FieldsSerializer(x=MultiField({"x": int, "X": int})))
+
+
+def test_openapi_schema():
+    columns_schema = ColumnarSerializer(Point, orient="columns").to_openapi_schema(lambda _: {})
+    assert columns_schema == {
+        "type": "object",
+        "required": ["x", "y"],
+        "properties": {
+            "x": {"type": "array", "items": {"type": "number"}},
+            "y": {"type": "array", "items": {"type": "number"}},
+        },
+    }
+
+    records_schema = ColumnarSerializer(Point).to_openapi_schema(lambda _: {})
+    assert records_schema["type"] == "array"
+
+
+def test_column_dtype_error_to_string():
+    assert str(ColumnDtypeError("int8", 300)) == "Expected value that fits in int8, but got 300"
@@ -1,3 +1,5 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Literal, NewType, Optional, Tuple, Union  # noqa: UP035
 from uuid import UUID
@@ -7,12 +9,16 @@ import pytest
 from serialite import (
     Errors,
     Failure,
+    IntegerListSerializer,
+    IntegerSerializer,
+    PositiveIntegerSerializer,
     Serializable,
     StringSerializer,
     Success,
     ValidationError,
     serializer,
 )
+from serialite._dispatcher import integer_serializer, subclassdispatch
 
 
 @pytest.mark.parametrize(
@@ -177,6 +183,19 @@ def test_dispatch_explicit_registration_overrides_serializable_subclass():
     assert serializer(Widget) is override
 
 
+def test_list_of_primitive_uses_registered_override():
+    override = PositiveIntegerSerializer()
+    serializer.register(int, lambda cls: override)
+    try:
+        list_serializer = serializer(list[int])
+        assert list_serializer.element_serializer is override
+        assert isinstance(list_serializer.from_data([1, 0]), Failure)
+    finally:
+        serializer.register(int, integer_serializer)
+
+    assert isinstance(serializer(list[int]), IntegerListSerializer)
+
+
 def test_dispatch_generic_serializable_subclass_of_registered_type():
     class TypedList[T](list, Serializable):
         @classmethod
@@ -214,3 +233,105 @@ def test_dispatch_generic_serializable_subclass_without_registered_base():
     box_serializer = serializer(Box[int])
     assert box_serializer.from_data({"value": 7}).unwrap().value == 7
     assert box_serializer.to_data(Box(7)) == {"value": 7}
+
+
+def test_dispatch_from_many_threads():
+    types = [list[int], dict[str, float], tuple[int, str], set[str], int | None, Literal["a"]]
+    data = [[1], {"a": 1.5}, [1, "a"], ["a"], None, "a"]
+
+    def dispatch_all(_):
+        serializer._clear_cache()
+        return [serializer(t).from_data(d) for t, d in zip(types, data, strict=True)]
+
+    expected = dispatch_all(None)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(dispatch_all, range(200)))
+
+    assert all(result == expected for result in results)
+
+
+def test_cache_info():
+    serializer.cache_clear()
+
+    # Generic aliases are weakly cached, so hold on to this one
+    alias = set[int]
+    _ = serializer(alias)
+    _ = serializer(alias)
+    _ = serializer(int | None)
+    info = serializer.cache_info()
+
+    # The alias misses and then hits; int misses once and then hits twice,
+    # including inside the bypassed Optional
+    assert info.misses == 2
+    assert info.hits == 3
+    assert info.bypasses == 1
+    assert info.maxsize is None
+    assert info.currsize == 2
+
+    serializer.cache_clear()
+    assert serializer.cache_info() == (0, 0, 0, 0, None, 0)
+
+
+def test_cache_invalidation_is_counted():
+    class Shape(ABC):
+        @abstractmethod
+        def area(self): ...
+
+    class Square:
+        def area(self):
+            return 1
+
+    # An isolated dispatcher, so that registering an ABC does not make the
+    # global one track virtual subclasses for the rest of the tests
+    @subclassdispatch
+    def local_serializer(cls):
+        return StringSerializer()
+
+    local_serializer.register(Shape, lambda cls: StringSerializer())
+
+    _ = local_serializer(int)
+    Shape.register(Square)
+    _ = local_serializer(int)
+
+    info = local_serializer.cache_info()
+    assert info.invalidations == 1
+    assert info.misses == 2
+
+
+def test_cached_hit_sees_registration():
+    @subclassdispatch
+    def local_serializer(cls):
+        return StringSerializer()
+
+    assert isinstance(local_serializer(int), StringSerializer)
+    assert isinstance(local_serializer(int), StringSerializer)
+    assert local_serializer.cache_info().hits == 1
+
+    local_serializer.register(int, lambda cls: IntegerSerializer())
+    assert isinstance(local_serializer(int), IntegerSerializer)
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    serializer.cache_clear()
+    serializer.set_cache_maxsize(2)
+    try:
+        _ = serializer(int)
+        _ = serializer(str)
+        _ = serializer(int)
+        _ = serializer(float)
+        assert serializer.cache_info().currsize == 2
+
+        # str was the least recently used, so it was evicted
+        _ = serializer(int)
+        _ = serializer(str)
+        info = serializer.cache_info()
+        assert (info.hits, info.misses) == (2, 4)
+        assert info.maxsize == 2
+    finally:
+        serializer.set_cache_maxsize(None)
+        serializer.cache_clear()
+
+
+def test_invalid_cache_maxsize():
+    with pytest.raises(ValueError):
+        serializer.set_cache_maxsize(-1)
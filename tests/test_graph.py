@@ -0,0 +1,233 @@
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from serialite import (
+    CyclicReferenceError,
+    DuplicateIdError,
+    Errors,
+    Failure,
+    RequiredFieldError,
+    UnknownFieldError,
+    UnknownReferenceError,
+    abstract_serializable,
+    cache_from_data,
+    cache_to_data,
+    from_data_graph,
+    project,
+    serializable,
+    serializer,
+    to_data_graph,
+)
+
+
+@cache_from_data
+@cache_to_data
+@serializable
+@dataclass(frozen=True)
+class Parameters:
+    values: list[float]
+
+
+@abstract_serializable
+class Model:
+    pass
+
+
+@serializable
+@dataclass(frozen=True)
+class Fit(Model):
+    parameters: Parameters
+    initial: Parameters
+
+
+@serializable
+@dataclass(frozen=True)
+class Scenario:
+    models: list[Model]
+    baseline: Parameters
+
+
+@serializable
+@dataclass
+class Node(Model):
+    name: str
+    children: list[Model]
+
+
+parameters = Parameters([1.0, 2.0])
+other = Parameters([3.0])
+scenario = Scenario([Fit(parameters, other), Fit(parameters, parameters)], parameters)
+
+
+def test_round_trip():
+    data = to_data_graph(Scenario, scenario)
+    assert data == {
+        "models": [
+            {
+                "_type": "Fit",
+                "parameters": {"$id": 2, "values": [1.0, 2.0]},
+                "initial": {"values": [3.0]},
+            },
+            {"_type": "Fit", "parameters": {"$ref": 2}, "initial": {"$ref": 2}},
+        ],
+        "baseline": {"$ref": 2},
+    }
+
+    value = from_data_graph(Scenario, data).unwrap()
+    assert value == scenario
+    assert value.baseline is value.models[0].parameters
+    assert value.models[1].initial is value.models[1].parameters
+
+
+def test_shared_abstract_instances():
+    fit = Fit(parameters, other)
+    value_serializer = serializer(list[Model])
+
+    data = to_data_graph(value_serializer, [fit, fit])
+    assert data == [
+        {
+            "$id": 0,
+            "_type": "Fit",
+            "parameters": {"values": [1.0, 2.0]},
+            "initial": {"values": [3.0]},
+        },
+        {"$ref": 0},
+    ]
+
+    first, second = from_data_graph(value_serializer, data).unwrap()
+    assert first is second
+
+
+def test_definition_after_reference():
+    data = {
+        "baseline": {"$ref": 7},
+        "models": [
+            {"_type": "Fit", "parameters": {"$id": 7, "values": [1.0]}, "initial": {"$ref": 7}}
+        ],
+    }
+    value = from_data_graph(Scenario, data).unwrap()
+    assert value.baseline is value.models[0].parameters
+
+
+def test_equal_instances_are_not_shared():
+    data = to_data_graph(serializer(list[Parameters]), [Parameters([1.0]), Parameters([1.0])])
+    assert data == [{"values": [1.0]}, {"values": [1.0]}]
+
+
+def test_ordinary_data_is_unchanged():
+    assert to_data_graph(Parameters, parameters) == Parameters.to_data(parameters)
+    assert Scenario.to_data(scenario)["baseline"] == {"values": [1.0, 2.0]}
+
+
+def test_json_round_trip():
+    data = json.loads(json.dumps(to_data_graph(Scenario, scenario)))
+    assert from_data_graph(Scenario, data).unwrap() == scenario
+
+
+def test_projection():
+    with project(exclude="initial"):
+        data = to_data_graph(serializer(list[Model]), [Fit(parameters, parameters)])
+    assert data == [{"_type": "Fit", "parameters": {"values": [1.0, 2.0]}}]
+
+    with project(exclude="models.parameters"):
+        data = to_data_graph(Scenario, Scenario([Fit(parameters, other)], other))
+    assert data == {
+        "models": [{"_type": "Fit", "initial": {"$id": 2, "values": [3.0]}}],
+        "baseline": {"$ref": 2},
+    }
+
+
+def test_cycle():
+    node = Node("a", [])
+    node.children.append(node)
+    with pytest.raises(ValueError, match="Cycle"):
+        _ = to_data_graph(Node, node)
+
+
+def test_unknown_reference():
+    data = {"models": [], "baseline": {"$ref": 3}}
+    assert from_data_graph(Scenario, data) == Failure(
+        Errors.one(UnknownReferenceError(3), location=["baseline", "$ref"])
+    )
+
+
+def test_reference_with_extra_keys():
+    data = [{"$id": 0, "x": 1}, {"$ref": 0, "x": 5}]
+    assert from_data_graph(serializer(list[Point]), data) == Failure(
+        Errors.one(UnknownFieldError("x"), location=[1, "x"])
+    )
+
+
+def test_cyclic_reference():
+    data = {"$id": 0, "_type": "Fit", "parameters": {"values": []}, "initial": {"$ref": 0}}
+    assert from_data_graph(Model, data) == Failure(
+        Errors.one(CyclicReferenceError(0), location=["initial"])
+    )
+
+
+@serializable
+@dataclass(frozen=True)
+class Point:
+    x: int
+
+
+@serializable
+@dataclass(frozen=True)
+class Line:
+    y: int
+
+
+@serializable
+@dataclass(frozen=True)
+class Same:
+    x: int
+
+
+@serializable
+@dataclass(frozen=True)
+class Pair:
+    a: Point
+    b: Line
+
+
+@serializable
+@dataclass(frozen=True)
+class SamePair:
+    a: Point
+    b: Same
+
+
+def test_reference_as_different_class():
+    data = {"a": {"$id": 0, "x": 1}, "b": {"$ref": 0}}
+    assert from_data_graph(Pair, data) == Failure(
+        Errors(
+            [
+                *Errors.one(UnknownFieldError("x"), location=["b", "x"]).errors,
+                *Errors.one(RequiredFieldError("y"), location=["b", "y"]).errors,
+            ]
+        )
+    )
+
+    value = from_data_graph(SamePair, data).unwrap()
+    assert value == SamePair(Point(1), Same(1))
+    assert isinstance(value.b, Same)
+
+
+def test_duplicate_id():
+    data = [{"$id": 0, "x": 1}, {"$id": 0, "x": 2}]
+    assert from_data_graph(serializer(list[Point]), data) == Failure(
+        Errors.one(DuplicateIdError(0), location=[1, "$id"])
+    )
+
+
+def test_graph_errors_to_string():
+    assert (
+        str(UnknownReferenceError(3)) == "Expected reference to an object with an '$id', but got 3"
+    )
+    assert (
+        str(CyclicReferenceError(0))
+        == "Expected references without cycles, but got a cycle through 0"
+    )
+    assert str(DuplicateIdError(0)) == "Expected each '$id' to be defined once, but got 0 again"
@@ -0,0 +1,102 @@
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from serialite import (
+    Errors,
+    ExpectedFloatError,
+    Failure,
+    InternTable,
+    from_data_interned,
+    serializable,
+    serializer,
+)
+
+
+@serializable
+@dataclass(frozen=True)
+class Unit:
+    name: str
+    scale: float
+
+
+@serializable
+@dataclass(frozen=True)
+class Measurement:
+    status: str
+    unit: Unit
+    labels: dict[str, str]
+
+
+@serializable
+@dataclass
+class Mutable:
+    name: str
+
+
+def make_data(n: int):
+    # A JSON parser creates a separate string for each occurrence
+    element = {"status": "ok", "unit": {"name": "mm", "scale": 0.001}, "labels": {"source": "a"}}
+    return json.loads(json.dumps([element] * n))
+
+
+def test_equal_frozen_objects_are_shared():
+    values = from_data_interned(serializer(list[Measurement]), make_data(3)).unwrap()
+
+    assert values[0].unit is values[1].unit is values[2].unit
+
+    # Measurement has an unhashable dict field, so it cannot be shared
+    assert values[0] == values[1]
+    assert values[0] is not values[1]
+
+
+def test_equal_strings_are_shared():
+    data = make_data(2)
+    data[1]["unit"]["scale"] = 1.0
+    values = from_data_interned(serializer(list[Measurement]), data).unwrap()
+
+    assert values[0] is not values[1]
+    assert values[0].status is values[1].status
+    assert values[0].unit.name is values[1].unit.name
+    (key_0,) = values[0].labels
+    (key_1,) = values[1].labels
+    assert key_0 is key_1
+
+
+def test_table_is_shared_across_calls():
+    table = InternTable()
+    first = from_data_interned(Unit, {"name": "mm", "scale": 1}, table=table).unwrap()
+    second = from_data_interned(Unit, {"name": "mm", "scale": 1}, table=table).unwrap()
+
+    assert first is second
+    assert len(table.objects) == 1
+
+
+@serializable
+@dataclass(frozen=True)
+class Tag:
+    value: Any
+
+
+def test_equal_objects_of_different_types_are_not_shared():
+    data = [{"value": 0.0}, {"value": -0.0}, {"value": 1}, {"value": True}, {"value": 1.0}]
+    values = from_data_interned(serializer(list[Tag]), data).unwrap()
+    assert [repr(tag.value) for tag in values] == ["0.0", "-0.0", "1", "True", "1.0"]
+
+
+def test_mutable_objects_are_not_shared():
+    values = from_data_interned(serializer(list[Mutable]), [{"name": "a"}, {"name": "a"}])
+    first, second = values.unwrap()
+    assert first == second
+    assert first is not second
+
+
+def test_interning_is_scoped():
+    first = Unit.from_data({"name": "mm", "scale": 1}).unwrap()
+    second = Unit.from_data({"name": "mm", "scale": 1}).unwrap()
+    assert first is not second
+
+
+def test_failure():
+    actual = from_data_interned(Unit, {"name": "mm", "scale": "a"})
+    assert actual == Failure(Errors.one(ExpectedFloatError("a"), location=["scale"]))
@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+
+import pytest
+
+from serialite import (
+    Errors,
+    Failure,
+    FieldsSerializer,
+    MaximumDepthError,
+    MultiField,
+    OrderedDictSerializer,
+    ReservedSerializer,
+    Success,
+    TryUnionSerializer,
+    abstract_serializable,
+    iterative_from_data,
+    iterative_to_data,
+    project,
+    serializable,
+    serializer,
+)
+
+
+@abstract_serializable
+class Expression:
+    pass
+
+
+@serializable
+@dataclass(frozen=True)
+class Literal(Expression):
+    value: int
+
+
+@serializable
+@dataclass(frozen=True)
+class Add(Expression):
+    left: Expression
+    right: Expression
+
+
+def chain(n: int) -> Expression:
+    expression = Literal(0)
+    for i in range(n):
+        expression = Add(expression, Literal(i))
+    return expression
+
+
+@pytest.mark.parametrize(
+    ("value_type", "data"),
+    [
+        (list[int], [1, 2]),
+        (list[Literal], [{"value": 1}, {"value": "a"}, {"x": 1}]),
+        (set[Literal], [{"value": 1}, {"value": 1}]),
+        (tuple[int, Literal], [1, {"value": "a"}]),
+        (tuple[int, Literal], [1]),
+        (dict[str, Literal], {"a": {"value": 1}, "b": {"value": None}}),
+        (dict[str, list[int]], {"a": [1, "b"]}),
+        (Literal | None, None),
+        (Literal | None, {"value": 2.5}),
+        (Expression, {"_type": "Add", "left": {"_type": "Literal", "value": 1}}),
+        (Expression, {"_type": "Unknown"}),
+        (Expression, {"left": 1}),
+        (Expression, [1]),
+        (list[Expression], "not a list"),
+    ],
+)
+def test_from_data_matches_recursive(value_type, data):
+    value_serializer = serializer(value_type)
+    assert iterative_from_data(value_serializer, data) == value_serializer.from_data(data)
+
+
+@pytest.mark.parametrize(
+    ("value_serializer", "data"),
+    [
+        (OrderedDictSerializer(serializer(str), serializer(Literal)), [["a", {"value": 1}]]),
+        (OrderedDictSerializer(serializer(str), serializer(Literal)), [["a"], [1, {"v": 1}]]),
+        (TryUnionSerializer(serializer(Literal), serializer(int)), 1),
+        (TryUnionSerializer(serializer(Literal), serializer(int)), {"value": 1}),
+        (TryUnionSerializer(serializer(Literal), serializer(int)), "a"),
+        (ReservedSerializer(serializer(int), reserved={0}), 0),
+        (
+            FieldsSerializer(a=MultiField({"a": int, "b": Literal})),
+            {"a": 1, "b": {"value": 1}},
+        ),
+        (FieldsSerializer(a=MultiField({"a": int, "b": Literal})), {"b": {"value": 1}}),
+    ],
+)
+def test_from_data_matches_recursive_serializers(value_serializer, data):
+    assert iterative_from_data(value_serializer, data) == value_serializer.from_data(data)
+
+
+def test_deeper_than_recursion_limit():
+    expression = chain(5000)
+    data = iterative_to_data(Expression, expression)
+
+    with pytest.raises(RecursionError):
+        _ = Expression.to_data(expression)
+
+    value = iterative_from_data(Expression, data).unwrap()
+    assert iterative_to_data(Expression, value) == data
+
+
+def test_max_depth():
+    data = iterative_to_data(Expression, chain(4))
+    assert iterative_from_data(Expression, data, max_depth=5) == Expression.from_data(data)
+    assert iterative_from_data(Expression, data, max_depth=3) == Failure(
+        Errors(
+            [
+                *Errors.one(MaximumDepthError(3), location=["left", "left", "left"]).errors,
+                *Errors.one(MaximumDepthError(3), location=["left", "left", "right"]).errors,
+            ]
+        )
+    )
+
+
+def test_max_depth_lists():
+    value_serializer = serializer(list[list[list[int]]])
+    assert iterative_from_data(value_serializer, [[[1]], []], max_depth=2) == Failure(
+        Errors.one(MaximumDepthError(2), location=[0, 0])
+    )
+    assert iterative_from_data(value_serializer, [[[1]], []], max_depth=3) == Success([[[1]], []])
+
+
+def test_max_depth_to_data():
+    with pytest.raises(ValueError):
+        _ = iterative_to_data(Expression, chain(10), max_depth=5)
+
+
+@pytest.mark.parametrize(
+    ("value_type", "value"),
+    [
+        (list[Literal], [Literal(1), Literal(2)]),
+        (set[int], {1, 2}),
+        (tuple[int, Literal], (1, Literal(2))),
+        (dict[str, Expression], {"a": Add(Literal(1), Literal(2))}),
+        (Literal | None, None),
+        (Expression, chain(3)),
+    ],
+)
+def test_to_data_matches_recursive(value_type, value):
+    value_serializer = serializer(value_type)
+    assert iterative_to_data(value_serializer, value) == value_serializer.to_data(value)
+
+
+def test_to_data_union():
+    value_serializer = TryUnionSerializer(serializer(Literal), serializer(int))
+    assert iterative_to_data(value_serializer, 1) == 1
+    assert iterative_to_data(value_serializer, Literal(1)) == {"value": 1}
+    with pytest.raises(ValueError):
+        _ = iterative_to_data(value_serializer, "a")
+
+
+def test_to_data_failure():
+    with pytest.raises(AttributeError):
+        _ = iterative_to_data(serializer(list[Literal]), [Literal(1), 2])
+
+
+def test_projection():
+    data = {"_type": "Add", "left": {"_type": "Literal", "value": 1}, "right": "bad"}
+    with project(exclude="right"):
+        assert iterative_to_data(Expression, Add(Literal(1), Literal(2))) == {
+            "_type": "Add",
+            "left": {"_type": "Literal", "value": 1},
+        }
+        assert iterative_from_data(Add.__fields_serializer__, data) == (
+            Add.__fields_serializer__.from_data(data)
+        )
@@ -0,0 +1,160 @@
+from dataclasses import dataclass
+
+import pytest
+
+from serialite import (
+    ErrorElement,
+    Errors,
+    ExpectedFloatError,
+    ExpectedIntegerError,
+    Failure,
+    LazyDict,
+    LazyList,
+    LazyObject,
+    RequiredFieldError,
+    Success,
+    ValidationExceptionGroup,
+    abstract_serializable,
+    lazy_from_data,
+    serializable,
+    serializer,
+)
+
+
+@serializable
+@dataclass(frozen=True)
+class Item:
+    sku: str
+    price: float
+
+    @property
+    def label(self):
+        return f"{self.sku}: {self.price}"
+
+
+@abstract_serializable
+class Shipping:
+    pass
+
+
+@serializable
+@dataclass(frozen=True)
+class Express(Shipping):
+    days: int
+
+
+@serializable
+@dataclass(frozen=True)
+class Order:
+    id: int
+    items: list[Item]
+    tags: dict[str, Item]
+    shipping: Shipping | None = None
+
+
+order_data = {
+    "id": 1,
+    "items": [{"sku": "a", "price": 1.5}, {"sku": "b", "price": "bad"}],
+    "tags": {"x": {"sku": "c", "price": 3}},
+    "shipping": {"_type": "Express", "days": 2},
+}
+
+
+def test_lazy_object():
+    order = Order.lazy_from_data(order_data)
+    assert isinstance(order, LazyObject)
+    assert order.id == 1
+    assert order.shipping.days == 2
+    assert order.shipping.materialize() == Success(Express(2))
+
+
+def test_lazy_list_elements_on_access():
+    order = lazy_from_data(Order, order_data)
+    assert isinstance(order.items, LazyList)
+    assert len(order.items) == 2
+
+    item = order.items[0]
+    assert isinstance(item, LazyObject)
+    assert item.sku == "a"
+    assert item.price == 1.5
+    assert item.label == "a: 1.5"
+
+    # Cached
+    assert order.items is order.items
+    assert order.items[-2] is item
+
+
+def test_lazy_dict():
+    order = lazy_from_data(Order, order_data)
+    assert isinstance(order.tags, LazyDict)
+    assert list(order.tags) == ["x"]
+    assert order.tags["x"].price == 3.0
+
+    with pytest.raises(KeyError):
+        _ = order.tags["y"]
+
+
+def test_invalid_subtree_raises_on_access():
+    order = lazy_from_data(Order, order_data)
+
+    with pytest.raises(ValidationExceptionGroup) as exc_info:
+        _ = order.items[1].price
+    assert exc_info.value.errors == (
+        ErrorElement(ExpectedFloatError("bad"), location=("items", 1, "price")),
+    )
+
+    # Other parts are still accessible
+    assert order.items[1].sku == "b"
+
+
+def test_required_field_raises_on_access():
+    item = lazy_from_data(Item, {"sku": "a"})
+    assert item.sku == "a"
+
+    with pytest.raises(ValidationExceptionGroup) as exc_info:
+        _ = item.price
+    assert exc_info.value.errors == (
+        ErrorElement(RequiredFieldError("price"), location=("price",)),
+    )
+
+
+def test_materialize():
+    order = lazy_from_data(Order, order_data)
+    assert order.items.materialize() == Failure(
+        Errors.one(ExpectedFloatError("bad"), location=["items", 1, "price"])
+    )
+    assert order.materialize() == Order.from_data(order_data)
+
+    valid = lazy_from_data(Order, order_data | {"items": []})
+    assert valid.materialize() == Success(
+        Order(1, [], {"x": Item("c", 3.0)}, Express(2)),
+    )
+
+
+def test_leaves_are_eager():
+    assert lazy_from_data(serializer(int), 1) == 1
+    assert lazy_from_data(serializer(list[int]), [1, 2]) == [1, 2]
+    assert lazy_from_data(serializer(Item | None), None) is None
+
+    with pytest.raises(ValidationExceptionGroup) as exc_info:
+        _ = lazy_from_data(serializer(int), "a", location=["x"])
+    assert exc_info.value.errors == (ErrorElement(ExpectedIntegerError("a"), location=("x",)),)
+
+
+def test_unknown_attribute():
+    item = lazy_from_data(Item, {"sku": "a", "price": 1})
+    with pytest.raises(AttributeError):
+        _ = item.missing
+
+
+def test_slots_dataclass_with_copied_methods():
+    @serializable
+    @dataclass(frozen=True, slots=True)
+    class Point:
+        x: float
+        y: float
+
+    point = Point.lazy_from_data({"x": 1, "y": "a"})
+    assert point.x == 1.0
+    with pytest.raises(ValidationExceptionGroup):
+        _ = point.y
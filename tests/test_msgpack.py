@@ -0,0 +1,199 @@
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+
+from serialite import (
+    DateTimeSerializer,
+    Errors,
+    ExpectedStringError,
+    Failure,
+    InvalidDateTimeError,
+    MalformedBinaryError,
+    MsgpackSerializer,
+    Success,
+    UuidSerializer,
+    cache_to_data,
+    msgpack_dumps,
+    msgpack_loads,
+    native_types,
+    serializable,
+)
+
+
+@cache_to_data
+@serializable
+@dataclass(frozen=True)
+class Event:
+    id: UUID
+    at: datetime
+    day: date
+    payload: list[int]
+    name: str = ""
+
+
+event = Event(UUID(int=1), datetime(2024, 1, 2, 3, 4, 5, 6), date(2024, 1, 2), [1, -1], "x")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        None,
+        True,
+        False,
+        0,
+        127,
+        128,
+        -1,
+        -32,
+        -33,
+        -129,
+        2**16,
+        2**32,
+        2**64 - 1,
+        -(2**63),
+        1.5,
+        "",
+        "a" * 31,
+        "a" * 32,
+        "é" * 200,
+        "a" * 70000,
+        b"\x00\xff",
+        list(range(16)),
+        list(range(70000)),
+        {str(i): i for i in range(16)},
+        {1: [None, {"a": b""}]},
+        datetime(2024, 1, 2, 3, 4, 5, 6),
+        datetime(2024, 1, 2, tzinfo=timezone(timedelta(hours=-5, microseconds=1))),
+        date(2024, 1, 2),
+        UUID(int=2**128 - 1),
+    ],
+)
+def test_round_trip_data(data):
+    assert msgpack_loads(msgpack_dumps(data)) == data
+
+
+@pytest.mark.parametrize(
+    ("data", "encoded"),
+    [
+        (None, b"\xc0"),
+        (1, b"\x01"),
+        (-1, b"\xff"),
+        (255, b"\xcc\xff"),
+        (-128, b"\xd0\x80"),
+        (1.0, b"\xcb\x3f\xf0\x00\x00\x00\x00\x00\x00"),
+        ("a", b"\xa1a"),
+        ([1, 2], b"\x92\x01\x02"),
+        ({"a": 1}, b"\x81\xa1a\x01"),
+        (b"a", b"\xc4\x01a"),
+    ],
+)
+def test_msgpack_format(data, encoded):
+    assert msgpack_dumps(data) == encoded
+
+
+@pytest.mark.parametrize(
+    ("encoded", "expected"),
+    [
+        (b"\xd6\xff\x00\x00\x00\x01", datetime(1970, 1, 1, 0, 0, 1, tzinfo=UTC)),
+        (b"\xca\x3f\xc0\x00\x00", 1.5),
+        (b"\xd9\x01a", "a"),
+    ],
+)
+def test_read_other_formats(encoded, expected):
+    assert msgpack_loads(encoded) == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"\xc1", b"\x92\x01", b"\xa2\xff\xfe", b"\x81\x90\x01", b"\xd4\x05\x00", b"\x01\x01"],
+)
+def test_msgpack_loads_failure(data):
+    with pytest.raises(ValueError):
+        _ = msgpack_loads(data)
+
+
+def test_msgpack_loads_nesting_too_deep():
+    with pytest.raises(ValueError, match="nesting too deep at byte 101"):
+        _ = msgpack_loads(b"\x91" * 100_000 + b"\xc0")
+    with pytest.raises(ValueError, match="nesting too deep"):
+        _ = msgpack_loads(b"\x81\xc0" * 100_000 + b"\xc0")
+
+
+def test_msgpack_loads_max_depth():
+    assert msgpack_loads(b"\x91\x91\xc0", max_depth=2) == [[None]]
+    with pytest.raises(ValueError, match="nesting too deep at byte 2"):
+        _ = msgpack_loads(b"\x91\x91\xc0", max_depth=1)
+
+
+def test_msgpack_dumps_failure():
+    with pytest.raises(TypeError):
+        _ = msgpack_dumps(object())
+    with pytest.raises(ValueError):
+        _ = msgpack_dumps(2**64)
+
+
+def test_msgpack_serializer():
+    msgpack_serializer = MsgpackSerializer(Event)
+    encoded = msgpack_serializer.to_data(event)
+
+    assert msgpack_loads(encoded) == {
+        "id": UUID(int=1),
+        "at": datetime(2024, 1, 2, 3, 4, 5, 6),
+        "day": date(2024, 1, 2),
+        "payload": [1, -1],
+        "name": "x",
+    }
+    assert msgpack_serializer.from_data(encoded) == Success(event)
+
+
+def test_msgpack_serializer_accepts_strings():
+    encoded = msgpack_dumps(
+        {"id": str(UUID(int=1)), "at": "2024-01-02T03:04:05.000006", "day": "2024-01-02"}
+        | {"payload": [1, -1], "name": "x"}
+    )
+    assert MsgpackSerializer(Event).from_data(encoded) == Success(event)
+
+
+def test_msgpack_serializer_failure():
+    msgpack_serializer = MsgpackSerializer(Event)
+    assert msgpack_serializer.from_data(b"\x92\x01") == Failure(
+        Errors.one(MalformedBinaryError(2, "expected 1 more byte"))
+    )
+    assert msgpack_serializer.from_data(b"\xc0\xc0") == Failure(
+        Errors.one(MalformedBinaryError(1, "trailing bytes"))
+    )
+    assert msgpack_serializer.from_data("a") == Failure(
+        Errors.one(MalformedBinaryError(0, "expected bytes"))
+    )
+    assert msgpack_serializer.from_data(b"\x91" * 100_000 + b"\xc0") == Failure(
+        Errors.one(MalformedBinaryError(101, "nesting too deep"))
+    )
+
+
+def test_native_types():
+    value = datetime(2024, 1, 2)
+    with native_types(datetime, UUID):
+        assert DateTimeSerializer().to_data(value) is value
+        assert DateTimeSerializer().from_data(value) == Success(value)
+        assert DateTimeSerializer().from_data("x") == Failure(
+            Errors.one(InvalidDateTimeError("x"))
+        )
+        assert UuidSerializer().to_data(UUID(int=1)) == UUID(int=1)
+
+    assert DateTimeSerializer().to_data(value) == "2024-01-02 00:00:00"
+    assert DateTimeSerializer().from_data(value) == Failure(Errors.one(ExpectedStringError(value)))
+
+
+def test_native_types_bypass_to_data_cache():
+    Event.__to_data_cache__.cache_clear()
+    assert event.to_data()["at"] == "2024-01-02 03:04:05.000006"
+    with native_types(datetime):
+        assert event.to_data()["at"] == datetime(2024, 1, 2, 3, 4, 5, 6)
+    assert Event.__to_data_cache__.cache_info().hits == 0
+
+
+def test_native_types_failure():
+    with pytest.raises(TypeError), native_types(datetime, list):
+        pass
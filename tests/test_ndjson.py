@@ -0,0 +1,128 @@
+import gzip
+import io
+import lzma
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from math import inf, isnan, nan
+
+import pytest
+
+from serialite import (
+    Errors,
+    ExpectedIntegerError,
+    Failure,
+    InvalidJsonError,
+    Success,
+    read_ndjson,
+    serializable,
+    write_ndjson,
+)
+
+
+@serializable
+@dataclass(frozen=True)
+class Row:
+    id: int
+    name: str
+
+
+rows = [Row(i, f"é{i}") for i in range(25)]
+
+
+@pytest.mark.parametrize("suffix", [".ndjson", ".ndjson.gz", ".jsonl.xz", ".lzma"])
+def test_round_trip_path(tmp_path, suffix):
+    path = tmp_path / f"rows{suffix}"
+    assert write_ndjson(path, Row, iter(rows), chunk_size=10) == len(rows)
+    assert list(read_ndjson(path, Row, chunk_size=10)) == [Success(row) for row in rows]
+
+
+def test_compressed_files(tmp_path):
+    write_ndjson(tmp_path / "rows.ndjson.gz", Row, rows[:2])
+    write_ndjson(tmp_path / "rows.xz", Row, rows[:2])
+    expected = '{"id":0,"name":"é0"}\n{"id":1,"name":"é1"}\n'
+    assert gzip.decompress((tmp_path / "rows.ndjson.gz").read_bytes()).decode() == expected
+    assert lzma.decompress((tmp_path / "rows.xz").read_bytes()).decode() == expected
+
+
+@pytest.mark.parametrize(
+    ("compress", "compression"), [(gzip.compress, "gzip"), (lzma.compress, "lzma")]
+)
+def test_compressed_streams(compress, compression):
+    data = compress(b'{"id":1,"name":"a"}\n')
+    assert list(read_ndjson(io.BufferedReader(io.BytesIO(data)), Row)) == [Success(Row(1, "a"))]
+    assert list(read_ndjson(io.BytesIO(data), Row, compression=compression)) == [
+        Success(Row(1, "a"))
+    ]
+
+    stream = io.BytesIO()
+    write_ndjson(stream, Row, [Row(1, "a")], compression=compression)
+    assert stream.getvalue() != b'{"id":1,"name":"a"}\n'
+    assert list(read_ndjson(io.BytesIO(stream.getvalue()), Row, compression=compression)) == [
+        Success(Row(1, "a"))
+    ]
+
+
+def test_text_streams():
+    stream = io.StringIO()
+    write_ndjson(stream, Row, rows[:2])
+    assert stream.getvalue() == '{"id":0,"name":"é0"}\n{"id":1,"name":"é1"}\n'
+
+    stream.seek(0)
+    assert list(read_ndjson(stream, Row)) == [Success(rows[0]), Success(rows[1])]
+
+
+def test_text_stream_with_compression():
+    with pytest.raises(ValueError, match="binary"):
+        _ = list(read_ndjson(io.StringIO(""), Row, compression="gzip"))
+
+
+def test_failures_located_at_line_numbers():
+    data = b'{"id":1,"name":"a"}\n\n{"id":"x","name":"b"}\nnot json\n\xff\n{"id":3,"name":"c"}'
+    results = list(read_ndjson(io.BytesIO(data), Row, chunk_size=2))
+    assert results[0] == Success(Row(1, "a"))
+    assert results[1] == Failure(Errors.one(ExpectedIntegerError("x"), location=[3, "id"]))
+    assert results[2] == Failure(Errors.one(InvalidJsonError("Expecting value"), location=[4]))
+    assert isinstance(results[3].failure().errors[0].error, InvalidJsonError)
+    assert results[3].failure().errors[0].location == (5,)
+    assert results[4] == Success(Row(3, "c"))
+
+
+def test_executor(tmp_path):
+    path = tmp_path / "rows.ndjson"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        write_ndjson(path, Row, rows, executor=executor, chunk_size=4)
+        results = list(read_ndjson(path, Row, executor=executor, chunk_size=4))
+    assert results == [Success(row) for row in rows]
+
+
+def test_type_as_serializer():
+    stream = io.BytesIO()
+    write_ndjson(stream, list[int], [[1, 2], []])
+    assert stream.getvalue() == b"[1,2]\n[]\n"
+    assert list(read_ndjson(io.BytesIO(stream.getvalue()), list[int])) == [
+        Success([1, 2]),
+        Success([]),
+    ]
+
+
+def test_nan_and_infinities():
+    stream = io.BytesIO()
+    write_ndjson(stream, list[float], [[inf, -inf], [nan]])
+    assert stream.getvalue() == b"[Infinity,-Infinity]\n[NaN]\n"
+
+    first, second = read_ndjson(io.BytesIO(stream.getvalue()), list[float])
+    assert first == Success([inf, -inf])
+    assert isnan(second.unwrap()[0])
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        _ = list(read_ndjson(io.BytesIO(b""), Row, chunk_size=0))
+    with pytest.raises(ValueError):
+        _ = write_ndjson(io.BytesIO(), Row, rows, chunk_size=0)
+
+
+def test_invalid_json_error_to_data_and_to_string():
+    e = InvalidJsonError("Expecting value")
+    assert e.to_data() == {"message": "Expecting value"}
+    assert str(e) == "Expected valid JSON, but got error 'Expecting value'"
@@ -1,4 +1,7 @@
+import zlib
+from base64 import b64encode
 from dataclasses import dataclass
+from typing import Any
 
 import pytest
 
@@ -10,11 +13,16 @@ except ImportError:
     pytest.skip("NumPy not available", allow_module_level=True)
 
 from serialite import (
+    ArrayByteSizeError,
     ArraySerializer,
+    DecompressionError,
     Errors,
     ExpectedIntegerError,
     Failure,
     IntegerSerializer,
+    InvalidBase64Error,
+    InvalidDtypeError,
+    RequiredFieldError,
     Success,
     serializer,
 )
@@ -86,3 +94,130 @@ def test_dispatch_np_array():
 
     np.testing.assert_equal(array_serializer.from_data(data).unwrap(), value)
     assert array_serializer.to_data(value) == data
+
+
+def test_base64_round_trip_preserves_dtype_and_shape():
+    base64_serializer = ArraySerializer(dtype=np.int32, encoding="base64")
+    value = np.arange(6, dtype=np.int32).reshape(2, 3)
+
+    data = base64_serializer.to_data(value)
+    assert data == {"dtype": "<i4", "shape": [2, 3], "data": "AAAAAAEAAAACAAAAAwAAAAQAAAAFAAAA"}
+
+    actual = base64_serializer.from_data(data).unwrap()
+    assert actual.dtype == np.int32
+    np.testing.assert_equal(actual, value)
+
+
+def test_base64_big_endian_input_is_encoded_little_endian():
+    base64_serializer = ArraySerializer(dtype=float, encoding="base64")
+    value = np.array([1.5, -2.0], dtype=">f8")
+
+    data = base64_serializer.to_data(value)
+    assert data["dtype"] == "<f8"
+    np.testing.assert_equal(base64_serializer.from_data(data).unwrap(), value)
+
+
+@pytest.mark.parametrize(("compression", "delta"), [("zlib", False), (None, True), ("zlib", True)])
+def test_compression_and_delta_round_trip(compression, delta):
+    value = np.cumsum(np.arange(1000, dtype=np.int64) % 7)
+    encoded_serializer = ArraySerializer(
+        dtype=np.int64, encoding="base64", compression=compression, delta=delta
+    )
+
+    data = encoded_serializer.to_data(value)
+    assert data.get("compression") == compression
+    assert data.get("delta", False) == delta
+
+    np.testing.assert_equal(encoded_serializer.from_data(data).unwrap(), value)
+
+
+def test_delta_and_zlib_shrink_sorted_integers():
+    value = np.arange(10_000, dtype=np.int64) * 3
+    plain = ArraySerializer(dtype=np.int64, encoding="base64").to_data(value)
+    packed = ArraySerializer(
+        dtype=np.int64, encoding="base64", compression="zlib", delta=True
+    ).to_data(value)
+    assert len(packed["data"]) * 10 < len(plain["data"])
+
+
+def test_delta_requires_integer_dtype():
+    with pytest.raises(ValueError):
+        _ = ArraySerializer(dtype=float, delta=True)
+
+
+def test_list_and_base64_are_both_accepted():
+    list_serializer = ArraySerializer(dtype=int)
+    data = ArraySerializer(dtype=int, encoding="base64").to_data(np.array([1, 2, 3]))
+    np.testing.assert_equal(list_serializer.from_data(data).unwrap(), [1, 2, 3])
+
+
+@pytest.mark.parametrize(
+    ("data", "error", "location"),
+    [
+        ({"dtype": "xyz", "shape": [1], "data": "AAAAAA=="}, InvalidDtypeError("xyz"), "dtype"),
+        ({"dtype": "|O", "shape": [1], "data": "AAAAAA=="}, InvalidDtypeError("|O"), "dtype"),
+        ({"dtype": "<f8", "shape": [1], "data": "AAAAAA=="}, InvalidDtypeError("<f8"), "dtype"),
+        ({"dtype": "<i4", "shape": [1], "data": "A*=="}, InvalidBase64Error("A*=="), "data"),
+        (
+            {"dtype": "<i4", "shape": [2], "data": "AAAAAA=="},
+            ArrayByteSizeError([2], "<i4", 4),
+            "data",
+        ),
+        (
+            {"dtype": "<i4", "shape": [1], "data": "AAAAAA==", "compression": "zlib"},
+            DecompressionError("zlib"),
+            "data",
+        ),
+        ({"dtype": "<i4", "shape": [1]}, RequiredFieldError("data"), "data"),
+    ],
+)
+def test_base64_failures(data, error, location):
+    actual = ArraySerializer(dtype=np.int32).from_data(data)
+    assert actual == Failure(Errors.one(error, location=[location]))
+
+
+def test_to_data_failure_object_dtype():
+    with pytest.raises(ValueError):
+        _ = ArraySerializer(dtype=object, encoding="base64").to_data(np.array([None]))
+
+
+def test_base64_openapi_schema():
+    schema = ArraySerializer(dtype=float, encoding="base64").to_openapi_schema(lambda _: {})
+    assert schema["type"] == "object"
+    assert schema["required"] == ["dtype", "shape", "data"]
+
+
+@pytest.mark.parametrize(
+    ("annotation", "dtype", "data"),
+    [
+        (np.ndarray[tuple[int, int], np.dtype[np.int32]], np.int32, [1, 2]),
+        (np.ndarray[Any, np.dtype[np.bool_]], np.bool_, [True, False]),
+        (np.ndarray[Any, np.dtype[Any]], np.float64, [1.5, 2.5]),
+    ],
+)
+def test_dispatch_typed_annotation(annotation, dtype, data):
+    array_serializer = serializer(annotation)
+    actual = array_serializer.from_data(data).unwrap()
+    assert actual.dtype == dtype
+    assert array_serializer.to_data(actual) == data
+
+
+@pytest.mark.parametrize(
+    ("compressed", "error"),
+    [
+        # Far more bytes than the shape needs are not decompressed
+        (zlib.compress(bytes(100_000_000)), DecompressionError("zlib")),
+        (zlib.compress(bytes(5)), DecompressionError("zlib")),
+        (zlib.compress(bytes(8))[:-4], DecompressionError("zlib")),
+        (zlib.compress(bytes(3)), ArrayByteSizeError([1], "<i4", 3)),
+    ],
+)
+def test_zlib_output_is_bounded_by_shape(compressed, error):
+    data = {
+        "dtype": "<i4",
+        "shape": [1],
+        "data": b64encode(compressed).decode(),
+        "compression": "zlib",
+    }
+    actual = ArraySerializer(dtype=np.int32).from_data(data)
+    assert actual == Failure(Errors.one(error, location=["data"]))
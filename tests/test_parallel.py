@@ -0,0 +1,146 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from serialite import (
+    ErrorElement,
+    Errors,
+    ExpectedIntegerError,
+    ExpectedListError,
+    Failure,
+    IntegerOutOfRangeError,
+    IntegerSerializer,
+    InvalidJsonError,
+    ListSerializer,
+    RequiredTypeFieldError,
+    StringSerializer,
+    Success,
+    UnknownFieldError,
+    ValidationError,
+    ValidationExceptionGroup,
+    from_data_many,
+    parallel_from_data,
+    serializer,
+)
+
+list_serializer = ListSerializer(IntegerSerializer())
+
+
+def test_process_pool_matches_serial():
+    data = list(range(1000))
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        actual = parallel_from_data(list_serializer, data, executor=executor, chunk_size=128)
+    assert actual == Success(data)
+
+
+def test_default_process_pool():
+    data = list(range(100))
+    data[42] = "a"
+    actual = parallel_from_data(list_serializer, data, chunk_size=30)
+    assert actual == Failure(Errors.one(ExpectedIntegerError("a"), location=[42]))
+    assert parallel_from_data(list_serializer, list(range(100)), chunk_size=30) == Success(
+        list(range(100))
+    )
+
+
+def test_errors_are_rebased_to_global_indices():
+    data = list(range(100))
+    data[3] = "a"
+    data[57] = "b"
+    data[99] = "c"
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        actual = parallel_from_data(list_serializer, data, executor=executor, chunk_size=10)
+
+    assert actual == list_serializer.from_data(data)
+    expected = Errors()
+    expected.add(ExpectedIntegerError("a"), location=[3])
+    expected.add(ExpectedIntegerError("b"), location=[57])
+    expected.add(ExpectedIntegerError("c"), location=[99])
+    assert actual == Failure(expected)
+
+
+def test_nested_error_locations_are_rebased():
+    nested_serializer = serializer(list[dict[str, int]])
+    data = [{"a": i} for i in range(20)]
+    data[15] = {"a": "x"}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        actual = parallel_from_data(nested_serializer, data, executor=executor, chunk_size=4)
+
+    assert actual == Failure(Errors.one(ExpectedIntegerError("x"), location=[15, "a"]))
+
+
+@pytest.mark.parametrize("chunk_size", [2, 100])
+def test_ndjson(chunk_size):
+    data = '1\n2\n\n"a"\n{\n5\n'
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        actual = parallel_from_data(
+            list_serializer, data, executor=executor, chunk_size=chunk_size
+        )
+
+    expected = Errors()
+    expected.add(ExpectedIntegerError("a"), location=[2])
+    expected.add(
+        InvalidJsonError("Expecting property name enclosed in double quotes"), location=[3]
+    )
+    assert actual == Failure(expected)
+
+    assert parallel_from_data(list_serializer, b"1\n2\r\n3", chunk_size=chunk_size) == Success(
+        [1, 2, 3]
+    )
+
+
+def test_small_and_invalid_data_run_serially():
+    assert parallel_from_data(list_serializer, [1, 2, 3]) == Success([1, 2, 3])
+    assert parallel_from_data(list_serializer, 12) == Failure(Errors.one(ExpectedListError(12)))
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        _ = parallel_from_data(list_serializer, [1], chunk_size=0)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ExpectedIntegerError(actual="a"),
+        IntegerOutOfRangeError(actual=-1, minimum=0),
+        RequiredTypeFieldError(),
+        UnknownFieldError("x"),
+        ValidationError(message="An error"),
+        ValidationExceptionGroup([ErrorElement(ValidationError("An error"), location=(1,))]),
+    ],
+)
+def test_errors_are_picklable(error):
+    assert pickle.loads(pickle.dumps(error)) == error
+
+
+@pytest.mark.parametrize(
+    "this_serializer",
+    [
+        list_serializer,
+        StringSerializer(accept="[a-z]+"),
+        serializer(dict[str, list[float]]),
+        serializer(tuple[int, str] | None),
+    ],
+)
+def test_serializers_are_picklable(this_serializer):
+    restored = pickle.loads(pickle.dumps(this_serializer))
+    assert type(restored) is type(this_serializer)
+
+
+def test_from_data_many():
+    items = [[1, 2], [3, "a"], 4]
+    actual = from_data_many(list_serializer, items, max_workers=2)
+    assert actual == [
+        Success([1, 2]),
+        Failure(Errors.one(ExpectedIntegerError("a"), location=[1])),
+        Failure(Errors.one(ExpectedListError(4))),
+    ]
+
+
+def test_from_data_many_with_executor():
+    items = [[i, i + 1] for i in range(50)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        actual = from_data_many(list_serializer, items, executor=executor)
+    assert actual == [Success(item) for item in items]
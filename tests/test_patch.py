@@ -0,0 +1,250 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import pytest
+
+from serialite import (
+    Errors,
+    ExpectedIntegerError,
+    Failure,
+    FieldsSerializer,
+    InvalidPatchOperationError,
+    PatchPathError,
+    RequiredFieldError,
+    Serializer,
+    Success,
+    abstract_serializable,
+    apply_patch,
+    diff_to_data,
+    serializable,
+)
+
+
+@serializable
+@dataclass(frozen=True)
+class Item:
+    sku: str
+    quantity: int = 1
+
+
+@abstract_serializable
+class Shape:
+    pass
+
+
+@serializable
+@dataclass(frozen=True)
+class Circle(Shape):
+    radius: float
+
+
+@serializable
+@dataclass(frozen=True)
+class Square(Shape):
+    side: float
+
+
+@serializable
+@dataclass(frozen=True)
+class Document:
+    title: str
+    items: list[Item]
+    tags: dict[str, int]
+    shape: Shape
+    point: tuple[int, int]
+    updated: datetime | None = None
+    labels: set[str] = field(default_factory=set)
+
+
+document = Document("a", [Item("x"), Item("y", 2)], {"p": 1, "q": 2}, Circle(1.0), (1, 2))
+
+
+@pytest.mark.parametrize(
+    ("new", "patch"),
+    [
+        (document, []),
+        (
+            Document("b", document.items, document.tags, document.shape, document.point),
+            [{"op": "replace", "path": "/title", "value": "b"}],
+        ),
+        (
+            Document("a", [Item("x", 3), Item("y", 2), Item("z")], {}, Circle(1.0), (1, 2)),
+            [
+                {"op": "add", "path": "/items/0/quantity", "value": 3},
+                {"op": "add", "path": "/items/-", "value": {"sku": "z"}},
+                {"op": "remove", "path": "/tags/p"},
+                {"op": "remove", "path": "/tags/q"},
+            ],
+        ),
+        (
+            Document("a", [Item("x")], {"q": 3, "r/s": 4}, Square(2.0), (1, 5)),
+            [
+                {"op": "remove", "path": "/items/1"},
+                {"op": "remove", "path": "/tags/p"},
+                {"op": "replace", "path": "/tags/q", "value": 3},
+                {"op": "add", "path": "/tags/r~1s", "value": 4},
+                {"op": "replace", "path": "/shape", "value": {"_type": "Square", "side": 2.0}},
+                {"op": "replace", "path": "/point/1", "value": 5},
+            ],
+        ),
+        (
+            Document(
+                "a",
+                document.items,
+                document.tags,
+                Circle(2.0),
+                (1, 2),
+                datetime(2020, 1, 1),
+                {"l"},
+            ),
+            [
+                {"op": "replace", "path": "/shape/radius", "value": 2.0},
+                {"op": "add", "path": "/updated", "value": "2020-01-01 00:00:00"},
+                {"op": "add", "path": "/labels", "value": ["l"]},
+            ],
+        ),
+        (
+            Document("a", [Item("w"), *document.items], document.tags, Circle(1.0), (1, 2)),
+            [
+                {
+                    "op": "replace",
+                    "path": "/items",
+                    "value": [{"sku": "w"}, {"sku": "x"}, {"sku": "y", "quantity": 2}],
+                }
+            ],
+        ),
+    ],
+)
+def test_diff_and_apply(new, patch):
+    assert diff_to_data(Document, document, new) == patch
+    assert apply_patch(Document, document, patch) == Success(new)
+    assert apply_patch(Document, new, diff_to_data(Document, new, document)) == Success(document)
+
+
+def test_removed_default():
+    new = Document(
+        "a", document.items, document.tags, document.shape, document.point, datetime(2020, 1, 1)
+    )
+    assert diff_to_data(Document, new, document) == [{"op": "remove", "path": "/updated"}]
+    assert apply_patch(Document, new, [{"op": "remove", "path": "/updated"}]) == Success(document)
+
+
+@serializable
+@dataclass(frozen=True)
+class Series:
+    ys: list[int]
+
+
+def test_list_of_primitives_is_diffed_by_element():
+    old = Series([1, 2, 3])
+    new = Series([1, 5, 3])
+    patch = [{"op": "replace", "path": "/ys/1", "value": 5}]
+    assert diff_to_data(Series, old, new) == patch
+    assert apply_patch(Series, old, patch) == Success(new)
+    assert apply_patch(Series, old, [{"op": "add", "path": "/ys/-", "value": 4}]) == Success(
+        Series([1, 2, 3, 4])
+    )
+
+
+class CountingSerializer(Serializer[int]):
+    def __init__(self):
+        self.count = 0
+
+    def from_data(self, data):
+        self.count += 1
+        return Success(data)
+
+    def to_data(self, value):
+        self.count += 1
+        return value
+
+
+def test_only_touched_values_are_serialized():
+    counting = CountingSerializer()
+    fields_serializer = FieldsSerializer(unchanged=counting, changed=counting)
+    shared = list(range(10))
+    old = {"unchanged": shared, "changed": 1}
+    new = {"unchanged": shared, "changed": 2}
+
+    assert diff_to_data(fields_serializer, old, new) == [
+        {"op": "replace", "path": "/changed", "value": 2}
+    ]
+    assert counting.count == 2
+
+    assert apply_patch(
+        fields_serializer, old, [{"op": "replace", "path": "/changed", "value": 3}]
+    ) == Success({"unchanged": shared, "changed": 3})
+    assert counting.count == 3
+
+
+def test_apply_within_unknown_structure():
+    patch = [{"op": "add", "path": "/labels/-", "value": "m"}]
+    assert apply_patch(Document, document, patch).unwrap().labels == {"m"}
+
+
+def test_apply_changes_subclass_through_type():
+    patch = [{"op": "replace", "path": "/shape", "value": {"_type": "Square", "side": 1.0}}]
+    assert apply_patch(Document, document, patch).unwrap().shape == Square(1.0)
+
+
+def test_apply_does_not_modify_value():
+    patch = [
+        {"op": "remove", "path": "/items/0"},
+        {"op": "replace", "path": "/tags/p", "value": 5},
+    ]
+    new = apply_patch(Document, document, patch).unwrap()
+    assert new.items == [Item("y", 2)]
+    assert new.tags == {"p": 5, "q": 2}
+    assert document.items == [Item("x"), Item("y", 2)]
+    assert document.tags == {"p": 1, "q": 2}
+
+
+@pytest.mark.parametrize(
+    ("patch", "errors"),
+    [
+        (
+            [{"op": "move", "path": "/title", "from": "/tags"}],
+            Errors.one(InvalidPatchOperationError("move"), location=[0, "op"]),
+        ),
+        (
+            [
+                {"op": "replace", "path": "/title", "value": "b"},
+                {"op": "replace", "path": "/items/5", "value": {}},
+            ],
+            Errors.one(PatchPathError("/items/5"), location=[1, "path"]),
+        ),
+        (
+            [{"op": "replace", "path": "title", "value": "b"}],
+            Errors.one(PatchPathError("title"), location=[0, "path"]),
+        ),
+        (
+            [{"op": "replace", "path": "/missing", "value": "b"}],
+            Errors.one(PatchPathError("/missing"), location=[0, "path"]),
+        ),
+        (
+            [{"op": "replace", "path": "/title/0", "value": "b"}],
+            Errors.one(PatchPathError("/title/0"), location=[0, "path"]),
+        ),
+        (
+            [{"op": "replace", "path": "/items/0/quantity", "value": "b"}],
+            Errors.one(ExpectedIntegerError("b"), location=[0, "value"]),
+        ),
+        (
+            [{"op": "remove", "path": "/title"}],
+            Errors.one(RequiredFieldError("title"), location=[0, "path"]),
+        ),
+        (
+            [{"op": "add", "path": "/title"}],
+            Errors.one(RequiredFieldError("value"), location=[0]),
+        ),
+    ],
+)
+def test_apply_failure(patch, errors):
+    assert apply_patch(Document, document, patch) == Failure(errors)
+
+
+def test_patch_errors_to_string():
+    assert str(InvalidPatchOperationError("move")) == (
+        "Expected 'add', 'remove', or 'replace', but got 'move'"
+    )
+    assert str(PatchPathError("/a")) == "Expected path to an existing location, but got '/a'"
@@ -0,0 +1,133 @@
+import sys
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from serialite import FieldsSerializer, MultiField, profile, serializable
+from serialite._profile import path_segment
+
+
+@serializable
+@dataclass
+class Item:
+    sku: str
+    price: float
+
+
+@serializable
+@dataclass
+class Order:
+    id: int
+    items: list[Item]
+    tags: dict[str, int]
+
+
+data = {
+    "id": 1,
+    "items": [{"sku": "a", "price": 1.5}, {"sku": "b", "price": "x"}],
+    "tags": {"a": 1},
+}
+
+
+def test_from_data_nodes():
+    with profile() as result:
+        _ = Order.from_data(data)
+
+    nodes = {path: node for (direction, path), node in result.nodes.items()}
+    assert set(nodes) == {
+        "Order",
+        "Order.id",
+        "Order.items",
+        "Order.items[]",
+        "Order.items[].sku",
+        "Order.items[].price",
+        "Order.tags",
+        "Order.tags{}",
+    }
+
+    assert nodes["Order"].serializer == "Order"
+    assert nodes["Order.items"].serializer == "ListSerializer"
+    assert nodes["Order.items"].elements == 2
+    assert nodes["Order.items[]"].calls == 2
+    assert nodes["Order.items[].price"].calls == 2
+    assert nodes["Order.items[].price"].failures == 1
+    assert nodes["Order.items[].sku"].failures == 0
+    assert nodes["Order"].failures == 1
+
+    for node in nodes.values():
+        assert node.direction == "from_data"
+        assert 0 <= node.self_time <= node.total_time
+    assert nodes["Order"].total_time >= nodes["Order.items"].total_time
+
+
+def test_to_data_nodes():
+    with profile() as result:
+        _ = Order.to_data(Order(1, [Item("a", 1.5)], {}))
+
+    assert set(result.nodes) == {
+        ("to_data", "Order"),
+        ("to_data", "Order.id"),
+        ("to_data", "Order.items"),
+        ("to_data", "Order.items[]"),
+        ("to_data", "Order.items[].sku"),
+        ("to_data", "Order.items[].price"),
+        ("to_data", "Order.tags"),
+    }
+
+
+def test_field_paths():
+    fields_serializer = FieldsSerializer(
+        id=int, value=MultiField({"value": float, "text": str}, to_data="text")
+    )
+    with profile() as result:
+        _ = fields_serializer.from_data({"id": 1, "value": 2.5})
+        _ = fields_serializer.from_data({"id": 1, "text": "a"})
+        _ = fields_serializer.to_data({"id": 1, "value": "a"})
+
+    assert sorted(result.nodes) == [
+        ("from_data", "FieldsSerializer"),
+        ("from_data", "FieldsSerializer.id"),
+        ("from_data", "FieldsSerializer.text"),
+        ("from_data", "FieldsSerializer.value"),
+        ("to_data", "FieldsSerializer"),
+        ("to_data", "FieldsSerializer.id"),
+        ("to_data", "FieldsSerializer.text"),
+    ]
+
+
+def test_unknown_field_path():
+    frame = SimpleNamespace(
+        f_code=SimpleNamespace(co_qualname="FieldsSerializer.from_data"), f_locals={}
+    )
+    assert path_segment(frame) == ".?"
+
+
+def test_export():
+    with profile() as result:
+        _ = Order.from_data(data)
+
+    exported = result.to_data()
+    assert len(exported) == len(result.nodes)
+    assert set(exported[0]) == {
+        "path",
+        "direction",
+        "serializer",
+        "calls",
+        "failures",
+        "elements",
+        "total_time",
+        "self_time",
+    }
+    assert [row["self_time"] for row in exported] == sorted(
+        (row["self_time"] for row in exported), reverse=True
+    )
+
+    table = result.table().splitlines()
+    assert table[0].split()[:3] == ["path", "direction", "serializer"]
+    assert len(table) == len(result.nodes) + 1
+
+
+def test_profiler_is_removed():
+    previous = sys.getprofile()
+    with profile():
+        pass
+    assert sys.getprofile() is previous
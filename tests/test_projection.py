@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+
+import pytest
+
+from serialite import (
+    Errors,
+    ExpectedStringError,
+    Failure,
+    FieldsSerializer,
+    Projection,
+    RequiredFieldError,
+    Success,
+    UnprojectedFieldError,
+    abstract_serializable,
+    iterative_from_data,
+    project,
+    serializable,
+    serializer,
+)
+
+
+@serializable
+@dataclass(frozen=True)
+class Item:
+    sku: str
+    price: float
+    quantity: int = 1
+
+
+@abstract_serializable
+class Customer:
+    pass
+
+
+@serializable
+@dataclass(frozen=True)
+class Person(Customer):
+    name: str
+    email: str
+
+
+@serializable
+@dataclass(frozen=True)
+class Order:
+    id: int
+    name: str
+    items: list[Item]
+    customer: Customer
+    notes: str = ""
+
+
+order = Order(
+    id=1,
+    name="first",
+    items=[Item("a", 1.5, 2), Item("b", 2.5)],
+    customer=Person("x", "x@example.com"),
+    notes="fragile",
+)
+
+
+@pytest.mark.parametrize(
+    ("include", "exclude", "expected"),
+    [
+        ("id,name", None, {"id": 1, "name": "first"}),
+        (
+            ["id", "items.sku"],
+            None,
+            {"id": 1, "items": [{"sku": "a"}, {"sku": "b"}]},
+        ),
+        (
+            {"id": True, "items": {"__all__": {"sku"}}},
+            None,
+            {"id": 1, "items": [{"sku": "a"}, {"sku": "b"}]},
+        ),
+        (
+            "customer.name",
+            None,
+            {"customer": {"_type": "Person", "name": "x"}},
+        ),
+        (
+            None,
+            "items,customer.email,notes",
+            {"id": 1, "name": "first", "customer": {"_type": "Person", "name": "x"}},
+        ),
+        (
+            "id,items",
+            "items.price",
+            {"id": 1, "items": [{"sku": "a", "quantity": 2}, {"sku": "b"}]},
+        ),
+    ],
+)
+def test_to_data(include, exclude, expected):
+    with project(include, exclude):
+        assert Order.to_data(order) == expected
+
+
+def test_whole_field_takes_precedence_over_nested_fields():
+    expected = {"items": [item.to_data() for item in order.items]}
+    with project("items,items.sku"):
+        assert Order.to_data(order) == expected
+
+
+def test_projection_applies_to_container_elements():
+    with project("sku"):
+        assert serializer(list[Item]).to_data(order.items) == [{"sku": "a"}, {"sku": "b"}]
+
+
+def test_projection_is_scoped():
+    with project("id"):
+        pass
+    assert Order.to_data(order) == order.to_data()
+
+
+def test_model_dump():
+    assert order.model_dump(include={"id", "name"}) == {"id": 1, "name": "first"}
+    assert order.model_dump(exclude={"items": True, "customer": True}) == {
+        "id": 1,
+        "name": "first",
+        "notes": "fragile",
+    }
+    assert order.model_dump() == order.to_data()
+
+
+def test_from_data_skips_unprojected_fields():
+    fields_serializer = FieldsSerializer(id=int, name=str, notes=str)
+    data = {"id": 1, "name": 2, "notes": 3}
+
+    with project("id"):
+        assert fields_serializer.from_data(data) == Success({"id": 1})
+
+    with project(exclude="name"):
+        assert fields_serializer.from_data(data) == Failure(
+            Errors.one(ExpectedStringError(3), location=["notes"])
+        )
+
+
+def test_from_data_unprojected_fields_take_defaults():
+    data = {"sku": "a", "price": "bad", "quantity": "bad"}
+    with project("sku"):
+        assert Item.__fields_serializer__.from_data(data) == Success({"sku": "a", "quantity": 1})
+
+
+def test_from_data_projected_required_fields():
+    with project("sku,price"):
+        assert Item.from_data({"sku": "a"}) == Failure(
+            Errors.one(RequiredFieldError("price"), location=["price"])
+        )
+
+
+def test_from_data_unprojected_required_fields():
+    data = {"id": 1, "name": "a", "items": [], "customer": {"_type": "Person"}}
+    expected = Failure(
+        Errors(
+            [
+                *Errors.one(UnprojectedFieldError("name"), location=["name"]).errors,
+                *Errors.one(UnprojectedFieldError("items"), location=["items"]).errors,
+                *Errors.one(UnprojectedFieldError("customer"), location=["customer"]).errors,
+            ]
+        )
+    )
+    with project("id"):
+        assert Order.from_data(data) == expected
+        assert iterative_from_data(Order, data) == expected
+
+
+def test_unprojected_field_error_to_string():
+    assert (
+        str(UnprojectedFieldError("name"))
+        == "Expected field 'name' without a default to be projected, but it was not"
+    )
+
+
+def test_from_spec_is_cached():
+    assert Projection.from_spec("id,name") is Projection.from_spec(["name", "id"])
+
+
+def test_from_spec():
+    assert Projection.from_spec("id,items.sku", "items.price") == Projection(
+        include=frozenset({"id", "items"}),
+        children={
+            "items": Projection(include=frozenset({"sku"}), exclude=frozenset({"price"})),
+        },
+    )
+
+
+def test_from_spec_failure():
+    with pytest.raises(TypeError):
+        _ = Projection.from_spec({0: True})